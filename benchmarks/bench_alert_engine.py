@@ -0,0 +1,114 @@
+"""Throughput and latency benchmark for the alert engine.
+
+Feeds refresh results for thousands of tickers x presets through the
+AlertEngine, flipping a fraction of the signals every cycle, and reports
+how long detection blocks the refresh pipeline and the end-to-end
+latency seen by each sink (in-memory, log file, local webhook, slow).
+
+    python -m benchmarks.bench_alert_engine --tickers 5000 --presets 6 --cycles 20
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.synthetic import make_tickers
+from stockbuddy.core.alert_engine import AlertEngine
+from stockbuddy.core.alert_sinks import LogFileSink, WebhookSink
+
+SIGNALS = ["Buy", "Hold", "Sell"]
+
+
+class CountingSink:
+    def __init__(self):
+        self.count = 0
+
+    def send(self, alert):
+        self.count += 1
+
+
+class SlowSink:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def send(self, alert):
+        time.sleep(self.delay)
+
+
+class _WebhookReceiver(BaseHTTPRequestHandler):
+    received = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        type(self).received += 1
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=5000)
+    parser.add_argument("--presets", type=int, default=6)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--flip-rate", type=float, default=0.01, help="Fraction of signals that change per cycle")
+    parser.add_argument("--cycle-pause", type=float, default=0.2, help="Seconds between refresh cycles")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    tickers = make_tickers(args.tickers)
+    presets = [f"Preset {i}" for i in range(args.presets)]
+    signals = {preset: {ticker: "Hold" for ticker in tickers} for preset in presets}
+
+    receiver = ThreadingHTTPServer(("127.0.0.1", 0), _WebhookReceiver)
+    threading.Thread(target=receiver.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sinks = [
+            CountingSink(),
+            LogFileSink(os.path.join(tmp, "alerts.log")),
+            WebhookSink("http://%s:%d/alerts" % receiver.server_address[:2]),
+            SlowSink(0.05),
+        ]
+        engine = AlertEngine(sinks, queue_size=5000)
+        engine.start()
+
+        engine.process_signals(signals)  # Establish the baseline state
+        timings, alert_counts = [], []
+        for _ in range(args.cycles):
+            for preset in presets:
+                for ticker in rng.sample(tickers, int(len(tickers) * args.flip_rate)):
+                    current = signals[preset][ticker]
+                    signals[preset][ticker] = rng.choice([s for s in SIGNALS if s != current])
+            start = time.perf_counter()
+            alerts = engine.process_signals(signals)
+            timings.append(time.perf_counter() - start)
+            alert_counts.append(len(alerts))
+            time.sleep(args.cycle_pause)
+
+        engine.flush(timeout=10)
+        engine.stop(timeout=1)
+
+    receiver.shutdown()
+    receiver.server_close()
+
+    keys = args.tickers * args.presets
+    print(f"{args.tickers} tickers x {args.presets} presets = {keys:,} keys, "
+          f"~{statistics.mean(alert_counts):.0f} alerts per cycle")
+    print(f"detection (blocks the refresh): p50 {statistics.median(timings) * 1000:.2f} ms, "
+          f"max {max(timings) * 1000:.2f} ms ({keys / statistics.median(timings):,.0f} keys/s)")
+    for stats in engine.stats():
+        latency = (f"p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms"
+                   if "p50_ms" in stats else "no deliveries")
+        print(f"  {stats['sink']:>14}: delivered {stats['delivered']:>6}, dropped {stats['dropped']:>6}, "
+              f"failed {stats['failed']}, {latency}")
+
+
+if __name__ == "__main__":
+    main()
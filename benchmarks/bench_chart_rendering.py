@@ -0,0 +1,121 @@
+"""Render-time benchmark for the dashboard chart pipeline.
+
+Times matplotlib (Agg) rendering of price + SMA 50/200 charts for 20
+years of daily bars and for a year of 1-minute bars, comparing plotting
+every bar, the decimated first render, a cached re-render, a one-bar
+incremental update and a one-bar slide of a fixed-length window (a bar
+added at the end and one dropped off the front). Then times a dashboard
+grid of 50 mini-charts.
+
+    python -m benchmarks.bench_chart_rendering
+"""
+import argparse
+import statistics
+import time
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from benchmarks.synthetic import make_history, make_tickers
+from stockbuddy.gui.chart_renderer import ChartRenderer, _history_arrays, _sma_tail
+
+DATASETS = [
+    ("20y daily", 20 * 252, "B"),
+    ("1y 1-minute", 252 * 390, "min"),
+]
+
+
+def naive_render(history, renderer):
+    """Plots every bar of price and both SMAs on a fresh figure styled like the tiles."""
+    figure = Figure(figsize=(renderer.width / renderer.dpi, renderer.height / renderer.dpi), dpi=renderer.dpi)
+    canvas = FigureCanvasAgg(figure)
+    axes = figure.add_axes([0.02, 0.04, 0.96, 0.80])
+    axes.set_xticks([])
+    axes.set_yticks([])
+    x, close = _history_arrays(history)
+    axes.plot(x, close, linewidth=1.0)
+    for window in renderer.sma_windows:
+        axes.plot(x, _sma_tail(close, window, 0), linewidth=0.8)
+    canvas.draw()
+
+
+def timed(function, repeat=5):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, bars, freq in DATASETS:
+        history = make_history("AAPL", bars=bars, freq=freq)
+        renderer = ChartRenderer()
+
+        naive = timed(lambda: naive_render(history, renderer), args.repeat)
+
+        def first_render():
+            renderer.invalidate()
+            renderer.figure("AAPL", history.iloc[:-1])[0].canvas.draw()
+
+        first = timed(first_render, args.repeat)
+        cached = timed(lambda: renderer.figure("AAPL", history.iloc[:-1]), args.repeat)
+
+        def append_bar():
+            renderer.invalidate()
+            renderer.figure("AAPL", history.iloc[:-1])
+            start = time.perf_counter()
+            renderer.figure("AAPL", history)[0].canvas.draw()
+            return time.perf_counter() - start
+
+        incremental = statistics.median(append_bar() for _ in range(args.repeat)) * 1000
+
+        def slide_bar():
+            renderer.invalidate()
+            renderer.figure("AAPL", history.iloc[:-1])
+            start = time.perf_counter()
+            renderer.figure("AAPL", history.iloc[1:])[0].canvas.draw()
+            return time.perf_counter() - start
+
+        sliding = statistics.median(slide_bar() for _ in range(args.repeat)) * 1000
+        print(f"{label} ({bars:,} bars): every bar {naive:.1f} ms | decimated first render {first:.1f} ms | "
+              f"cached {cached:.3f} ms | new bar + redraw {incremental:.1f} ms | "
+              f"sliding window + redraw {sliding:.1f} ms")
+
+    tickers = make_tickers(args.charts)
+    histories = {ticker: make_history(ticker, bars=20 * 252) for ticker in tickers}
+    renderer = ChartRenderer(cache_size=args.charts)
+
+    start = time.perf_counter()
+    for ticker in tickers:
+        renderer.figure(ticker, histories[ticker].iloc[:-1])[0].canvas.draw()
+    initial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for ticker in tickers:
+        renderer.figure(ticker, histories[ticker])[0].canvas.draw()
+    update = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for ticker in tickers:
+        renderer.figure(ticker, histories[ticker])
+    unchanged = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for ticker in tickers:
+        renderer.figure(ticker, histories[ticker].iloc[1:])[0].canvas.draw()
+    sliding = time.perf_counter() - start
+
+    print(f"grid of {args.charts} x 20y daily: first render {initial * 1000:.0f} ms, "
+          f"new bar on every chart {update * 1000:.0f} ms, unchanged refresh {unchanged * 1000:.1f} ms, "
+          f"oldest bar dropped on every chart {sliding * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
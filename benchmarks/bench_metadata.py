@@ -0,0 +1,88 @@
+"""Latency of symbol autocomplete, validation and sector allocation against a slow provider.
+
+Loads a synthetic symbol directory the size of the US-listed universe and
+times prefix completion and validation, then times sector allocation for
+a watchlist while metadata is still being fetched in the background from
+a provider that takes `--latency` seconds per Ticker.info call.
+
+    python -m benchmarks.bench_metadata --symbols 12000 --watchlist 200 --latency 0.5
+"""
+import argparse
+import random
+import statistics
+import time
+
+from benchmarks.synthetic import make_tickers
+from stockbuddy.data.metadata_cache import MetadataCache
+from stockbuddy.data.symbol_index import SymbolIndex
+
+SECTORS = ["Technology", "Healthcare", "Financial Services", "Energy", "Industrials", "Utilities"]
+
+
+class SlowDataManager:
+    """Serves a synthetic directory and Ticker.info responses with a fixed delay."""
+
+    def __init__(self, symbols, latency):
+        self.symbols = symbols
+        self.latency = latency
+        self.calls = 0
+
+    def get_symbol_directory(self):
+        return [(symbol, f"{symbol.title()} Holdings Inc.", "NYSE") for symbol in self.symbols]
+
+    def get_ticker_info(self, ticker):
+        self.calls += 1
+        time.sleep(self.latency)
+        return {"longName": f"{ticker} Inc.", "sector": SECTORS[hash(ticker) % len(SECTORS)], "quoteType": "EQUITY"}
+
+
+def timed(function, samples):
+    times = []
+    for sample in samples:
+        start = time.perf_counter()
+        function(sample)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000, max(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=12000)
+    parser.add_argument("--watchlist", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    symbols = make_tickers(args.symbols)
+    provider = SlowDataManager(symbols, args.latency)
+    index = SymbolIndex(provider, filename=None)
+    start = time.perf_counter()
+    index.refresh()
+    print(f"{len(index):,} symbols indexed in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    prefixes = [symbol[:rng.randint(1, 4)] for symbol in rng.sample(symbols, 500)]
+    median, worst = timed(lambda prefix: index.complete(prefix, limit=10), prefixes)
+    print(f"  autocomplete (10 suggestions)   median {median:.3f} ms   max {worst:.3f} ms")
+    candidates = rng.sample(symbols, 250) + [f"ZZ{i}" for i in range(250)]
+    median, worst = timed(index.validate, candidates)
+    print(f"  validation                      median {median:.4f} ms   max {worst:.4f} ms")
+
+    cache = MetadataCache(provider, filename=None, max_workers=args.workers, symbol_index=index)
+    watchlist = rng.sample(symbols, args.watchlist)
+    start = time.perf_counter()
+    allocation = cache.sector_allocation(watchlist)
+    print(f"\n  sector allocation, cold cache   {(time.perf_counter() - start) * 1000:.2f} ms  -> {allocation}")
+    start = time.perf_counter()
+    cache.wait()
+    print(f"  background prefetch             {time.perf_counter() - start:.1f} s for {provider.calls} lookups "
+          f"({args.workers} workers, {args.latency}s each)")
+    start = time.perf_counter()
+    allocation = cache.sector_allocation(watchlist)
+    print(f"  sector allocation, warm cache   {(time.perf_counter() - start) * 1000:.2f} ms  "
+          f"-> {len(allocation)} sectors")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
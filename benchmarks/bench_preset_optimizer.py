@@ -0,0 +1,77 @@
+"""Benchmark for the preset parameter sweep optimizer.
+
+Sweeps a 1,000-combination grid (SMA period x RSI period x RSI threshold)
+for the "Conservative Growth" preset over synthetic 10-year daily
+histories, and compares it with recomputing every indicator per
+combination through RecommendationEngine on a sample.
+
+    python -m benchmarks.bench_preset_optimizer --tickers 200 --years 10
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import make_history, make_tickers
+from stockbuddy.core.preset_manager import PresetManager
+from stockbuddy.core.preset_optimizer import PresetOptimizer, backtest, expand_grid
+from stockbuddy.core.recommendation_engine import RecommendationEngine
+
+GRID = {
+    "0.period": [50, 75, 100, 125, 150, 175, 200, 225, 250, 275],
+    "1.period": [6, 8, 10, 12, 14, 16, 18, 20, 22, 24],
+    "1.value": [20, 22, 24, 26, 28, 30, 32, 34, 36, 38],
+}
+
+
+def naive_signals(engine, close, rules):
+    """Recomputes each rule's indicator from scratch, as a per-combination loop would."""
+    buy = np.zeros(len(close), dtype=bool)
+    for rule in rules:
+        if rule["indicator"] == "SMA":
+            sma = engine._calculate_sma(close, rule["period"]).to_numpy()
+            buy |= sma > close.to_numpy()
+        elif rule["indicator"] == "RSI":
+            rsi = engine._calculate_rsi(close, rule["period"]).to_numpy()
+            buy |= rsi < rule["value"]
+    return np.where(buy, 1, 0).astype(np.int8)[None, :]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument("--naive-sample", type=int, default=50, help="Combinations timed for the naive baseline")
+    args = parser.parse_args()
+
+    rules = PresetManager.get_default_presets()["Conservative Growth"]["rules"]
+    histories = {ticker: make_history(ticker, bars=252 * args.years) for ticker in make_tickers(args.tickers)}
+    combinations = expand_grid(rules, GRID)
+    print(f"{len(combinations)} combinations x {args.tickers} tickers x {252 * args.years} bars")
+
+    for workers in sorted({1, args.workers or PresetOptimizer().max_workers}):
+        optimizer = PresetOptimizer(max_workers=workers)
+        start = time.perf_counter()
+        results = optimizer.sweep(rules, GRID, histories)
+        elapsed = time.perf_counter() - start
+        print(f"optimizer, {workers} worker(s): {elapsed:.2f}s "
+              f"({len(combinations) * args.tickers / elapsed:,.0f} combination-tickers/s)")
+    best = results[0]
+    print(f"best: {best['params']} total_return {best['total_return']:.2%} sharpe {best['sharpe']:.2f}")
+
+    engine = RecommendationEngine()
+    sample = combinations[:args.naive_sample]
+    ticker_sample = list(histories.values())[:10]
+    start = time.perf_counter()
+    for history in ticker_sample:
+        close = history["Close"]
+        for _, combination_rules in sample:
+            backtest(naive_signals(engine, close, combination_rules), close.to_numpy())
+    per_pair = (time.perf_counter() - start) / (len(sample) * len(ticker_sample))
+    print(f"naive per-combination recompute: {per_pair * 1000:.2f} ms per combination-ticker, "
+          f"~{per_pair * len(combinations) * args.tickers:.1f}s extrapolated to the full sweep (1 process)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Per-bar update benchmark for the rolling risk engine.
+
+Seeds a rolling window of returns for a large universe, then times
+feeding one new bar with rank-two updates against recomputing the full
+covariance matrix from the window, and the reads made after each bar.
+
+    python -m benchmarks.bench_risk_engine --tickers 1000 --window 60 252
+"""
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from stockbuddy.core.risk_engine import RollingCovariance
+
+
+def timed(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, nargs="+", default=[1000])
+    parser.add_argument("--window", type=int, nargs="+", default=[60, 252])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(11)
+    for count in args.tickers:
+        for window in args.window:
+            history = rng.normal(0, 0.02, (window + args.repeat * 2, count))
+            rolling = RollingCovariance(count, window)
+            for bar in history[:window]:
+                rolling.update(bar)
+
+            bars = iter(history[window:])
+            incremental = timed(lambda: rolling.update(next(bars)), args.repeat)
+
+            buffer = history[:window].copy()
+            def recompute():
+                np.cov(np.roll(buffer, -1, axis=0), rowvar=False)
+            full = timed(recompute, args.repeat)
+
+            covariance = timed(rolling.covariance, args.repeat)
+            correlation = timed(rolling.correlation, args.repeat)
+            weights = rng.uniform(0, 1, count)
+            weights /= weights.sum()
+            volatility = timed(lambda: rolling.quadratic_form(weights), args.repeat)
+            beta = timed(lambda: rolling.covariance_column(0), args.repeat)
+
+            print(f"\n{count:,} tickers, {window}-bar window")
+            print(f"  new bar, rank-two update      {incremental:8.2f} ms")
+            print(f"  new bar, full recompute       {full:8.2f} ms   ({full / incremental:.1f}x)")
+            print(f"  covariance matrix read        {covariance:8.2f} ms")
+            print(f"  correlation matrix read       {correlation:8.2f} ms")
+            print(f"  betas against one index       {beta:8.3f} ms")
+            print(f"  portfolio volatility          {volatility:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Query-latency benchmark for the universe screener.
+
+Loads synthetic metrics for a large universe, then times filter + top-k
+queries, single-ticker incremental updates, and the same queries done
+with a pandas DataFrame scan for comparison.
+
+    python -m benchmarks.bench_screener --tickers 10000 20000 50000
+"""
+import argparse
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_tickers
+from stockbuddy.core.screener import OPERATORS, Screener
+
+QUERIES = [
+    ("top 50 by % change", [], "percent_change", True),
+    ("top 50 by % change, RSI < 30", [("rsi", "<", 30)], "percent_change", True),
+    ("top 50 by volume, price 20-100, RSI > 70",
+     [("price", ">=", 20), ("price", "<=", 100), ("rsi", ">", 70)], "volume", True),
+    ("bottom 50 by % change, volume > 1M", [("volume", ">", 1_000_000)], "percent_change", False),
+]
+
+
+def make_metrics(tickers, rng):
+    count = len(tickers)
+    price = rng.lognormal(4, 1, count)
+    percent_change = rng.normal(0, 2.5, count)
+    return pd.DataFrame({
+        "price": price,
+        "change": price * percent_change / 100,
+        "percent_change": percent_change,
+        "volume": rng.lognormal(13, 1.5, count),
+        "rsi": rng.uniform(0, 100, count),
+        "sma_50": price * rng.normal(1, 0.05, count),
+        "sma_200": price * rng.normal(1, 0.1, count),
+    }, index=tickers)
+
+
+def timed(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def pandas_query(frame, filters, sort_by, descending):
+    mask = np.ones(len(frame), dtype=bool)
+    for field, op, value in filters:
+        mask &= OPERATORS[op](frame[field].to_numpy(), value)
+    matched = frame[mask]
+    return matched.nlargest(50, sort_by) if descending else matched.nsmallest(50, sort_by)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    for count in args.tickers:
+        tickers = make_tickers(count)
+        frame = make_metrics(tickers, rng)
+        records = frame.to_dict("index")
+
+        screener = Screener()
+        start = time.perf_counter()
+        screener.update_many(records)
+        print(f"\n{count:,} tickers: bulk load {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        for label, filters, sort_by, descending in QUERIES:
+            indexed = timed(lambda: screener.query(filters, sort_by, descending, 50), args.repeat)
+            scanned = timed(lambda: pandas_query(frame, filters, sort_by, descending), args.repeat // 4)
+            print(f"  {label:<45} screener {indexed:6.3f} ms   pandas scan {scanned:6.3f} ms")
+
+        samples = []
+        for _ in range(args.repeat):
+            ticker = tickers[rng.integers(0, count)]
+            values = {"price": float(rng.lognormal(4, 1)), "percent_change": float(rng.normal(0, 2.5)),
+                      "rsi": float(rng.uniform(0, 100))}
+            start = time.perf_counter()
+            screener.update(ticker, values)
+            samples.append(time.perf_counter() - start)
+        print(f"  single-ticker update (3 indexed fields)        {statistics.median(samples) * 1000:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Load test for the headless signal service.
+
+Starts the HTTP API on an ephemeral port with a fake provider and hammers
+it from several keep-alive client threads, reporting throughput and
+latency for plain and conditional (If-None-Match) requests.
+
+    python -m benchmarks.bench_signal_service --tickers 200 --clients 8 --seconds 5
+"""
+import argparse
+import http.client
+import statistics
+import threading
+import time
+
+from benchmarks.synthetic import FakeDataManager, make_tickers
+from stockbuddy.core.preset_manager import PresetManager
+from stockbuddy.service.http_api import make_server
+from stockbuddy.service.signal_service import SignalService
+
+PATHS = ["/quotes", "/signals", "/signals/Sell%20High", "/history/T00000?limit=30", "/health"]
+
+
+def _client(host, port, seconds, conditional, latencies, counts, index):
+    connection = http.client.HTTPConnection(host, port)
+    etags = {}
+    deadline = time.perf_counter() + seconds
+    done = 0
+    i = index
+    while time.perf_counter() < deadline:
+        path = PATHS[i % len(PATHS)]
+        i += 1
+        headers = {"If-None-Match": etags[path]} if conditional and path in etags else {}
+        start = time.perf_counter()
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        if response.status == 200:
+            etags[path] = response.getheader("ETag")
+        done += 1
+    counts[index] = done
+    connection.close()
+
+
+def run(host, port, clients, seconds, conditional):
+    latencies = []
+    counts = [0] * clients
+    threads = [
+        threading.Thread(target=_client, args=(host, port, seconds, conditional, latencies, counts, i))
+        for i in range(clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    total = sum(counts)
+    label = "conditional" if conditional else "plain"
+    print(f"{label:>11}: {total} requests in {elapsed:.2f}s = {total / elapsed:,.0f} req/s, "
+          f"p50 {statistics.median(latencies) * 1000:.2f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    provider = FakeDataManager()
+    service = SignalService(provider, PresetManager(), make_tickers(args.tickers))
+    start = time.perf_counter()
+    service.refresh()
+    print(f"refresh: {args.tickers} tickers x {len(service.snapshot.signals)} presets "
+          f"in {time.perf_counter() - start:.2f}s, {provider.calls} provider calls")
+
+    server = make_server(service, port=0)
+    host, port = server.server_address[:2]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        run(host, port, args.clients, args.seconds, conditional=False)
+        run(host, port, args.clients, args.seconds, conditional=True)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Provider calls for overlapping watchlists, per-list refresh vs shared subscriptions.
+
+Builds several named watchlists drawn from a common universe so they
+overlap heavily, then runs one refresh cycle the way a per-list widget
+does it (every list fetches and evaluates its own tickers) and through the
+reference-counted subscription set feeding one SignalService. Finally
+closes half the lists and runs another shared cycle.
+
+    python -m benchmarks.bench_watchlists --lists 10 --size 50 --universe 150
+"""
+import argparse
+import random
+import time
+
+from benchmarks.synthetic import FakeDataManager, make_tickers
+from stockbuddy.core.preset_manager import PresetManager
+from stockbuddy.core.recommendation_engine import RecommendationEngine
+from stockbuddy.data.subscriptions import SubscriptionManager
+from stockbuddy.service.signal_service import SignalService
+
+PRESET = "Conservative Growth"
+
+
+class DefaultPresets:
+    """Serves the built-in presets without reading the user's presets file."""
+
+    def __init__(self):
+        self.presets = PresetManager.get_default_presets()
+
+    def get_all_presets(self):
+        return self.presets
+
+
+def per_list_cycle(provider, lists, rules):
+    """One refresh as separate per-list widgets would do it."""
+    engine = RecommendationEngine()
+    evaluations = 0
+    for tickers in lists.values():
+        for ticker in tickers:
+            engine.generate_signals(provider.get_historical_data(ticker), rules)
+            evaluations += 1
+    return evaluations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lists", type=int, default=10)
+    parser.add_argument("--size", type=int, default=50)
+    parser.add_argument("--universe", type=int, default=150)
+    parser.add_argument("--latency", type=float, default=0.002, help="simulated seconds per provider call")
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    universe = make_tickers(args.universe)
+    lists = {f"List {i}": rng.sample(universe, args.size) for i in range(args.lists)}
+    entries = sum(len(tickers) for tickers in lists.values())
+    presets = DefaultPresets()
+    rules = presets.get_all_presets()[PRESET]["rules"]
+    print(f"{args.lists} lists x {args.size} tickers from a {args.universe}-ticker universe "
+          f"({entries} entries, {len(set().union(*lists.values()))} distinct)")
+
+    provider = FakeDataManager(latency=args.latency)
+    start = time.perf_counter()
+    evaluations = per_list_cycle(provider, lists, rules)
+    print(f"  per-list refresh     {provider.calls:5d} provider calls  {evaluations:5d} evaluations  "
+          f"{time.perf_counter() - start:6.2f} s")
+
+    provider = FakeDataManager(latency=args.latency)
+    subscriptions = SubscriptionManager()
+    service = SignalService(provider, presets, subscriptions=subscriptions, presets=[PRESET])
+    for name, tickers in lists.items():
+        subscriptions.subscribe(name, tickers)
+    start = time.perf_counter()
+    snapshot = service.refresh()
+    print(f"  shared subscriptions {provider.calls:5d} provider calls  {len(snapshot.signals[PRESET]):5d} evaluations  "
+          f"{time.perf_counter() - start:6.2f} s")
+
+    for name in list(lists)[:args.lists // 2]:
+        subscriptions.release(name)
+    provider.calls = 0
+    snapshot = service.refresh()
+    label = f"after closing {args.lists // 2} lists"
+    print(f"  {label:<20} {provider.calls:5d} provider calls  "
+          f"{len(snapshot.signals[PRESET]):5d} evaluations  ({len(subscriptions.tickers())} subscribed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Synthetic market data shared by the benchmark scripts."""
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+
+def make_history(ticker, bars=252, seed=None, end="2025-09-16", freq="B"):
+    """Returns a random-walk OHLCV DataFrame shaped like yfinance history."""
+    if seed is None:
+        seed = zlib.crc32(ticker.encode("utf-8"))
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0003, 0.02, bars)
+    close = 100 * np.exp(np.cumsum(returns))
+    spread = np.abs(rng.normal(0, 0.01, bars)) * close
+    index = pd.date_range(end=end, periods=bars, freq=freq)
+    return pd.DataFrame({
+        "Open": close * (1 + rng.normal(0, 0.003, bars)),
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+        "Volume": rng.integers(100_000, 10_000_000, bars),
+        "Dividends": np.zeros(bars),
+        "Stock Splits": np.zeros(bars),
+    }, index=index)
+
+
+def make_tickers(count):
+    """Returns a list of distinct fake ticker symbols."""
+    return [f"T{i:05d}" for i in range(count)]
+
+
+class FakeDataManager:
+    """DataManager stand-in that serves synthetic history and counts provider calls."""
+
+    def __init__(self, bars=252, latency=0.0):
+        self.bars = bars
+        self.latency = latency
+        self.calls = 0
+        self._histories = {}
+        self._lock = threading.Lock()
+
+    def get_historical_data(self, ticker, period="1y"):
+        with self._lock:
+            self.calls += 1
+            if ticker not in self._histories:
+                self._histories[ticker] = make_history(ticker, self.bars)
+            data = self._histories[ticker]
+        if self.latency:
+            time.sleep(self.latency)
+        return data
@@ -0,0 +1,308 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Signals that mean "no opinion" rather than a recommendation
+IGNORED_SIGNALS = {"N/A", None}
+
+
+class Alert:
+    """A confirmed signal transition for one ticker under one preset."""
+
+    __slots__ = ("ticker", "preset", "previous", "signal", "timestamp", "detected_at")
+
+    def __init__(self, ticker, preset, previous, signal, detected_at=None):
+        self.ticker = ticker
+        self.preset = preset
+        self.previous = previous
+        self.signal = signal
+        self.timestamp = time.time()
+        self.detected_at = detected_at if detected_at is not None else time.monotonic()
+
+    def message(self):
+        """Returns a one-line human readable description."""
+        return f"{self.ticker}: {self.previous} → {self.signal} ({self.preset})"
+
+    def to_dict(self):
+        return {
+            "ticker": self.ticker,
+            "preset": self.preset,
+            "previous": self.previous,
+            "signal": self.signal,
+            "timestamp": self.timestamp,
+        }
+
+
+class AlertEngine:
+    """Detects signal transitions and dispatches them to pluggable sinks.
+
+    Each refresh result is compared against the last confirmed signal per
+    (ticker, preset). A new signal must be seen for `debounce_cycles`
+    consecutive refreshes before it is confirmed, and at most one alert per
+    key is sent every `cooldown` seconds. Detection runs on the caller's
+    thread and only hands alerts to a background asyncio loop, where every
+    sink has its own bounded queue; when a sink falls behind its oldest
+    alerts are dropped instead of blocking the refresh pipeline.
+
+    A sink is any object with a `send(alert)` method, which may be a plain
+    function (run in a worker thread) or a coroutine function.
+    """
+
+    # Maximum number of queued alerts handed to a blocking sink per executor call
+    BATCH_SIZE = 100
+
+    def __init__(self, sinks=None, debounce_cycles=1, cooldown=0.0, queue_size=1000,
+                 alert_on_first=False, latency_samples=10000):
+        self.debounce_cycles = max(1, debounce_cycles)
+        self.cooldown = cooldown
+        self.queue_size = queue_size
+        self.alert_on_first = alert_on_first
+
+        self._confirmed = {}  # (ticker, preset) -> confirmed signal
+        self._alerted = {}    # (ticker, preset) -> (last alerted signal, monotonic time)
+        self._pending = {}    # (ticker, preset) -> (candidate signal, consecutive cycles)
+        self._suppressed = set()  # keys whose latest transition is waiting out the cooldown
+        self._lock = threading.Lock()
+
+        self._sinks = []
+        self._stats = {}
+        # Sinks record deliveries from executor threads while stats() reads on the caller's
+        self._stats_lock = threading.Lock()
+        self._latency_samples = latency_samples
+        self._loop = None
+        self._thread = None
+        self._queues = {}
+        self._workers = []
+
+        for sink in sinks or []:
+            self.add_sink(sink)
+
+    # --- Sinks and lifecycle ---
+
+    def add_sink(self, sink):
+        """Registers a sink. Sinks added after start() are wired up immediately."""
+        self._sinks.append(sink)
+        self._stats[id(sink)] = {
+            "sink": type(sink).__name__, "delivered": 0, "dropped": 0, "failed": 0,
+            "latencies": deque(maxlen=self._latency_samples),
+        }
+        if self._loop:
+            asyncio.run_coroutine_threadsafe(self._attach(sink), self._loop).result()
+
+    def start(self):
+        """Starts the background dispatch loop."""
+        if self._thread:
+            return
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, args=(ready,), name="alert-dispatch", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def stop(self, timeout=5.0):
+        """Delivers queued alerts (up to `timeout` seconds) and stops the dispatch loop."""
+        if not self._thread:
+            return
+        self.flush(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._thread = None
+        self._loop = None
+        self._queues = {}
+        self._workers = []
+
+    def flush(self, timeout=None):
+        """Blocks until every queued alert has been handled by its sink."""
+        if not self._loop:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._join_queues(), self._loop)
+        try:
+            future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+
+    # --- Transition detection ---
+
+    def process(self, snapshot):
+        """Consumes a SignalSnapshot; usable directly as a SignalService listener."""
+        return self.process_signals(snapshot.signals)
+
+    def process_signals(self, signals):
+        """Consumes {preset: {ticker: signal}} results and dispatches any alerts.
+
+        Returns the list of alerts that were dispatched.
+        """
+        detected_at = time.monotonic()
+        alerts = []
+        confirmed = self._confirmed
+        pending = self._pending
+
+        with self._lock:
+            for preset, by_ticker in signals.items():
+                for ticker, signal in by_ticker.items():
+                    key = (ticker, preset)
+                    current = confirmed.get(key)
+                    if signal == current:
+                        if key in pending:
+                            del pending[key]
+                        continue
+                    if signal in IGNORED_SIGNALS:
+                        continue
+
+                    candidate, cycles = pending.get(key, (signal, 0))
+                    cycles = cycles + 1 if candidate == signal else 1
+                    if cycles < self.debounce_cycles:
+                        pending[key] = (signal, cycles)
+                        continue
+                    pending.pop(key, None)
+                    confirmed[key] = signal
+
+                    if current is None and not self.alert_on_first:
+                        self._alerted[key] = (signal, float("-inf"))
+                        continue
+                    alert = self._maybe_alert(key, current, signal, detected_at)
+                    if alert:
+                        alerts.append(alert)
+
+            # Retry transitions that were held back by the cooldown
+            for key in list(self._suppressed):
+                alert = self._maybe_alert(key, None, confirmed.get(key), detected_at)
+                if alert:
+                    alerts.append(alert)
+
+        if alerts:
+            self._dispatch(alerts)
+        return alerts
+
+    def reset(self, ticker=None):
+        """Forgets the confirmed state for one ticker, or for every ticker."""
+        with self._lock:
+            for state in (self._confirmed, self._alerted, self._pending):
+                for key in [key for key in state if ticker is None or key[0] == ticker]:
+                    del state[key]
+            self._suppressed = {key for key in self._suppressed if ticker is not None and key[0] != ticker}
+
+    def _maybe_alert(self, key, previous, signal, detected_at):
+        last_signal, last_time = self._alerted.get(key, (previous, float("-inf")))
+        if signal == last_signal:
+            # Flipped back before the cooldown expired; nothing to report
+            self._suppressed.discard(key)
+            return None
+        if detected_at - last_time < self.cooldown:
+            self._suppressed.add(key)
+            return None
+        self._suppressed.discard(key)
+        self._alerted[key] = (signal, detected_at)
+        return Alert(key[0], key[1], last_signal, signal, detected_at)
+
+    # --- Dispatch ---
+
+    def stats(self):
+        """Returns per-sink delivery counts and latency percentiles in milliseconds."""
+        result = []
+        for sink in self._sinks:
+            stats = self._stats[id(sink)]
+            with self._stats_lock:
+                latencies = list(stats["latencies"])
+                entry = {key: value for key, value in stats.items() if key != "latencies"}
+            latencies.sort()
+            if latencies:
+                entry["p50_ms"] = latencies[len(latencies) // 2] * 1000
+                entry["p99_ms"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+                entry["max_ms"] = latencies[-1] * 1000
+            result.append(entry)
+        return result
+
+    def _dispatch(self, alerts):
+        if not self._loop:
+            logger.warning("Alert engine not started; dropping %d alert(s)", len(alerts))
+            return
+        self._loop.call_soon_threadsafe(self._enqueue, alerts)
+
+    def _enqueue(self, alerts):
+        for sink in self._sinks:
+            queue = self._queues.get(id(sink))
+            if queue is None:
+                continue
+            stats = self._stats[id(sink)]
+            for alert in alerts:
+                if queue.full():
+                    queue.get_nowait()
+                    queue.task_done()
+                    with self._stats_lock:
+                        stats["dropped"] += 1
+                queue.put_nowait(alert)
+
+    def _run_loop(self, ready):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        for sink in self._sinks:
+            self._loop.run_until_complete(self._attach(sink))
+        ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            for worker in self._workers:
+                worker.cancel()
+            self._loop.run_until_complete(asyncio.gather(*self._workers, return_exceptions=True))
+            self._loop.close()
+
+    async def _attach(self, sink):
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._queues[id(sink)] = queue
+        self._workers.append(asyncio.ensure_future(self._worker(sink, queue)))
+
+    async def _worker(self, sink, queue):
+        is_async = asyncio.iscoroutinefunction(sink.send)
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            # Hand everything already waiting to the sink in one go, so a fast
+            # blocking sink pays for one executor hop per batch, not per alert
+            while not queue.empty() and len(batch) < self.BATCH_SIZE:
+                batch.append(queue.get_nowait())
+            try:
+                if is_async:
+                    for alert in batch:
+                        await self._deliver_async(sink, alert)
+                else:
+                    await loop.run_in_executor(None, self._deliver_batch, sink, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _deliver_async(self, sink, alert):
+        try:
+            await sink.send(alert)
+        except Exception:
+            self._record_failure(sink)
+        else:
+            self._record_delivery(sink, alert)
+
+    def _deliver_batch(self, sink, batch):
+        for alert in batch:
+            try:
+                sink.send(alert)
+            except Exception:
+                self._record_failure(sink)
+            else:
+                self._record_delivery(sink, alert)
+
+    def _record_delivery(self, sink, alert):
+        stats = self._stats[id(sink)]
+        latency = time.monotonic() - alert.detected_at
+        with self._stats_lock:
+            stats["delivered"] += 1
+            stats["latencies"].append(latency)
+
+    def _record_failure(self, sink):
+        with self._stats_lock:
+            self._stats[id(sink)]["failed"] += 1
+        logger.exception("Alert sink %s failed", type(sink).__name__)
+
+    async def _join_queues(self):
+        await asyncio.gather(*(queue.join() for queue in self._queues.values()))
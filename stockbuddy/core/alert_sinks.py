@@ -0,0 +1,60 @@
+import json
+import logging
+import os
+import shutil
+import subprocess
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+
+class LogFileSink:
+    """Appends one line per alert to a log file in the app directory."""
+
+    def __init__(self, filename="alerts.log"):
+        home_dir = os.path.expanduser("~")
+        app_dir = os.path.join(home_dir, ".stockbuddy")
+        os.makedirs(app_dir, exist_ok=True)
+        self.filepath = filename if os.path.isabs(filename) else os.path.join(app_dir, filename)
+
+    def send(self, alert):
+        with open(self.filepath, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(alert.to_dict()) + "\n")
+
+
+class WebhookSink:
+    """POSTs each alert as JSON to a (local) webhook URL."""
+
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, alert):
+        body = json.dumps(alert.to_dict()).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, method="POST",
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class DesktopNotificationSink:
+    """Shows each alert as a desktop notification.
+
+    `notify` is called with (title, message); the GUI passes a Qt signal's
+    emit so the tray icon is updated on the GUI thread. Without one, the
+    sink falls back to `notify-send` when it is installed.
+    """
+
+    def __init__(self, notify=None):
+        self.notify = notify
+        self._notify_send = shutil.which("notify-send") if notify is None else None
+
+    def send(self, alert):
+        title = f"StockBuddy: {alert.ticker} {alert.signal}"
+        message = alert.message()
+        if self.notify:
+            self.notify(title, message)
+        elif self._notify_send:
+            subprocess.run([self._notify_send, title, message], check=False, timeout=5)
+        else:
+            logger.info("%s - %s", title, message)
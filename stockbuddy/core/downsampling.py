@@ -0,0 +1,196 @@
+import numpy as np
+
+
+def minmax_decimate(x, y, buckets):
+    """Keeps the lowest and highest point of each of `buckets` equal-width buckets.
+
+    Returns at most 2 * buckets points in x order. Every local extreme
+    that would be visible at that resolution survives, which makes this
+    the right choice for price lines. NaNs in y are skipped.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = ~np.isnan(y)
+    x, y = x[valid], y[valid]
+    if len(y) <= 2 * buckets:
+        return x, y
+
+    size = -(-len(y) // buckets)  # ceil
+    padded = np.full(size * buckets, np.nan)
+    padded[:len(y)] = y
+    grid = padded.reshape(buckets, size)
+    used = ~np.all(np.isnan(grid), axis=1)
+    grid = grid[used]
+    offsets = np.flatnonzero(used) * size
+
+    low = offsets + np.nanargmin(grid, axis=1)
+    high = offsets + np.nanargmax(grid, axis=1)
+    indices = np.unique(np.concatenate([low, high]))
+    return x[indices], y[indices]
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets downsampling to `threshold` points.
+
+    Picks, in each bucket, the point forming the largest triangle with the
+    previously selected point and the next bucket's average. It keeps the
+    visual shape of smooth series with fewer points than min/max.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = ~np.isnan(y)
+    x, y = x[valid], y[valid]
+    count = len(y)
+    if threshold >= count or threshold < 3:
+        return x, y
+
+    edges = np.linspace(1, count - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = count - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_start, next_stop = edges[bucket + 1], edges[bucket + 2] if bucket + 2 < len(edges) else count
+        average_x = x[next_start:next_stop].mean() if next_stop > next_start else x[-1]
+        average_y = y[next_start:next_stop].mean() if next_stop > next_start else y[-1]
+        areas = np.abs(
+            (x[previous] - average_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (average_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return x[selected], y[selected]
+
+
+class DecimatedSeries:
+    """Min/max decimation that can be extended one point at a time.
+
+    Points are grouped into buckets of `bucket_size` and each complete
+    bucket is reduced to its min and max. When there are more buckets than
+    the point budget allows, neighbouring buckets are merged and the size
+    doubles; min/max of merged buckets is exact, so this never needs the
+    original points. The newest bucket stays open so the last point can be
+    revised (e.g. an intraday bar that is still forming), and the oldest
+    points can be dropped when a rolling window moves on.
+    """
+
+    def __init__(self, max_points=1000):
+        self.max_buckets = max(3, max_points // 2)
+        self.bucket_size = 1
+        self._closed_x = np.empty((0, 2))  # per closed bucket: x of its two extremes, in x order
+        self._closed_y = np.empty((0, 2))
+        self._closed_bounds = np.empty((0, 2))  # per closed bucket: x of its first and last point
+        self._open_x = np.empty(0)
+        self._open_y = np.empty(0)
+        self.length = 0
+
+    def extend(self, x, y):
+        """Appends points in x order."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.length += len(y)
+
+        if not len(self._closed_x):
+            # Pick the bucket size up front rather than merging down from size 1
+            while (len(self._open_y) + len(y)) / self.bucket_size + 2 > self.max_buckets:
+                self.bucket_size *= 2
+
+        # Top up the open bucket first
+        room = self.bucket_size - len(self._open_y)
+        self._open_x = np.concatenate([self._open_x, x[:room]])
+        self._open_y = np.concatenate([self._open_y, y[:room]])
+        x, y = x[room:], y[room:]
+        if not len(y):
+            return
+
+        # Close it and every full bucket in the rest; the last point always
+        # stays in the (new) open bucket
+        closed = (len(y) - 1) // self.bucket_size * self.bucket_size
+        chunks_x = np.concatenate([self._open_x, x[:closed]]).reshape(-1, self.bucket_size)
+        chunks_y = np.concatenate([self._open_y, y[:closed]]).reshape(-1, self.bucket_size)
+        bucket_x, bucket_y = _extremes(chunks_x, chunks_y)
+        self._closed_x = np.vstack([self._closed_x, bucket_x])
+        self._closed_y = np.vstack([self._closed_y, bucket_y])
+        self._closed_bounds = np.vstack([self._closed_bounds, chunks_x[:, [0, -1]]])
+        self._open_x, self._open_y = x[closed:], y[closed:]
+
+        while len(self._closed_x) + 2 > self.max_buckets:
+            self._merge()
+
+        # Merging grew the bucket size; refill the open bucket if it can take more
+        if len(self._open_y) > self.bucket_size:
+            pending_x, pending_y = self._open_x, self._open_y
+            self._open_x, self._open_y = np.empty(0), np.empty(0)
+            self.length -= len(pending_y)
+            self.extend(pending_x, pending_y)
+
+    def update_last(self, y):
+        """Replaces the value of the most recent point."""
+        if len(self._open_y):
+            self._open_y = self._open_y.copy()
+            self._open_y[-1] = float(y)
+
+    def drop_before(self, cutoff, x=None, y=None):
+        """Discards the points before x = `cutoff`, e.g. bars that left a rolling window.
+
+        Buckets entirely before the cutoff are dropped. The bucket straddling
+        it is rebuilt from `x`/`y`, the original points from the cutoff on
+        (only as many as that bucket covers are read); without them, its
+        extremes before the cutoff are left out and the rest of it is lost.
+        """
+        keep = np.searchsorted(self._closed_bounds[:, 1], cutoff)
+        self._closed_x = self._closed_x[keep:]
+        self._closed_y = self._closed_y[keep:]
+        self._closed_bounds = self._closed_bounds[keep:]
+
+        if len(self._closed_bounds) and self._closed_bounds[0, 0] < cutoff:
+            self._closed_x, self._closed_y = self._closed_x.copy(), self._closed_y.copy()
+            if x is not None:
+                end = np.searchsorted(x, self._closed_bounds[0, 1], side="right")
+                bucket_x, bucket_y = _extremes(np.asarray(x[:end], dtype=float)[None, :],
+                                               np.asarray(y[:end], dtype=float)[None, :])
+                self._closed_x[0], self._closed_y[0] = bucket_x[0], bucket_y[0]
+            else:
+                self._closed_y[0][self._closed_x[0] < cutoff] = np.nan
+            self._closed_bounds = self._closed_bounds.copy()
+            self._closed_bounds[0, 0] = cutoff
+        elif not len(self._closed_bounds):
+            inside = self._open_x >= cutoff
+            self._open_x, self._open_y = self._open_x[inside], self._open_y[inside]
+
+    def points(self):
+        """Returns the decimated (x, y) arrays, ending with the newest point."""
+        x, y = self._closed_x.ravel(), self._closed_y.ravel()
+        if len(self._open_y):
+            open_x, open_y = _extremes(self._open_x[None, :], self._open_y[None, :])
+            open_x, open_y = open_x.ravel(), open_y.ravel()
+            if open_x[-1] != self._open_x[-1]:
+                # Always end on the newest point so the line reaches the current value
+                open_x = np.append(open_x, self._open_x[-1])
+                open_y = np.append(open_y, self._open_y[-1])
+            x = np.concatenate([x, open_x])
+            y = np.concatenate([y, open_y])
+        valid = ~np.isnan(y)
+        return x[valid], y[valid]
+
+    def _merge(self):
+        # An odd trailing bucket is carried over and merged next time
+        even = len(self._closed_x) // 2 * 2
+        merged_x, merged_y = _extremes(self._closed_x[:even].reshape(-1, 4), self._closed_y[:even].reshape(-1, 4))
+        merged_bounds = self._closed_bounds[:even].reshape(-1, 4)[:, [0, 3]]
+        self._closed_x = np.vstack([merged_x, self._closed_x[even:]])
+        self._closed_y = np.vstack([merged_y, self._closed_y[even:]])
+        self._closed_bounds = np.vstack([merged_bounds, self._closed_bounds[even:]])
+        self.bucket_size *= 2
+
+
+def _extremes(xs, ys):
+    """Reduces each row to its (min, max) points in x order; all-NaN rows give NaNs."""
+    with np.errstate(invalid="ignore"):
+        low = np.argmin(np.where(np.isnan(ys), np.inf, ys), axis=1)
+        high = np.argmax(np.where(np.isnan(ys), -np.inf, ys), axis=1)
+    first, second = np.minimum(low, high), np.maximum(low, high)
+    rows = np.arange(len(ys))
+    return (np.stack([xs[rows, first], xs[rows, second]], axis=1),
+            np.stack([ys[rows, first], ys[rows, second]], axis=1))
@@ -41,7 +41,8 @@ class PresetManager:
         """Returns a dictionary of all presets."""
         return self.presets
 
-    def get_default_presets(self):
+    @staticmethod
+    def get_default_presets():
         """Returns a dictionary of default presets."""
         return {
             "Conservative Growth": {
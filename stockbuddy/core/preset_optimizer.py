@@ -0,0 +1,318 @@
+import copy
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+METRICS = ("total_return", "sharpe", "exposure", "trades")
+
+
+class IndicatorPrimitives:
+    """Shared building blocks for evaluating many indicator windows over one history.
+
+    Prefix sums give every SMA and rolling standard deviation in O(n)
+    regardless of the window, and price differences are taken once for all
+    RSI periods. Derived series are cached by their parameters, so a sweep
+    only pays for each distinct window once per ticker.
+    """
+
+    def __init__(self, close, high=None, low=None):
+        self.close = np.asarray(close, dtype=float)
+        self.high = np.asarray(high, dtype=float) if high is not None else None
+        self.low = np.asarray(low, dtype=float) if low is not None else None
+        self.length = len(self.close)
+
+        self._sum = np.concatenate(([0.0], np.cumsum(self.close)))
+        self._sum_sq = np.concatenate(([0.0], np.cumsum(self.close ** 2)))
+
+        delta = np.diff(self.close, prepend=np.nan)
+        self._gain = pd.Series(np.where(delta > 0, delta, 0.0))
+        self._loss = pd.Series(np.where(delta < 0, -delta, 0.0))
+        self._cache = {}
+
+    def _cached(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _window_sums(self, prefix, window):
+        out = np.full(self.length, np.nan)
+        if 0 < window <= self.length:
+            out[window - 1:] = prefix[window:] - prefix[:-window]
+        return out
+
+    def sma(self, window):
+        return self._cached(("sma", window), lambda: self._window_sums(self._sum, window) / window)
+
+    def std(self, window):
+        """Rolling sample standard deviation, matching pandas' rolling().std()."""
+        def compute():
+            total = self._window_sums(self._sum, window)
+            total_sq = self._window_sums(self._sum_sq, window)
+            variance = (total_sq - total * total / window) / (window - 1) if window > 1 else np.full(self.length, np.nan)
+            return np.sqrt(np.clip(variance, 0, None))
+        return self._cached(("std", window), compute)
+
+    def ema(self, span):
+        return self._cached(("ema", span),
+                            lambda: pd.Series(self.close).ewm(span=span, adjust=False).mean().to_numpy())
+
+    def rsi(self, window):
+        def compute():
+            gain = self._gain.ewm(alpha=1 / window, adjust=False).mean()
+            loss = self._loss.ewm(alpha=1 / window, adjust=False).mean()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return (100 - (100 / (1 + gain / loss))).to_numpy()
+        return self._cached(("rsi", window), compute)
+
+    def macd(self, fast_period, slow_period, signal_period):
+        def compute():
+            macd_line = self.ema(fast_period) - self.ema(slow_period)
+            signal_line = pd.Series(macd_line).ewm(span=signal_period, adjust=False).mean().to_numpy()
+            return macd_line, signal_line
+        return self._cached(("macd", fast_period, slow_period, signal_period), compute)
+
+    def bollinger_bands(self, window, std_dev):
+        def compute():
+            sma, std = self.sma(window), self.std(window)
+            return sma + std * std_dev, sma - std * std_dev
+        return self._cached(("bollinger", window, std_dev), compute)
+
+    def stochastic(self, k_period, d_period):
+        def compute():
+            low_min = pd.Series(self.low).rolling(window=k_period).min()
+            high_max = pd.Series(self.high).rolling(window=k_period).max()
+            k_percent = 100 * ((pd.Series(self.close) - low_min) / (high_max - low_min))
+            d_percent = k_percent.rolling(window=d_period).mean()
+            return k_percent.to_numpy(), d_percent.to_numpy()
+        return self._cached(("stochastic", k_period, d_period), compute)
+
+
+def _previous(values):
+    out = np.empty_like(values)
+    out[0] = np.nan
+    out[1:] = values[:-1]
+    return out
+
+
+def rule_condition(primitives, rule):
+    """Evaluates one preset rule at every bar, mirroring RecommendationEngine._evaluate_rule.
+
+    Returns a boolean array that is True wherever the rule would fire.
+    """
+    indicator = rule.get("indicator")
+    close = primitives.close
+    never = np.zeros(primitives.length, dtype=bool)
+
+    with np.errstate(invalid="ignore"):
+        try:
+            if indicator == "SMA":
+                sma = primitives.sma(rule['period'])
+                if rule['condition'] == '>':
+                    return sma > close
+                if rule['condition'] == '<':
+                    return sma < close
+
+            elif indicator == "RSI":
+                rsi = primitives.rsi(rule['period'])
+                # The engine holds until it has at least `period` bars
+                enough_data = np.arange(1, primitives.length + 1) >= rule['period']
+                if rule['condition'] == '>':
+                    return (rsi > rule['value']) & enough_data
+                if rule['condition'] == '<':
+                    return (rsi < rule['value']) & enough_data
+
+            elif indicator in ["Golden Cross", "Death Cross"]:
+                short_sma = primitives.sma(rule['short_period'])
+                long_sma = primitives.sma(rule['long_period'])
+                if indicator == "Golden Cross":
+                    return (_previous(short_sma) <= _previous(long_sma)) & (short_sma > long_sma)
+                return (_previous(short_sma) >= _previous(long_sma)) & (short_sma < long_sma)
+
+            elif indicator == "MACD":
+                macd_line, signal_line = primitives.macd(rule['fast_period'], rule['slow_period'], rule['signal_period'])
+                if rule['condition'] == 'crosses_above_signal':
+                    return (_previous(macd_line) <= _previous(signal_line)) & (macd_line > signal_line)
+
+            elif indicator == "Bollinger Bands":
+                upper, lower = primitives.bollinger_bands(rule['period'], rule['std_dev'])
+                if rule['condition'] == 'price_crosses_below_lower_band':
+                    return (_previous(close) > _previous(lower)) & (close < lower)
+
+            elif indicator == "Stochastic Oscillator":
+                if primitives.high is None or primitives.low is None:
+                    return never
+                k, d = primitives.stochastic(rule['k_period'], rule['d_period'])
+                if rule['condition'] == '<':
+                    return (k < rule['value']) & (d < rule['value'])
+
+        except KeyError:
+            return never
+
+    return never
+
+
+def expand_grid(rules, grid):
+    """Returns one (params, rules) pair per combination of grid values.
+
+    Grid keys are "<rule index>.<parameter>", e.g. {"0.period": [50, 200]}.
+    """
+    keys = list(grid)
+    targets = []
+    for key in keys:
+        index, _, parameter = key.partition(".")
+        if not parameter or not index.isdigit() or int(index) >= len(rules):
+            raise ValueError(f"Invalid grid key '{key}'; expected '<rule index>.<parameter>'")
+        targets.append((int(index), parameter))
+
+    combinations = []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        combination_rules = copy.deepcopy(rules)
+        for (index, parameter), value in zip(targets, values):
+            combination_rules[index][parameter] = value
+        combinations.append((dict(zip(keys, values)), combination_rules))
+    return combinations
+
+
+def signal_matrix(primitives, rule_sets):
+    """Returns a (combinations x bars) int8 matrix of 1 = Buy, -1 = Sell, 0 = Hold.
+
+    Sell rules take priority over Buy rules, as in generate_signals().
+    Rules shared between combinations are evaluated only once.
+    """
+    index_by_rule = {}
+    conditions = [np.zeros(primitives.length, dtype=bool)]  # Row 0 pads short rule sets
+    width = max((len(rules) for rules in rule_sets), default=0)
+    indices = np.zeros((len(rule_sets), width), dtype=np.intp)
+    actions = np.full((len(rule_sets), width), "", dtype=object)
+
+    for row, rules in enumerate(rule_sets):
+        for position, rule in enumerate(rules):
+            key = repr(sorted(rule.items()))
+            if key not in index_by_rule:
+                index_by_rule[key] = len(conditions)
+                conditions.append(rule_condition(primitives, rule))
+            indices[row, position] = index_by_rule[key]
+            actions[row, position] = rule.get("action")
+
+    conditions = np.vstack(conditions)
+    buy = np.zeros((len(rule_sets), primitives.length), dtype=bool)
+    sell = np.zeros_like(buy)
+    for position in range(width):
+        fired = conditions[indices[:, position]]
+        buy |= fired & (actions[:, position] == "Buy")[:, None]
+        sell |= fired & (actions[:, position] == "Sell")[:, None]
+
+    return np.where(sell, -1, np.where(buy, 1, 0)).astype(np.int8)
+
+
+def backtest(signals, close):
+    """Scores each row of a signal matrix with a long/flat strategy.
+
+    A Buy opens (or keeps) a position at the close, a Sell closes it and a
+    Hold keeps whatever position is open. Returns a dict of metric arrays
+    with one value per row.
+    """
+    bars = signals.shape[1]
+    if bars < 2:
+        return {metric: np.zeros(signals.shape[0]) for metric in METRICS}
+
+    # Forward-fill the last non-Hold signal to get the position at every bar
+    last_decision = np.maximum.accumulate(np.where(signals != 0, np.arange(bars), 0), axis=1)
+    position = np.take_along_axis(signals, last_decision, axis=1) == 1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.nan_to_num(close[1:] / close[:-1] - 1)
+
+    # Positions are 0/1, so every per-row statistic is a matrix-vector product
+    # against the return series rather than a (combinations x bars) float matrix
+    held = position[:, :-1].astype(float)
+    periods = bars - 1
+    mean = held @ returns / periods
+    variance = np.clip(held @ (returns * returns) / periods - mean * mean, 0, None)
+    volatility = np.sqrt(variance)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(volatility > 0, mean / volatility * np.sqrt(TRADING_DAYS), 0.0)
+
+    entries = position[:, 1:] & ~position[:, :-1]
+    return {
+        "total_return": np.expm1(held @ np.log1p(returns)),
+        "sharpe": sharpe,
+        "exposure": position.mean(axis=1),
+        "trades": (np.count_nonzero(entries, axis=1) + position[:, 0]).astype(float),
+    }
+
+
+def _score_histories(histories, rules, grid):
+    """Worker entry point: scores every combination on a chunk of (close, high, low) arrays."""
+    rule_sets = [combination_rules for _, combination_rules in expand_grid(rules, grid)]
+    totals = {metric: np.zeros(len(rule_sets)) for metric in METRICS}
+    for close, high, low in histories:
+        primitives = IndicatorPrimitives(close, high, low)
+        scores = backtest(signal_matrix(primitives, rule_sets), primitives.close)
+        for metric in METRICS:
+            totals[metric] += scores[metric]
+    return totals, len(histories)
+
+
+class PresetOptimizer:
+    """Sweeps parameter grids for a preset's rules over cached history and ranks the results.
+
+    Every combination is backtested on every ticker; scores are averaged
+    across tickers. Tickers are split into chunks that are scored in a
+    process pool.
+    """
+
+    def __init__(self, max_workers=None, chunks_per_worker=4):
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.chunks_per_worker = chunks_per_worker
+
+    def sweep(self, rules, grid, histories, rank_by="total_return"):
+        """Returns one result dict per combination, best first.
+
+        `histories` maps tickers to historical DataFrames (e.g. a
+        SignalSnapshot's histories). Each result holds the grid params, the
+        expanded rules and the average of every metric in METRICS.
+        """
+        if rank_by not in METRICS:
+            raise ValueError(f"Unknown metric '{rank_by}'; expected one of {METRICS}")
+
+        combinations = expand_grid(rules, grid)
+        arrays = [_history_arrays(data) for data in histories.values() if data is not None and len(data) > 1]
+        totals = {metric: np.zeros(len(combinations)) for metric in METRICS}
+        count = 0
+
+        for chunk_totals, chunk_count in self._map(arrays, rules, grid):
+            for metric in METRICS:
+                totals[metric] += chunk_totals[metric]
+            count += chunk_count
+
+        results = []
+        for i, (params, combination_rules) in enumerate(combinations):
+            result = {"params": params, "rules": combination_rules}
+            for metric in METRICS:
+                result[metric] = float(totals[metric][i] / count) if count else 0.0
+            results.append(result)
+        results.sort(key=lambda result: result[rank_by], reverse=True)
+        return results
+
+    def _map(self, arrays, rules, grid):
+        if not arrays:
+            return []
+        if self.max_workers <= 1 or len(arrays) == 1:
+            return [_score_histories(arrays, rules, grid)]
+
+        chunk_count = min(len(arrays), self.max_workers * self.chunks_per_worker)
+        chunks = [arrays[i::chunk_count] for i in range(chunk_count)]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(_score_histories, chunks, [rules] * len(chunks), [grid] * len(chunks)))
+
+
+def _history_arrays(historical_data):
+    historical_data = historical_data.dropna(subset=['Close'])
+    high = historical_data['High'].to_numpy(dtype=float) if 'High' in historical_data else None
+    low = historical_data['Low'].to_numpy(dtype=float) if 'Low' in historical_data else None
+    return historical_data['Close'].to_numpy(dtype=float), high, low
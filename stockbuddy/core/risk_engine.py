@@ -0,0 +1,262 @@
+import numpy as np
+import pandas as pd
+
+from stockbuddy.data.data_manager import INDEX_TICKERS
+
+TRADING_DAYS = 252
+
+
+class RollingCovariance:
+    """Rolling-window covariance of N return series, updated one bar at a time.
+
+    Keeps the running sums and cross-product matrix of the last `window`
+    bars. Each new bar adds its outer product and removes the outer
+    product of the bar leaving the window (a rank-two update), instead of
+    recomputing the N x N matrix from the whole window. The sums are
+    rebuilt exactly from the buffered bars every `resync_interval` updates
+    to stop floating point drift from accumulating.
+    """
+
+    def __init__(self, size, window=60, resync_interval=None):
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.size = size
+        self.window = window
+        self.resync_interval = resync_interval or window * 10
+        self._buffer = np.zeros((window, size))
+        self._sum = np.zeros(size)
+        self._cross = np.zeros((size, size))
+        self._position = 0
+        self._count = 0
+        self._updates = 0
+
+    @property
+    def count(self):
+        """Number of bars currently in the window."""
+        return self._count
+
+    def update(self, returns):
+        """Adds one bar of returns; NaNs count as zero returns."""
+        x = np.nan_to_num(np.asarray(returns, dtype=float))
+        if self._count == self.window:
+            old = self._buffer[self._position]
+            self._sum += x - old
+            # cross += x x' - old old', as one rank-two product
+            self._cross += np.stack([x, old], axis=1) @ np.stack([x, -old])
+        else:
+            self._sum += x
+            self._cross += np.outer(x, x)
+            self._count += 1
+        self._buffer[self._position] = x
+        self._position = (self._position + 1) % self.window
+
+        self._updates += 1
+        if self._updates % self.resync_interval == 0:
+            self.resync()
+
+    def revise_last(self, returns):
+        """Replaces the most recent bar, e.g. when a session's close is revised intraday.
+
+        The old bar is removed and the new one added with the same rank-two
+        update, in the same buffer slot.
+        """
+        if not self._count:
+            raise ValueError("no bar to revise")
+        x = np.nan_to_num(np.asarray(returns, dtype=float))
+        slot = (self._position - 1) % self.window
+        old = self._buffer[slot]
+        self._sum += x - old
+        self._cross += np.stack([x, old], axis=1) @ np.stack([x, -old])
+        self._buffer[slot] = x
+
+    def resync(self):
+        """Recomputes the running sums exactly from the buffered bars."""
+        bars = self._buffer if self._count == self.window else self._buffer[:self._count]
+        self._sum = bars.sum(axis=0)
+        self._cross = bars.T @ bars
+
+    def mean(self):
+        return self._sum / self._count if self._count else np.full(self.size, np.nan)
+
+    def covariance(self):
+        """Returns the sample covariance matrix of the bars in the window."""
+        if self._count < 2:
+            return np.full((self.size, self.size), np.nan)
+        covariance = np.outer(self._sum, self._sum / -self._count)
+        covariance += self._cross
+        covariance /= self._count - 1
+        return covariance
+
+    def covariance_column(self, column):
+        """Returns one column of the covariance matrix without building the rest."""
+        if self._count < 2:
+            return np.full(self.size, np.nan)
+        return (self._cross[:, column] - self._sum * self._sum[column] / self._count) / (self._count - 1)
+
+    def variances(self):
+        """Returns the diagonal of the covariance matrix."""
+        if self._count < 2:
+            return np.full(self.size, np.nan)
+        return (np.diagonal(self._cross) - self._sum ** 2 / self._count) / (self._count - 1)
+
+    def quadratic_form(self, weights):
+        """Returns w' C w for the covariance C, with one matrix-vector product."""
+        if self._count < 2:
+            return np.nan
+        weights = np.asarray(weights, dtype=float)
+        mean_term = (weights @ self._sum) ** 2 / self._count
+        return float((weights @ (self._cross @ weights) - mean_term) / (self._count - 1))
+
+    def correlation(self):
+        correlation = self.covariance()
+        std = np.sqrt(np.clip(np.diagonal(correlation), 0, None))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(std > 0, 1 / std, np.nan)
+        correlation *= scale[:, None]
+        correlation *= scale[None, :]
+        np.fill_diagonal(correlation, np.where(std > 0, 1.0, np.nan))
+        return np.clip(correlation, -1.0, 1.0, out=correlation)
+
+
+class RiskEngine:
+    """Rolling correlation, beta and portfolio volatility across a watchlist.
+
+    Tracks daily returns for the watchlist tickers plus the market indexes
+    shown in the top bar, so betas can be read straight off the shared
+    covariance matrix. Load history once with `load()`, then feed each new
+    bar with `update_bar()` or `update_from_histories()`. A bar dated the
+    same as the last one fed (today's bar while the session is still open)
+    revises it in place rather than adding a new return.
+    """
+
+    def __init__(self, tickers, index_tickers=None, window=60):
+        index_tickers = list(INDEX_TICKERS) if index_tickers is None else list(index_tickers)
+        self.tickers = list(dict.fromkeys(list(tickers) + index_tickers))
+        self.index_tickers = index_tickers
+        self.window = window
+        self.rolling = RollingCovariance(len(self.tickers), window)
+        self.last_date = None
+        self._positions = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._last_close = np.full(len(self.tickers), np.nan)
+        self._previous_close = self._last_close  # closes before the last bar fed
+        self._last_row = self._last_close        # closes of the last bar fed
+
+    def load(self, histories):
+        """Seeds the window from {ticker: historical DataFrame}, using the last `window` returns.
+
+        Anything fed before is discarded.
+        """
+        closes = self._aligned_closes(histories).tail(self.window + 1)
+        if closes.empty:
+            return
+        self.rolling = RollingCovariance(len(self.tickers), self.window, self.rolling.resync_interval)
+        self._last_close = closes.iloc[0].to_numpy(dtype=float)
+        self._last_row = self._last_close
+        self.last_date = closes.index[0]
+        self._feed(closes.iloc[1:])
+
+    def update_from_histories(self, histories):
+        """Feeds bars from the last one seen onwards; usable with snapshot histories.
+
+        The bar dated `last_date` is re-read so later revisions of it,
+        including the final close, replace the value fed earlier.
+        """
+        closes = self._aligned_closes(histories)
+        if self.last_date is not None:
+            closes = closes[closes.index >= self.last_date]
+        self._feed(closes)
+
+    def update_bar(self, closes, date=None):
+        """Feeds one bar given as {ticker: close}. Missing tickers count as unchanged.
+
+        A bar with the same `date` as the last one revises it.
+        """
+        row = np.full(len(self.tickers), np.nan)
+        for ticker, close in closes.items():
+            position = self._positions.get(ticker)
+            if position is not None:
+                row[position] = close
+        self._feed_row(row, revise=date is not None and date == self.last_date)
+        if date is not None:
+            self.last_date = date
+
+    def covariance_matrix(self, annualize=False):
+        covariance = self.rolling.covariance() * (TRADING_DAYS if annualize else 1)
+        return pd.DataFrame(covariance, index=self.tickers, columns=self.tickers)
+
+    def correlation_matrix(self):
+        return pd.DataFrame(self.rolling.correlation(), index=self.tickers, columns=self.tickers)
+
+    def betas(self, index="^GSPC"):
+        """Returns each ticker's beta against an index over the window."""
+        if index not in self._positions:
+            raise KeyError(f"'{index}' is not tracked")
+        column = self._positions[index]
+        covariance = self.rolling.covariance_column(column)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            betas = covariance / covariance[column]
+        return pd.Series(betas, index=self.tickers).drop(self.index_tickers, errors="ignore")
+
+    def volatilities(self):
+        """Returns annualized volatility per ticker."""
+        variance = np.clip(self.rolling.variances(), 0, None)
+        return pd.Series(np.sqrt(variance * TRADING_DAYS), index=self.tickers)
+
+    def portfolio_volatility(self, weights):
+        """Returns annualized volatility of a portfolio given {ticker: weight}.
+
+        Weights are used as given (e.g. market values or fractions); they
+        are normalized to sum to one.
+        """
+        vector = np.zeros(len(self.tickers))
+        for ticker, weight in weights.items():
+            if ticker not in self._positions:
+                raise KeyError(f"'{ticker}' is not tracked")
+            vector[self._positions[ticker]] = weight
+        total = vector.sum()
+        if total == 0:
+            return 0.0
+        vector /= total
+        variance = self.rolling.quadratic_form(vector)
+        return float(np.sqrt(max(variance, 0.0) * TRADING_DAYS))
+
+    def _aligned_closes(self, histories):
+        series = {}
+        for ticker in self.tickers:
+            data = histories.get(ticker)
+            if data is not None and not data.empty:
+                close = data['Close']
+                if getattr(close.index, "tz", None) is not None:
+                    close = close.tz_localize(None)
+                series[ticker] = close.groupby(close.index.normalize()).last()
+        if not series:
+            return pd.DataFrame(columns=self.tickers)
+        return pd.DataFrame(series).reindex(columns=self.tickers).sort_index()
+
+    def _feed(self, closes):
+        for date, row in zip(closes.index, closes.to_numpy(dtype=float)):
+            self._feed_row(row, revise=date == self.last_date)
+            self.last_date = date
+
+    def _feed_row(self, row, revise=False):
+        if revise:
+            # Tickers missing from the revision keep the value they had in the bar
+            row = np.where(np.isnan(row), self._last_row, row)
+            if not self.rolling.count:
+                # The bar is the loaded starting point, not a return in the window
+                self._last_close = self._last_row = np.where(np.isnan(row), self._last_close, row)
+                return
+            if np.array_equal(row, self._last_row, equal_nan=True):
+                return
+            base = self._previous_close
+        else:
+            base = self._previous_close = self._last_close
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = row / base - 1
+        if revise:
+            self.rolling.revise_last(returns)
+        else:
+            self.rolling.update(returns)
+        self._last_row = row
+        self._last_close = np.where(np.isnan(row), base, row)
@@ -0,0 +1,243 @@
+import operator
+import threading
+
+import numpy as np
+
+from stockbuddy.core.recommendation_engine import RecommendationEngine
+from stockbuddy.data.quotes import summarize_quote
+
+FIELDS = ("price", "change", "percent_change", "volume", "rsi", "sma_50", "sma_200")
+
+OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+}
+
+
+class _SortedIndex:
+    """Row ids of one column ordered by value; NaNs are left out.
+
+    Single-row changes are applied in place with binary search (an O(n)
+    memmove at worst), which keeps the index current without re-sorting.
+    """
+
+    def __init__(self):
+        self.values = np.empty(0)
+        self.rows = np.empty(0, dtype=np.intp)
+
+    def rebuild(self, column, count):
+        rows = np.flatnonzero(~np.isnan(column[:count]))
+        order = np.argsort(column[rows], kind="stable")
+        self.rows = rows[order]
+        self.values = column[self.rows]
+
+    def insert(self, row, value):
+        if np.isnan(value):
+            return
+        position = np.searchsorted(self.values, value, side="right")
+        self.values = np.insert(self.values, position, value)
+        self.rows = np.insert(self.rows, position, row)
+
+    def remove(self, row, value):
+        position = self._locate(row, value)
+        if position is not None:
+            self.values = np.delete(self.values, position)
+            self.rows = np.delete(self.rows, position)
+
+    def rename(self, old_row, new_row, value):
+        position = self._locate(old_row, value)
+        if position is not None:
+            self.rows[position] = new_row
+
+    def range(self, op, value):
+        """Returns the slice of rows whose value satisfies `op value`."""
+        if op == "<":
+            return self.rows[:np.searchsorted(self.values, value, side="left")]
+        if op == "<=":
+            return self.rows[:np.searchsorted(self.values, value, side="right")]
+        if op == ">":
+            return self.rows[np.searchsorted(self.values, value, side="right"):]
+        if op == ">=":
+            return self.rows[np.searchsorted(self.values, value, side="left"):]
+        start = np.searchsorted(self.values, value, side="left")
+        return self.rows[start:np.searchsorted(self.values, value, side="right")]
+
+    def _locate(self, row, value):
+        if np.isnan(value):
+            return None
+        start = np.searchsorted(self.values, value, side="left")
+        stop = np.searchsorted(self.values, value, side="right")
+        matches = np.flatnonzero(self.rows[start:stop] == row)
+        return start + matches[0] if len(matches) else None
+
+
+class Screener:
+    """Per-ticker metrics in columnar arrays with sorted indexes for screening queries.
+
+    Each metric is a NumPy column and keeps a sorted index that is updated
+    incrementally as tickers change, so filter + top-k queries over a whole
+    universe only touch the rows that can match.
+    """
+
+    # Batches touching more than this fraction of rows re-sort instead of patching
+    REBUILD_FRACTION = 0.1
+
+    def __init__(self, fields=FIELDS, capacity=1024):
+        self.fields = tuple(fields)
+        self.recommendation_engine = RecommendationEngine()
+        self._tickers = []  # row -> ticker
+        self._rows = {}     # ticker -> row
+        self._columns = {field: np.full(capacity, np.nan) for field in self.fields}
+        self._indexes = {field: _SortedIndex() for field in self.fields}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._tickers)
+
+    def __contains__(self, ticker):
+        return ticker in self._rows
+
+    def tickers(self):
+        """Returns every ticker held by the screener."""
+        with self._lock:
+            return list(self._tickers)
+
+    def get(self, ticker):
+        """Returns the stored metrics for a ticker, or None."""
+        with self._lock:
+            row = self._rows.get(ticker)
+            return self._record(row) if row is not None else None
+
+    def update(self, ticker, metrics):
+        """Sets metrics for one ticker; fields not given keep their old value."""
+        self.update_many({ticker: metrics})
+
+    def update_many(self, metrics_by_ticker):
+        """Sets metrics for many tickers at once."""
+        with self._lock:
+            rebuild = len(metrics_by_ticker) > max(16, len(self._tickers) * self.REBUILD_FRACTION)
+            for ticker, metrics in metrics_by_ticker.items():
+                row = self._rows.get(ticker)
+                if row is None:
+                    row = self._append(ticker)
+                for field, value in metrics.items():
+                    if field not in self._columns:
+                        continue
+                    value = np.nan if value is None else float(value)
+                    column = self._columns[field]
+                    old = column[row]
+                    if old == value or (np.isnan(old) and np.isnan(value)):
+                        continue
+                    column[row] = value
+                    if not rebuild:
+                        self._indexes[field].remove(row, old)
+                        self._indexes[field].insert(row, value)
+            if rebuild:
+                for field, index in self._indexes.items():
+                    index.rebuild(self._columns[field], len(self._tickers))
+
+    def update_from_history(self, ticker, historical_data):
+        """Computes and stores the standard metrics from a ticker's history."""
+        self.update(ticker, self.metrics_from_history(historical_data))
+
+    def update_from_snapshot(self, snapshot):
+        """Refreshes every ticker in a SignalSnapshot; usable as a SignalService listener."""
+        metrics = {}
+        for ticker, historical_data in snapshot.histories.items():
+            try:
+                metrics[ticker] = self.metrics_from_history(historical_data)
+            except (KeyError, ValueError):
+                continue
+        self.update_many(metrics)
+
+    def metrics_from_history(self, historical_data):
+        """Returns price, change, % change, volume, RSI(14) and SMA(50/200) for the last bar."""
+        metrics = summarize_quote(historical_data)
+        close = historical_data['Close']
+        metrics["rsi"] = float(self.recommendation_engine._calculate_rsi(close, 14).iloc[-1]) if len(close) >= 14 else None
+        metrics["sma_50"] = float(close.iloc[-50:].mean()) if len(close) >= 50 else None
+        metrics["sma_200"] = float(close.iloc[-200:].mean()) if len(close) >= 200 else None
+        return metrics
+
+    def remove(self, ticker):
+        """Drops a ticker, moving the last row into its slot to keep columns dense."""
+        with self._lock:
+            row = self._rows.pop(ticker, None)
+            if row is None:
+                return
+            last = len(self._tickers) - 1
+            for field, column in self._columns.items():
+                self._indexes[field].remove(row, column[row])
+                if row != last:
+                    self._indexes[field].rename(last, row, column[last])
+                    column[row] = column[last]
+                column[last] = np.nan
+            moved = self._tickers.pop()
+            if row != last:
+                self._tickers[row] = moved
+                self._rows[moved] = row
+
+    def query(self, filters=(), sort_by="percent_change", descending=True, limit=50):
+        """Returns up to `limit` records matching every filter, ordered by `sort_by`.
+
+        Filters are (field, operator, value) tuples, e.g. ("rsi", "<", 30).
+        Rows with no value for a filtered or sorted field never match.
+        """
+        for field, op, _ in filters:
+            if field not in self._columns:
+                raise ValueError(f"Unknown field '{field}'")
+            if op not in OPERATORS:
+                raise ValueError(f"Unknown operator '{op}'")
+        if sort_by not in self._columns:
+            raise ValueError(f"Unknown field '{sort_by}'")
+
+        with self._lock:
+            order = self._indexes[sort_by].rows
+            if filters:
+                # Start from the narrowest filter's index range, then check the rest
+                ranges = [(self._indexes[field].range(op, value), field, op, value) for field, op, value in filters]
+                ranges.sort(key=lambda entry: len(entry[0]))
+                candidates = ranges[0][0]
+                for _, field, op, value in ranges[1:]:
+                    with np.errstate(invalid="ignore"):
+                        candidates = candidates[OPERATORS[op](self._columns[field][candidates], value)]
+
+                if len(candidates) <= limit * 8:
+                    # Few matches: sort them directly
+                    sort_values = self._columns[sort_by][candidates]
+                    candidates = candidates[~np.isnan(sort_values)]
+                    sort_values = self._columns[sort_by][candidates]
+                    ranked = np.argsort(-sort_values if descending else sort_values, kind="stable")
+                    selected = candidates[ranked[:limit]]
+                else:
+                    # Many matches: walk the sort index and keep the first that match
+                    mask = np.zeros(len(self._tickers), dtype=bool)
+                    mask[candidates] = True
+                    walk = order[::-1] if descending else order
+                    selected = walk[mask[walk]][:limit]
+            else:
+                selected = (order[::-1] if descending else order)[:limit]
+
+            return [self._record(row) for row in selected]
+
+    def _append(self, ticker):
+        row = len(self._tickers)
+        capacity = len(next(iter(self._columns.values()))) if self._columns else 0
+        if row >= capacity:
+            for field, column in self._columns.items():
+                grown = np.full(max(1, capacity * 2), np.nan)
+                grown[:capacity] = column
+                self._columns[field] = grown
+        self._tickers.append(ticker)
+        self._rows[ticker] = row
+        return row
+
+    def _record(self, row):
+        record = {"ticker": self._tickers[row]}
+        for field, column in self._columns.items():
+            value = column[row]
+            record[field] = None if np.isnan(value) else float(value)
+        return record
@@ -0,0 +1,86 @@
+import json
+import os
+
+DEFAULT_WATCHLIST = "My Watchlist"
+
+
+class WatchlistManager:
+    def __init__(self, filename="watchlists.json"):
+        home_dir = os.path.expanduser("~")
+        app_dir = os.path.join(home_dir, ".stockbuddy")
+        os.makedirs(app_dir, exist_ok=True)
+        self.filepath = os.path.join(app_dir, filename)
+        self.watchlists = self.load_watchlists()
+
+    def load_watchlists(self):
+        """Loads watchlists from the JSON file."""
+        try:
+            with open(self.filepath, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return self.get_default_watchlists()
+
+    def save_watchlists(self):
+        """Saves the current watchlists to the JSON file."""
+        with open(self.filepath, 'w') as f:
+            json.dump(self.watchlists, f, indent=4)
+
+    def get_watchlist(self, name):
+        """Returns the tickers of a watchlist, or None if it does not exist."""
+        tickers = self.watchlists.get(name)
+        return list(tickers) if tickers is not None else None
+
+    def get_all_watchlists(self):
+        """Returns a dictionary of all watchlists."""
+        return self.watchlists
+
+    def get_names(self):
+        """Returns the watchlist names."""
+        return list(self.watchlists)
+
+    def create_watchlist(self, name, tickers=None):
+        """Creates (or replaces) a watchlist and saves it."""
+        self.watchlists[name] = _normalize(tickers or [])
+        self.save_watchlists()
+
+    def delete_watchlist(self, name):
+        """Deletes a watchlist and saves the changes."""
+        if name in self.watchlists:
+            del self.watchlists[name]
+            self.save_watchlists()
+
+    def add_ticker(self, name, ticker):
+        """Adds a ticker to a watchlist. Returns False if it was already there."""
+        ticker = ticker.strip().upper()
+        tickers = self.watchlists.setdefault(name, [])
+        if not ticker or ticker in tickers:
+            return False
+        tickers.append(ticker)
+        self.save_watchlists()
+        return True
+
+    def remove_ticker(self, name, ticker):
+        """Removes a ticker from a watchlist and saves the changes."""
+        tickers = self.watchlists.get(name, [])
+        if ticker in tickers:
+            tickers.remove(ticker)
+            self.save_watchlists()
+
+    def set_tickers(self, name, tickers):
+        """Replaces a watchlist's tickers, keeping their order and dropping duplicates."""
+        self.watchlists[name] = _normalize(tickers)
+        self.save_watchlists()
+        return list(self.watchlists[name])
+
+    def get_default_watchlists(self):
+        """Returns a dictionary of default watchlists."""
+        return {DEFAULT_WATCHLIST: []}
+
+
+def _normalize(tickers):
+    normalized = []
+    for ticker in tickers:
+        ticker = ticker.strip().upper()
+        if ticker and ticker not in normalized:
+            normalized.append(ticker)
+    return normalized
@@ -1,5 +1,30 @@
+import urllib.request
+
 import yfinance as yf
 
+# Market indexes shown in the main window's top bar
+INDEX_TICKERS = {
+    "^GSPC": "S&P 500",
+    "^DJI": "Dow",
+    "^IXIC": "Nasdaq",
+    "^RUT": "Russell 2000"
+}
+
+# Nasdaq Trader's daily directories of every US-listed symbol
+SYMBOL_DIRECTORY_URLS = (
+    "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt",
+    "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt",
+)
+
+# Exchange codes used in otherlisted.txt
+EXCHANGE_NAMES = {
+    "A": "NYSE American",
+    "N": "NYSE",
+    "P": "NYSE Arca",
+    "Z": "Cboe BZX",
+    "V": "IEX",
+}
+
 class DataManager:
     def get_stock_data(self, ticker):
         stock = yf.Ticker(ticker)
@@ -20,3 +45,55 @@ class DataManager:
         """Fetches historical data for a single ticker."""
         stock = yf.Ticker(ticker)
         return stock.history(period=period)
+
+    def get_raw_history(self, ticker, period="1y", start=None):
+        """Fetches unadjusted daily bars with dividend and split columns.
+
+        Prices are not adjusted for dividends; yfinance still scales them
+        for splits within the download, which PriceStore undoes.
+        """
+        stock = yf.Ticker(ticker)
+        if start is not None:
+            return stock.history(start=start, auto_adjust=False, actions=True)
+        return stock.history(period=period, auto_adjust=False, actions=True)
+
+    def get_ticker_info(self, ticker):
+        """Fetches metadata (name, sector, exchange, ...) for a single ticker."""
+        return yf.Ticker(ticker).info
+
+    def get_symbol_directory(self, timeout=30):
+        """Downloads the directory of US-listed symbols as (symbol, name, exchange) tuples."""
+        symbols = []
+        for url in SYMBOL_DIRECTORY_URLS:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                symbols.extend(parse_symbol_directory(response.read().decode("utf-8", errors="replace")))
+        return symbols
+
+
+def parse_symbol_directory(text):
+    """Parses a pipe-delimited Nasdaq Trader symbol file into (symbol, name, exchange) tuples.
+
+    Test issues are skipped and class suffixes are written the way Yahoo
+    Finance expects them (BRK.B -> BRK-B).
+    """
+    lines = text.strip().splitlines()
+    if not lines:
+        return []
+    header = lines[0].split("|")
+    nasdaq = "Market Category" in header
+    symbol_column = header.index("Symbol" if nasdaq else "ACT Symbol")
+    name_column = header.index("Security Name")
+    test_column = header.index("Test Issue")
+    exchange_column = None if nasdaq else header.index("Exchange")
+
+    symbols = []
+    for line in lines[1:]:
+        fields = line.split("|")
+        if len(fields) < len(header) or fields[test_column] == "Y" or line.startswith("File Creation Time"):
+            continue
+        symbol = fields[symbol_column].strip()
+        if not symbol or "$" in symbol:
+            continue
+        exchange = "Nasdaq" if nasdaq else EXCHANGE_NAMES.get(fields[exchange_column], fields[exchange_column])
+        symbols.append((symbol.replace(".", "-"), fields[name_column].strip(), exchange))
+    return symbols
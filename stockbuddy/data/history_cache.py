@@ -0,0 +1,63 @@
+import threading
+import time
+
+
+class HistoryCache:
+    """Thread-safe cache of historical data keyed by ticker.
+
+    Every consumer that goes through the same cache shares one fetch per
+    ticker per refresh, instead of each widget or client calling the
+    provider on its own. With a PriceStore, only bars since the last stored
+    date are fetched and adjusted history is derived locally.
+    """
+
+    def __init__(self, data_manager, period="1y", max_age=60, price_store=None):
+        self.data_manager = data_manager
+        self.period = period
+        self.max_age = max_age
+        self.price_store = price_store
+        self._entries = {}  # ticker -> (fetched_at, historical_data)
+        self._lock = threading.Lock()
+
+    def peek(self, ticker):
+        """Returns the cached history for a ticker without fetching."""
+        with self._lock:
+            entry = self._entries.get(ticker)
+        return entry[1] if entry else None
+
+    def get(self, ticker, refresh=False):
+        """Returns the history for a ticker, fetching it when missing or stale."""
+        with self._lock:
+            entry = self._entries.get(ticker)
+        if entry and not refresh and time.monotonic() - entry[0] < self.max_age:
+            return entry[1]
+        return self._fetch(ticker, fallback=entry[1] if entry else None)
+
+    def refresh(self, tickers):
+        """Fetches every ticker once and returns a {ticker: history} dict."""
+        return {ticker: self.get(ticker, refresh=True) for ticker in tickers}
+
+    def discard(self, ticker):
+        """Drops a ticker from the cache."""
+        with self._lock:
+            self._entries.pop(ticker, None)
+
+    def tickers(self):
+        """Returns the tickers currently held in the cache."""
+        with self._lock:
+            return list(self._entries)
+
+    def _fetch(self, ticker, fallback=None):
+        try:
+            if self.price_store is not None:
+                data = self.price_store.sync(ticker, self.data_manager, period=self.period)
+            else:
+                data = self.data_manager.get_historical_data(ticker, period=self.period)
+        except Exception:
+            # Keep serving the last good history if the provider is unavailable
+            return fallback
+        if data is None or data.empty:
+            return fallback
+        with self._lock:
+            self._entries[ticker] = (time.monotonic(), data)
+        return data
@@ -0,0 +1,224 @@
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from stockbuddy.data.data_manager import DataManager
+
+logger = logging.getLogger(__name__)
+
+# Sector shown for instruments that have no GICS sector, by Yahoo quote type
+QUOTE_TYPE_SECTORS = {
+    "ETF": "ETF",
+    "MUTUALFUND": "Fund",
+    "INDEX": "Index",
+    "CRYPTOCURRENCY": "Crypto",
+    "CURRENCY": "Currency",
+    "FUTURE": "Futures",
+}
+
+UNKNOWN_SECTOR = "Unknown"
+
+
+def metadata_from_info(info):
+    """Reduces a yfinance Ticker.info dict to the fields StockBuddy uses."""
+    quote_type = info.get("quoteType")
+    return {
+        "name": info.get("longName") or info.get("shortName"),
+        "sector": info.get("sector") or QUOTE_TYPE_SECTORS.get(quote_type),
+        "industry": info.get("industry"),
+        "exchange": info.get("fullExchangeName") or info.get("exchange"),
+        "quote_type": quote_type,
+        "currency": info.get("currency"),
+    }
+
+
+class MetadataCache:
+    """Persistent TTL cache of per-ticker metadata (name, sector, exchange, ...).
+
+    Reads never block: `get()` returns whatever is cached, even if stale,
+    and queues a background fetch for missing or expired tickers.
+    `Ticker.info` is one slow request per symbol, so fetches run on a small
+    thread pool and the cache is written to disk once a batch finishes.
+    Failed lookups are remembered for `failure_ttl` so bad symbols are not
+    retried every refresh. Until a fetch lands, the name and exchange come
+    from the symbol index when one is given.
+    """
+
+    def __init__(self, data_manager=None, filename="metadata.json", ttl=7 * 86400, failure_ttl=3600,
+                 max_workers=4, symbol_index=None):
+        self.data_manager = data_manager or DataManager()
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.symbol_index = symbol_index
+        if filename is None:
+            self.filepath = None
+        else:
+            home_dir = os.path.expanduser("~")
+            app_dir = os.path.join(home_dir, ".stockbuddy")
+            os.makedirs(app_dir, exist_ok=True)
+            self.filepath = os.path.join(app_dir, filename)
+
+        self._entries = self.load()  # ticker -> metadata dict with "fetched_at" (and "error" on failure)
+        self._pending = {}     # ticker -> Future of a queued or running fetch
+        self._in_flight = 0    # fetches not yet fully finished (stored, announced and saved)
+        self._listeners = []
+        self._closed = False
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="metadata")
+
+    def load(self):
+        """Reads cached metadata from disk."""
+        if self.filepath is None:
+            return {}
+        try:
+            with open(self.filepath, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self):
+        """Writes cached metadata to disk."""
+        if self.filepath is None:
+            return
+        with self._lock:
+            data = json.dumps(self._entries, indent=4)
+        temporary = self.filepath + ".tmp"
+        with open(temporary, 'w') as f:
+            f.write(data)
+        os.replace(temporary, self.filepath)
+
+    def peek(self, ticker):
+        """Returns cached metadata without scheduling a fetch, or None."""
+        with self._lock:
+            entry = self._entries.get(ticker)
+        if entry is not None and not entry.get("error"):
+            return dict(entry)
+        if self.symbol_index is not None:
+            listed = self.symbol_index.lookup(ticker)
+            if listed is not None:
+                return {"name": listed["name"], "exchange": listed["exchange"], "sector": None}
+        return None
+
+    def get(self, ticker):
+        """Returns cached metadata (possibly stale) and fetches it in the background if needed."""
+        self.prefetch([ticker])
+        return self.peek(ticker)
+
+    def is_fresh(self, ticker):
+        with self._lock:
+            return self._is_fresh(self._entries.get(ticker), time.time())
+
+    def prefetch(self, tickers):
+        """Queues background fetches for every ticker that is missing or expired."""
+        now = time.time()
+        with self._lock:
+            if self._closed:
+                return []
+            queued = [
+                ticker for ticker in dict.fromkeys(tickers)
+                if ticker not in self._pending and not self._is_fresh(self._entries.get(ticker), now)
+            ]
+            self._in_flight += len(queued)
+            for ticker in queued:
+                self._pending[ticker] = self._executor.submit(self._fetch, ticker)
+        return queued
+
+    def wait(self, timeout=None):
+        """Blocks until every queued fetch has finished and been saved. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._in_flight, timeout)
+
+    def sector(self, ticker):
+        """Returns the cached sector for a ticker, or "Unknown"."""
+        metadata = self.peek(ticker)
+        return (metadata or {}).get("sector") or UNKNOWN_SECTOR
+
+    def sector_allocation(self, tickers, weights=None):
+        """Returns {sector: fraction} for the tickers from cached metadata only.
+
+        Tickers default to equal weights; `weights` maps ticker -> weight
+        (e.g. market value). Tickers without metadata yet count as "Unknown"
+        and are fetched in the background.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        self.prefetch(tickers)
+        totals = {}
+        for ticker in tickers:
+            weight = 1.0 if weights is None else float(weights.get(ticker, 0.0))
+            if weight:
+                sector = self.sector(ticker)
+                totals[sector] = totals.get(sector, 0.0) + weight
+        grand_total = sum(totals.values())
+        if not grand_total:
+            return {}
+        return {sector: total / grand_total
+                for sector, total in sorted(totals.items(), key=lambda item: item[1], reverse=True)}
+
+    def add_listener(self, callback):
+        """Registers a callable invoked with (ticker, metadata) from a worker thread when a fetch lands."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Unregisters a metadata listener."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def close(self):
+        """Stops the worker threads, dropping queued fetches; fetches already running finish."""
+        with self._idle:
+            self._closed = True
+            for ticker, future in list(self._pending.items()):
+                if future.cancel():
+                    del self._pending[ticker]
+                    self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.notify_all()
+        self._executor.shutdown(wait=False)
+
+    def _is_fresh(self, entry, now):
+        if entry is None:
+            return False
+        ttl = self.failure_ttl if entry.get("error") else self.ttl
+        return now - entry.get("fetched_at", 0) < ttl
+
+    def _fetch(self, ticker):
+        try:
+            info = self.data_manager.get_ticker_info(ticker)
+            metadata = metadata_from_info(info or {})
+            if not metadata["name"] and not metadata["quote_type"]:
+                raise ValueError(f"No metadata for '{ticker}'")
+            entry = dict(metadata, fetched_at=time.time())
+        except Exception as e:
+            logger.debug("Metadata lookup for %s failed: %s", ticker, e)
+            entry = {"fetched_at": time.time(), "error": True}
+
+        fetched = not entry.get("error")
+        with self._lock:
+            previous = self._entries.get(ticker)
+            if not fetched and previous is not None and not previous.get("error"):
+                # Keep serving the stale metadata and retry once failure_ttl has passed
+                entry = dict(previous, fetched_at=time.time() - self.ttl + self.failure_ttl)
+            self._entries[ticker] = entry
+            self._pending.pop(ticker, None)
+            finished_batch = not self._pending
+
+        if fetched:
+            for callback in list(self._listeners):
+                try:
+                    callback(ticker, dict(entry))
+                except Exception:
+                    logger.exception("Metadata listener failed")
+        if finished_batch:
+            try:
+                self.save()
+            except OSError:
+                logger.warning("Could not save the metadata cache", exc_info=True)
+
+        with self._idle:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.notify_all()
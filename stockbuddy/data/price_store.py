@@ -0,0 +1,296 @@
+import os
+import re
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close"]
+# yfinance period suffixes, e.g. "5d", "6mo", "1y"
+PERIOD_UNITS = {"d": "days", "wk": "weeks", "mo": "months", "y": "years"}
+
+
+class PriceStore:
+    """SQLite store of raw daily bars and corporate actions, with lazy adjustment.
+
+    Bars are kept unadjusted and dividends/splits are kept as separate
+    events. Adjusted history is derived on demand from cumulative
+    adjustment factors and cached, so a new split or dividend only appends
+    one event and recomputes the factors; years of bars never need to be
+    downloaded again.
+    """
+
+    def __init__(self, filename="prices.db"):
+        if filename == ":memory:":
+            self.filepath = filename
+        else:
+            home_dir = os.path.expanduser("~")
+            app_dir = os.path.join(home_dir, ".stockbuddy")
+            os.makedirs(app_dir, exist_ok=True)
+            self.filepath = os.path.join(app_dir, filename)
+
+        self._connection = sqlite3.connect(self.filepath, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._versions = {}  # ticker -> [bars version, actions version]
+        self._cache = {}     # ticker -> cached raw/adjusted frames and the versions they reflect
+        self._create_tables()
+
+    def _create_tables(self):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS bars ("
+                "ticker TEXT, date TEXT, open REAL, high REAL, low REAL, close REAL, volume REAL, "
+                "PRIMARY KEY (ticker, date))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS actions ("
+                "ticker TEXT, date TEXT, dividend REAL, split REAL, "
+                "PRIMARY KEY (ticker, date))"
+            )
+
+    def close(self):
+        self._connection.close()
+
+    # --- Writing ---
+
+    def sync(self, ticker, data_manager, period="1y"):
+        """Brings a ticker up to date and returns the last `period` of its adjusted history.
+
+        The first call downloads `period` of history; later calls only fetch
+        bars from the last stored date onwards. Older bars stay in the store
+        but are not returned, so the result does not grow day after day.
+        """
+        last_date = self.last_date(ticker)
+        if last_date is None:
+            history = data_manager.get_raw_history(ticker, period=period)
+        else:
+            history = data_manager.get_raw_history(ticker, start=last_date)
+        self.store_history(ticker, history)
+        return _trim_to_period(self.adjusted_history(ticker), period)
+
+    def store_history(self, ticker, history):
+        """Stores a yfinance history fetched with auto_adjust=False and actions=True.
+
+        yfinance scales prices, volumes and dividends for splits that
+        happened later in the same download; that scaling is undone here so
+        only raw values are stored.
+        """
+        if history is None or history.empty:
+            return
+
+        dates = _date_strings(history.index)
+        splits = history['Stock Splits'].to_numpy(dtype=float) if 'Stock Splits' in history else np.zeros(len(history))
+        splits = np.where(splits > 0, splits, 1.0)
+        # Product of the splits strictly after each bar within this download
+        later_splits = np.append(np.cumprod(splits[::-1])[::-1][1:], 1.0)
+
+        frame = pd.DataFrame({
+            column: history[column].to_numpy(dtype=float) * later_splits
+            if column in history else np.full(len(history), np.nan)
+            for column in PRICE_COLUMNS
+        })
+        frame['Volume'] = history['Volume'].to_numpy(dtype=float) / later_splits if 'Volume' in history else np.nan
+        frame.insert(0, 'date', dates)
+        frame.insert(0, 'ticker', ticker)
+        # NaN values are stored as NULL by SQLite
+        bars = list(frame[frame['Close'].notna()].itertuples(index=False, name=None))
+
+        actions = []
+        dividends = history['Dividends'].to_numpy(dtype=float) if 'Dividends' in history else np.zeros(len(history))
+        for i, date in enumerate(dates):
+            if dividends[i] > 0 or splits[i] != 1.0:
+                dividend = dividends[i] * later_splits[i] if dividends[i] > 0 else 0.0
+                actions.append((ticker, date, dividend, splits[i] if splits[i] != 1.0 else 0.0))
+
+        with self._lock:
+            self._write_bars(ticker, bars)
+            for action in actions:
+                self.add_action(*action)
+
+    def add_action(self, ticker, date, dividend=0.0, split=0.0):
+        """Records a dividend (per raw share) and/or split ratio on an ex-date."""
+        date = _date_strings(pd.DatetimeIndex([date]))[0]
+        with self._lock:
+            existing = self._connection.execute(
+                "SELECT dividend, split FROM actions WHERE ticker = ? AND date = ?", (ticker, date)
+            ).fetchone()
+            if existing is not None and np.allclose(existing, (dividend, split)):
+                return
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO actions VALUES (?, ?, ?, ?)", (ticker, date, dividend, split)
+                )
+            self._bump(ticker, actions=True)
+
+    def _write_bars(self, ticker, bars):
+        if not bars:
+            return
+        with self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?)", bars)
+        entry = self._entry(ticker)
+        first_date = min(bar[1] for bar in bars)
+        entry["dirty_since"] = min(entry.get("dirty_since", first_date), first_date)
+        self._bump(ticker, bars=True)
+
+    def _bump(self, ticker, bars=False, actions=False):
+        versions = self._versions.setdefault(ticker, [0, 0])
+        versions[0] += bars
+        versions[1] += actions
+
+    # --- Reading ---
+
+    def tickers(self):
+        with self._lock:
+            return [row[0] for row in self._connection.execute("SELECT DISTINCT ticker FROM bars ORDER BY ticker")]
+
+    def last_date(self, ticker):
+        """Returns the last stored bar date as 'YYYY-MM-DD', or None."""
+        with self._lock:
+            row = self._connection.execute("SELECT MAX(date) FROM bars WHERE ticker = ?", (ticker,)).fetchone()
+        return row[0]
+
+    def raw_history(self, ticker):
+        """Returns stored unadjusted bars as a DataFrame indexed by date."""
+        with self._lock:
+            entry = self._entry(ticker)
+            if entry.get("bars_version") != self._versions[ticker][0]:
+                entry["raw"] = self._read_bars(ticker, since=None)
+                entry["bars_version"] = self._versions[ticker][0]
+            return entry["raw"]
+
+    def actions(self, ticker):
+        """Returns stored dividends and splits as a DataFrame indexed by ex-date."""
+        with self._lock:
+            frame = pd.read_sql_query(
+                "SELECT date, dividend AS Dividends, split AS \"Stock Splits\" FROM actions "
+                "WHERE ticker = ? ORDER BY date", self._connection, params=(ticker,), index_col="date"
+            )
+        frame.index = pd.DatetimeIndex(frame.index)
+        return frame
+
+    def adjustment_factors(self, ticker):
+        """Returns (price factor, volume factor) arrays aligned with raw_history()."""
+        with self._lock:
+            entry = self._entry(ticker)
+            raw = self.raw_history(ticker)
+            key = (self._versions[ticker][0], self._versions[ticker][1])
+            if entry.get("factors_key") != key:
+                entry["factors"] = _cumulative_factors(raw, self.actions(ticker))
+                entry["factors_key"] = key
+            return entry["factors"]
+
+    def adjusted_history(self, ticker):
+        """Returns split- and dividend-adjusted bars, equivalent to yfinance's auto_adjust=True.
+
+        The result is cached. New bars without new corporate actions are
+        appended to the cached frame; a new action recomputes the factors
+        from the stored raw bars.
+        """
+        with self._lock:
+            entry = self._entry(ticker)
+            bars_version, actions_version = self._versions[ticker]
+            cached = entry.get("adjusted")
+
+            if cached is not None and entry.get("adjusted_key") == (bars_version, actions_version):
+                return cached
+
+            if cached is not None and len(cached) and entry["adjusted_key"][1] == actions_version:
+                # Only recent bars changed: factors of earlier bars are unaffected,
+                # and bars on or after the last ex-date have a factor of exactly one
+                last_action = self._last_action_date(ticker)
+                tail_start = cached.index[-1]
+                if (pd.Timestamp(entry.get("dirty_since", tail_start)) >= tail_start
+                        and (last_action is None or pd.Timestamp(last_action) <= tail_start)):
+                    fresh = self._read_bars(ticker, since=tail_start)
+                    adjusted = pd.concat([cached[cached.index < tail_start], fresh])
+                    self._remember_adjusted(entry, adjusted, bars_version, actions_version)
+                    return adjusted
+
+            raw = self.raw_history(ticker)
+            price_factor, volume_factor = self.adjustment_factors(ticker)
+            adjusted = raw.copy()
+            for column in PRICE_COLUMNS:
+                adjusted[column] = raw[column].to_numpy() * price_factor
+            adjusted['Volume'] = raw['Volume'].to_numpy() * volume_factor
+            self._remember_adjusted(entry, adjusted, bars_version, actions_version)
+            return adjusted
+
+    def _remember_adjusted(self, entry, adjusted, bars_version, actions_version):
+        entry["adjusted"] = adjusted
+        entry["adjusted_key"] = (bars_version, actions_version)
+        entry.pop("dirty_since", None)
+
+    def _entry(self, ticker):
+        self._versions.setdefault(ticker, [0, 0])
+        return self._cache.setdefault(ticker, {})
+
+    def _last_action_date(self, ticker):
+        row = self._connection.execute("SELECT MAX(date) FROM actions WHERE ticker = ?", (ticker,)).fetchone()
+        return row[0]
+
+    def _read_bars(self, ticker, since=None):
+        query = "SELECT date, open AS Open, high AS High, low AS Low, close AS Close, volume AS Volume FROM bars WHERE ticker = ?"
+        params = [ticker]
+        if since is not None:
+            query += " AND date >= ?"
+            params.append(_date_strings(pd.DatetimeIndex([since]))[0])
+        frame = pd.read_sql_query(query + " ORDER BY date", self._connection, params=params, index_col="date")
+        frame.index = pd.DatetimeIndex(frame.index)
+        return frame
+
+
+def _cumulative_factors(raw, actions):
+    """Computes per-bar price and volume adjustment factors.
+
+    A split of ratio s divides earlier prices by s (and multiplies earlier
+    volumes by s). A dividend D scales earlier prices by 1 - D / C, where C
+    is the raw close on the bar before the ex-date. Each bar's factor is
+    the product over all events after it.
+    """
+    count = len(raw)
+    price_events = np.ones(count + 1)
+    volume_events = np.ones(count + 1)
+    if count == 0:
+        return price_events[:0], volume_events[:0]
+
+    close = raw['Close'].to_numpy()
+    positions = np.searchsorted(raw.index.to_numpy(), actions.index.to_numpy(), side="left")
+    for position, dividend, split in zip(positions, actions['Dividends'], actions['Stock Splits']):
+        if split and split > 0:
+            price_events[position] /= split
+            volume_events[position] *= split
+        if dividend and dividend > 0 and position > 0:
+            previous_close = close[position - 1]
+            if split and split > 0:
+                # The dividend is per post-split share
+                previous_close = previous_close / split
+            if previous_close > 0:
+                price_events[position] *= 1 - dividend / previous_close
+
+    # factor[t] = product of events at positions t+1 .. count
+    price_factor = np.cumprod(price_events[::-1])[::-1][1:]
+    volume_factor = np.cumprod(volume_events[::-1])[::-1][1:]
+    return price_factor, volume_factor
+
+
+def _trim_to_period(history, period):
+    """Returns the bars within `period` (a yfinance period string) of the last bar."""
+    if not len(history) or period == "max":
+        return history
+    last = history.index[-1]
+    if period == "ytd":
+        start = pd.Timestamp(year=last.year, month=1, day=1)
+    else:
+        match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+        if match is None:
+            raise ValueError(f"Unknown period '{period}'")
+        start = last - pd.DateOffset(**{PERIOD_UNITS[match.group(2)]: int(match.group(1))})
+    return history.iloc[history.index.searchsorted(start, side="right"):]
+
+
+def _date_strings(index):
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return list(index.strftime("%Y-%m-%d"))
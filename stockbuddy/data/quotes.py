@@ -0,0 +1,29 @@
+import pandas as pd
+
+
+def summarize_quote(historical_data):
+    """Returns price, change, % change and volume from the last two bars.
+
+    Raises ValueError when there is no data or the last bar has no close or
+    volume, so callers never publish NaN prices.
+    """
+    if historical_data is None or historical_data.empty:
+        raise ValueError("No data returned")
+
+    latest_row = historical_data.iloc[-1]
+    price = latest_row['Close']
+    volume = latest_row['Volume']
+    if pd.isna(price) or pd.isna(volume):
+        raise ValueError("Last bar has no close or volume")
+    previous_closes = historical_data['Close'].iloc[:-1].dropna()
+    open_price = previous_closes.iloc[-1] if len(previous_closes) else price
+
+    change = price - open_price
+    percent_change = (change / open_price) * 100 if open_price != 0 else 0
+
+    return {
+        "price": float(price),
+        "change": float(change),
+        "percent_change": float(percent_change),
+        "volume": int(volume),
+    }
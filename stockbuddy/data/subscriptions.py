@@ -0,0 +1,111 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SubscriptionManager:
+    """Reference-counted set of tickers shared by every open watchlist.
+
+    Each owner (e.g. a watchlist name) subscribes to the tickers it shows.
+    A ticker stays subscribed while at least one owner holds it, so the
+    data layer fetches it once per cycle no matter how many lists contain
+    it. Listeners are told which tickers entered or left the set.
+    """
+
+    def __init__(self):
+        self._owners = {}  # owner -> {ticker: None}, in subscription order
+        self._counts = {}  # ticker -> number of owners, in subscription order
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def tickers(self):
+        """Returns every subscribed ticker in the order it was first subscribed."""
+        with self._lock:
+            return list(self._counts)
+
+    def refcount(self, ticker):
+        """Returns how many owners hold a ticker."""
+        with self._lock:
+            return self._counts.get(ticker, 0)
+
+    def owners(self):
+        """Returns the owners holding at least one subscription."""
+        with self._lock:
+            return [owner for owner, tickers in self._owners.items() if tickers]
+
+    def subscribe(self, owner, tickers):
+        """Adds tickers for an owner and returns those that are newly subscribed."""
+        with self._lock:
+            added = self._add(owner, tickers)
+        self._notify(added, [])
+        return added
+
+    def unsubscribe(self, owner, tickers):
+        """Drops tickers for an owner and returns those no longer subscribed by anyone."""
+        with self._lock:
+            removed = self._remove(owner, tickers)
+        self._notify([], removed)
+        return removed
+
+    def set_subscriptions(self, owner, tickers):
+        """Replaces an owner's tickers and returns (newly subscribed, no longer subscribed)."""
+        tickers = list(dict.fromkeys(tickers))
+        with self._lock:
+            held = self._owners.get(owner, {})
+            removed = self._remove(owner, [ticker for ticker in held if ticker not in tickers])
+            added = self._add(owner, tickers)
+        self._notify(added, removed)
+        return added, removed
+
+    def release(self, owner):
+        """Drops every subscription an owner holds, e.g. when its watchlist closes."""
+        with self._lock:
+            removed = self._remove(owner, list(self._owners.get(owner, ())))
+            self._owners.pop(owner, None)
+        self._notify([], removed)
+        return removed
+
+    def add_listener(self, callback):
+        """Registers a callable invoked with (added, removed) ticker lists on every change."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Unregisters a change listener."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _add(self, owner, tickers):
+        held = self._owners.setdefault(owner, {})
+        added = []
+        for ticker in tickers:
+            if ticker in held:
+                continue
+            held[ticker] = None
+            count = self._counts.get(ticker, 0)
+            self._counts[ticker] = count + 1
+            if count == 0:
+                added.append(ticker)
+        return added
+
+    def _remove(self, owner, tickers):
+        held = self._owners.get(owner, {})
+        removed = []
+        for ticker in tickers:
+            if ticker not in held:
+                continue
+            del held[ticker]
+            self._counts[ticker] -= 1
+            if self._counts[ticker] == 0:
+                del self._counts[ticker]
+                removed.append(ticker)
+        return removed
+
+    def _notify(self, added, removed):
+        if not added and not removed:
+            return
+        for callback in list(self._listeners):
+            try:
+                callback(added, removed)
+            except Exception:
+                logger.exception("Subscription listener failed")
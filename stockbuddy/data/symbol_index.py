@@ -0,0 +1,158 @@
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+
+from stockbuddy.data.data_manager import DataManager, INDEX_TICKERS
+
+logger = logging.getLogger(__name__)
+
+
+class SymbolIndex:
+    """Local, sorted directory of listed symbols for validation and autocomplete.
+
+    The directory is loaded from a JSON file in the app directory and
+    refreshed in a background thread once it is older than `ttl`, so
+    lookups never wait on the network. Symbols and lower-cased names are
+    kept in sorted lists and prefix queries are answered with bisect.
+    """
+
+    def __init__(self, data_manager=None, filename="symbols.json", ttl=86400):
+        self.data_manager = data_manager or DataManager()
+        self.ttl = ttl
+        if filename is None:
+            self.filepath = None
+        else:
+            home_dir = os.path.expanduser("~")
+            app_dir = os.path.join(home_dir, ".stockbuddy")
+            os.makedirs(app_dir, exist_ok=True)
+            self.filepath = os.path.join(app_dir, filename)
+
+        self.fetched_at = 0.0
+        # (sorted symbols, sorted (lower-cased name, symbol), {symbol: (name, exchange)}),
+        # replaced as a whole so readers on other threads never see a partial index
+        self._index = ([], [], {})
+        self._refresh_thread = None
+        self._lock = threading.Lock()
+        self.load()
+
+    def __len__(self):
+        return len(self._index[0])
+
+    def __contains__(self, symbol):
+        return symbol in self._index[2]
+
+    def is_loaded(self):
+        return bool(self._index[0])
+
+    def is_stale(self):
+        return time.time() - self.fetched_at >= self.ttl
+
+    def load(self):
+        """Reads the cached directory from disk, if there is one."""
+        if self.filepath is None:
+            return
+        try:
+            with open(self.filepath, 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self._set_symbols(data.get("symbols", []), data.get("fetched_at", 0.0))
+
+    def save(self):
+        """Writes the directory to disk."""
+        if self.filepath is None:
+            return
+        symbols, _, entries = self._index
+        data = {
+            "fetched_at": self.fetched_at,
+            "symbols": [[symbol, *entries[symbol]] for symbol in symbols],
+        }
+        temporary = self.filepath + ".tmp"
+        with open(temporary, 'w') as f:
+            json.dump(data, f)
+        os.replace(temporary, self.filepath)
+
+    def refresh(self):
+        """Downloads the directory (blocking) and saves it."""
+        symbols = self.data_manager.get_symbol_directory()
+        if symbols:
+            self._set_symbols(symbols, time.time())
+            self.save()
+
+    def refresh_in_background(self, force=False):
+        """Starts a background download when the directory is missing or stale."""
+        with self._lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return self._refresh_thread
+            if not force and not self.is_stale():
+                return None
+            self._refresh_thread = threading.Thread(target=self._refresh_quietly, name="symbol-index", daemon=True)
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+    def lookup(self, symbol):
+        """Returns {"symbol", "name", "exchange"} for a listed symbol, or None."""
+        entry = self._index[2].get(symbol.strip().upper())
+        if entry is None:
+            return None
+        return {"symbol": symbol.strip().upper(), "name": entry[0], "exchange": entry[1]}
+
+    def validate(self, symbol):
+        """Checks a symbol against the local directory without touching the network.
+
+        Returns True if it is listed, False if it is not, and None when the
+        directory cannot tell: it has not been downloaded yet, or the symbol
+        is an index, currency, crypto or foreign listing that it does not cover.
+        """
+        symbol = symbol.strip().upper()
+        if not symbol:
+            return False
+        symbols, _, entries = self._index
+        if symbol in entries or symbol in INDEX_TICKERS:
+            return True
+        if not symbols or any(mark in symbol for mark in ("^", "=", ".")) or symbol.endswith("-USD"):
+            return None
+        return False
+
+    def complete(self, prefix, limit=10):
+        """Returns up to `limit` (symbol, name) pairs whose symbol, then name, starts with `prefix`."""
+        prefix = prefix.strip()
+        if not prefix:
+            return []
+        symbols, names, entries = self._index
+
+        matches = []
+        upper = prefix.upper()
+        start = bisect.bisect_left(symbols, upper)
+        for symbol in symbols[start:start + limit]:
+            if not symbol.startswith(upper):
+                break
+            matches.append((symbol, entries[symbol][0]))
+
+        if len(matches) < limit:
+            seen = {symbol for symbol, _ in matches}
+            lower = prefix.lower()
+            position = bisect.bisect_left(names, (lower,))
+            while position < len(names) and len(matches) < limit:
+                name, symbol = names[position]
+                if not name.startswith(lower):
+                    break
+                if symbol not in seen:
+                    matches.append((symbol, entries[symbol][0]))
+                position += 1
+        return matches
+
+    def _set_symbols(self, symbols, fetched_at):
+        entries = {symbol: (name, exchange) for symbol, name, exchange in symbols}
+        names = sorted((name.lower(), symbol) for symbol, (name, _) in entries.items())
+        self._index = (sorted(entries), names, entries)
+        self.fetched_at = fetched_at
+
+    def _refresh_quietly(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.warning("Could not download the symbol directory: %s", e)
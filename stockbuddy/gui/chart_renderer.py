@@ -0,0 +1,208 @@
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from stockbuddy.core.downsampling import DecimatedSeries
+
+NANOSECONDS_PER_DAY = 86400 * 10 ** 9
+
+
+class _ChartState:
+    def __init__(self, figure, axes):
+        self.figure = figure
+        self.axes = axes
+        self.title = None
+        self.lines = {}   # series name -> Line2D
+        self.series = {}  # series name -> DecimatedSeries
+        self.length = 0
+        self.first_index = None
+        self.last_index = None
+        self.last_close = None
+        self.version = None
+
+
+class ChartRenderer:
+    """Builds price + SMA overlay charts with matplotlib, sized for small dashboard tiles.
+
+    Histories are decimated to the chart's pixel width with min/max
+    buckets, so drawing cost does not grow with the number of bars. Each
+    ticker keeps one Figure: when the same data version is requested again
+    it is returned untouched, and when new bars arrive only those bars are
+    pushed into the decimated series before the line data is replaced.
+    Bars dropping off the front, as in a rolling one-year window, are
+    trimmed from the series the same way.
+
+    The figures have an Agg canvas attached; a Qt widget can wrap them in a
+    FigureCanvasQTAgg instead.
+    """
+
+    def __init__(self, width=320, height=160, dpi=100, sma_windows=(50, 200), cache_size=64, show_ticks=False):
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        # Tick labels are re-laid out on every autoscale and dominate the draw time of a tile
+        self.show_ticks = show_ticks
+        self.sma_windows = tuple(sma_windows)
+        self.cache_size = cache_size
+        self.max_points = 2 * width  # one min/max pair per pixel column
+        self._charts = OrderedDict()
+
+    def figure(self, ticker, history, version=None):
+        """Returns (figure, changed) with an up to date figure for a ticker's history.
+
+        `version` identifies the data (e.g. a snapshot version); when it is
+        omitted, the length, last date and last close are used. `changed` is
+        False when the cached figure already showed this version, so the
+        caller can skip redrawing it.
+        """
+        if version is None:
+            version = _data_version(history)
+
+        state = self._charts.get(ticker)
+        if state is not None:
+            self._charts.move_to_end(ticker)
+            if state.version == version:
+                return state.figure, False
+        else:
+            state = self._create(ticker)
+
+        if not self._extend(state, history):
+            self._rebuild(state, history)
+        state.version = version
+        self._finish(ticker, state, history)
+        return state.figure, True
+
+    def invalidate(self, ticker=None):
+        """Drops cached figures for one ticker, or all of them."""
+        if ticker is None:
+            self._charts.clear()
+        else:
+            self._charts.pop(ticker, None)
+
+    def _create(self, ticker):
+        figure = Figure(figsize=(self.width / self.dpi, self.height / self.dpi), dpi=self.dpi)
+        FigureCanvasAgg(figure)
+        axes = figure.add_axes([0.02, 0.04, 0.96, 0.80])
+        axes.set_xticks([])
+        if self.show_ticks:
+            axes.tick_params(axis="y", labelsize=7, pad=1)
+            axes.yaxis.tick_right()
+        else:
+            axes.set_yticks([])
+        for side in ("top", "left"):
+            axes.spines[side].set_visible(False)
+
+        state = _ChartState(figure, axes)
+        state.lines["Close"] = axes.plot([], [], color="#1f77b4", linewidth=1.0)[0]
+        for window, color in zip(self.sma_windows, ("#ff7f0e", "#7f7f7f", "#2ca02c")):
+            state.lines[f"SMA {window}"] = axes.plot([], [], color=color, linewidth=0.8)[0]
+        state.title = axes.set_title(ticker, fontsize=8, loc="left", pad=2)
+
+        self._charts[ticker] = state
+        while len(self._charts) > self.cache_size:
+            self._charts.popitem(last=False)
+        return state
+
+    def _rebuild(self, state, history):
+        x, close = _history_arrays(history)
+        state.series = {name: DecimatedSeries(self.max_points) for name in state.lines}
+        state.series["Close"].extend(x, close)
+        for window in self.sma_windows:
+            state.series[f"SMA {window}"].extend(x, _sma_tail(close, window, 0))
+        state.length = len(close)
+
+    def _extend(self, state, history):
+        """Applies only the bars added (or revised) since the last render, and drops bars that slid out."""
+        if not state.length or not len(history):
+            return False
+        first = history.index[0]
+        if first == state.first_index:
+            last = state.length - 1
+        elif (first > state.first_index and _is_datetime(history.index)
+              and len(history) >= max(self.sma_windows, default=1)):
+            last = int(history.index.searchsorted(state.last_index))
+        else:
+            return False
+        if last >= len(history) or history.index[last] != state.last_index:
+            return False
+
+        if first != state.first_index:
+            self._drop_front(state, history)
+        x, close = _history_arrays(history, start=last)
+        revised = close[0] != state.last_close
+        if revised:
+            state.series["Close"].update_last(close[0])
+        state.series["Close"].extend(x[1:], close[1:])
+
+        closes = history['Close'].to_numpy(dtype=float)
+        start = last if revised else last + 1
+        for window in self.sma_windows:
+            sma = _sma_tail(closes, window, start)
+            series = state.series[f"SMA {window}"]
+            if revised:
+                series.update_last(sma[0])
+                sma = sma[1:]
+            series.extend(x[1:], sma)
+        state.length = len(closes)
+        return True
+
+    def _drop_front(self, state, history):
+        # Only the bucket straddling the new first bar needs original points
+        size = max(series.bucket_size for series in state.series.values())
+        x, close = _history_arrays(history.iloc[:size + max(self.sma_windows, default=1)])
+        state.series["Close"].drop_before(x[0], x, close)
+        for window in self.sma_windows:
+            # A full render leaves the first window - 1 bars without an SMA
+            state.series[f"SMA {window}"].drop_before(x[window - 1], x[window - 1:], _sma_tail(close, window, window - 1))
+
+    def _finish(self, ticker, state, history):
+        for name, line in state.lines.items():
+            line.set_data(*state.series[name].points())
+        state.axes.relim()
+        state.axes.autoscale_view()
+
+        if len(history):
+            state.first_index = history.index[0]
+            state.last_index = history.index[-1]
+            state.last_close = float(history['Close'].iloc[-1])
+            first = float(history['Close'].iloc[0])
+            change = (state.last_close / first - 1) * 100 if first else 0.0
+            state.title.set_text(f"{ticker}  {state.last_close:.2f}  ({change:+.1f}%)")
+            state.title.set_color("#2ca02c" if change >= 0 else "#d62728")
+
+
+def _history_arrays(history, start=0):
+    """Returns (x, close) from `start`, with x in matplotlib date units when possible."""
+    tail = history.iloc[start:]
+    close = tail['Close'].to_numpy(dtype=float)
+    index = tail.index
+    if _is_datetime(index):
+        x = index.asi8 / NANOSECONDS_PER_DAY  # days since 1970-01-01, matplotlib's default epoch
+    else:
+        x = np.arange(start, start + len(close), dtype=float)
+    return x, close
+
+
+def _is_datetime(index):
+    return hasattr(index, "asi8") and getattr(index, "inferred_type", "") in ("datetime64", "datetime")
+
+
+def _sma_tail(close, window, start):
+    """Returns the SMA of `close` for positions start..end, computed from a prefix sum of the tail."""
+    begin = max(0, start - window + 1)
+    segment = close[begin:]
+    sums = np.concatenate(([0.0], np.cumsum(segment)))
+    positions = np.arange(start, len(close)) - begin  # position within the segment
+    out = np.full(len(positions), np.nan)
+    ready = positions >= window - 1
+    ends = positions[ready] + 1
+    out[ready] = (sums[ends] - sums[ends - window]) / window
+    return out
+
+
+def _data_version(history):
+    if not len(history):
+        return (0,)
+    return (len(history), history.index[-1], float(history['Close'].iloc[-1]))
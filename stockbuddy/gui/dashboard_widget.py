@@ -1,9 +1,107 @@
-from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
+from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QGridLayout
+from PyQt5.QtCore import QTimer, pyqtSignal
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+from matplotlib.figure import Figure
+
+from stockbuddy.gui.chart_renderer import ChartRenderer
 
 class DashboardWidget(QWidget):
-    def __init__(self):
+    # Emitted from metadata worker threads; handled on the GUI thread
+    metadata_updated = pyqtSignal()
+
+    def __init__(self, columns=5, max_charts=50, metadata_cache=None):
         super().__init__()
+        self.columns = columns
+        self.max_charts = max_charts
+        self.chart_renderer = ChartRenderer(cache_size=max_charts * 2)
+        self.canvases = {}  # ticker -> FigureCanvasQTAgg
+        self.metadata_cache = metadata_cache
+        self.allocation_tickers = []
+        self.allocation = None
+
         layout = QVBoxLayout()
         label = QLabel("Dashboard View")
         layout.addWidget(label)
+
+        # --- Sector Allocation ---
+        self.allocation_figure = Figure(figsize=(4.8, 2.4), dpi=100)
+        self.allocation_canvas = FigureCanvasQTAgg(self.allocation_figure)
+        self.allocation_canvas.setFixedSize(480, 240)
+        self.allocation_canvas.setVisible(False)
+        layout.addWidget(self.allocation_canvas)
+
+        # Metadata arrives one ticker at a time; redraw at most a few times a second
+        self.allocation_timer = QTimer()
+        self.allocation_timer.setSingleShot(True)
+        self.allocation_timer.setInterval(250)
+        self.allocation_timer.timeout.connect(self.render_allocation)
+        self.metadata_updated.connect(self.allocation_timer.start)
+        if metadata_cache is not None:
+            metadata_cache.add_listener(lambda ticker, metadata: self.metadata_updated.emit())
+
+        self.placeholder_label = QLabel("Add stocks to the watchlist to see quick charts here.")
+        self.placeholder_label.setStyleSheet("font-style: italic; color: grey;")
+        layout.addWidget(self.placeholder_label)
+
+        # --- Quick Charts Grid ---
+        self.chart_grid = QGridLayout()
+        layout.addLayout(self.chart_grid)
+        layout.addStretch()
         self.setLayout(layout)
+
+    def update_charts(self, histories):
+        """Shows a mini chart per ticker, redrawing only charts whose data changed."""
+        available = [ticker for ticker, data in histories.items() if data is not None and not data.empty]
+        tickers = available[:self.max_charts]
+
+        # Drop charts for tickers that are gone
+        for ticker in list(self.canvases):
+            if ticker not in tickers:
+                canvas = self.canvases.pop(ticker)
+                self.chart_grid.removeWidget(canvas)
+                canvas.deleteLater()
+
+        for position, ticker in enumerate(tickers):
+            figure, changed = self.chart_renderer.figure(ticker, histories[ticker])
+            canvas = self.canvases.get(ticker)
+            if canvas is None or canvas.figure is not figure:
+                if canvas is not None:
+                    self.chart_grid.removeWidget(canvas)
+                    canvas.deleteLater()
+                canvas = FigureCanvasQTAgg(figure)
+                canvas.setFixedSize(self.chart_renderer.width, self.chart_renderer.height)
+                self.canvases[ticker] = canvas
+            elif changed:
+                canvas.draw_idle()
+            self.chart_grid.addWidget(canvas, position // self.columns, position % self.columns)
+
+        self.placeholder_label.setVisible(not tickers)
+        self.update_allocation(available)
+
+    def update_allocation(self, tickers):
+        """Shows the sector allocation of the tickers (equal weights) from cached metadata."""
+        self.allocation_tickers = list(tickers)
+        self.render_allocation()
+
+    def render_allocation(self):
+        if self.metadata_cache is None:
+            return
+        allocation = self.metadata_cache.sector_allocation(self.allocation_tickers)
+        if allocation == self.allocation:
+            return
+        self.allocation = allocation
+        self.allocation_canvas.setVisible(bool(allocation))
+        if not allocation:
+            return
+
+        self.allocation_figure.clear()
+        axes = self.allocation_figure.add_axes([0.0, 0.05, 0.5, 0.9])
+        wedges, _ = axes.pie(list(allocation.values()), startangle=90, counterclock=False,
+                             wedgeprops={"linewidth": 0.5, "edgecolor": "white"})
+        axes.set_aspect("equal")
+        self.allocation_figure.legend(
+            wedges, [f"{sector}  {share:.0%}" for sector, share in allocation.items()],
+            loc="center left", bbox_to_anchor=(0.5, 0.5), frameon=False, fontsize=8,
+            title="Sector Allocation", title_fontsize=9,
+        )
+        self.allocation_canvas.draw_idle()
@@ -1,27 +1,67 @@
 from datetime import datetime
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QLabel,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QLabel, QInputDialog, QTabBar, QCompleter,
                              QPushButton, QTableWidget, QTableWidgetItem, QAbstractItemView, QMessageBox)
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QStringListModel, QTimer, pyqtSignal
 from stockbuddy.core.preset_manager import PresetManager
 from stockbuddy.core.settings_manager import SettingsManager
+from stockbuddy.core.watchlist_manager import WatchlistManager
 from stockbuddy.data.data_manager import DataManager
-from stockbuddy.core.recommendation_engine import RecommendationEngine
+from stockbuddy.data.subscriptions import SubscriptionManager
+from stockbuddy.service.signal_service import SignalService
+
+class SymbolCompleter(QCompleter):
+    """Popup of "SYMBOL  Name" suggestions that inserts only the symbol."""
+
+    def pathFromIndex(self, index):
+        return super().pathFromIndex(index).split("  ", 1)[0]
 
 class WatchlistWidget(QWidget):
-    def __init__(self, settings_manager: SettingsManager, preset_manager: PresetManager):
+    # Emitted after each refresh with {ticker: historical DataFrame} for the current list
+    histories_updated = pyqtSignal(dict)
+
+    def __init__(self, settings_manager: SettingsManager, preset_manager: PresetManager, alert_engine=None,
+                 watchlist_manager: WatchlistManager = None, symbol_index=None, metadata_cache=None):
         super().__init__()
         self.settings_manager = settings_manager
         self.preset_manager = preset_manager
-        self.tickers = [] # Manage tickers directly in the widget
+        self.alert_engine = alert_engine
+        self.watchlist_manager = watchlist_manager or WatchlistManager()
+        self.symbol_index = symbol_index
+        self.metadata_cache = metadata_cache
+        # One subscription set across every open list, so shared tickers are fetched once
+        self.subscriptions = SubscriptionManager()
+        if metadata_cache is not None:
+            self.subscriptions.add_listener(lambda added, removed: metadata_cache.prefetch(added))
         self.data_manager = DataManager()
-        self.recommendation_engine = RecommendationEngine()
+        self.service = SignalService(self.data_manager, preset_manager, subscriptions=self.subscriptions)
+        self.recommendation_engine = self.service.recommendation_engine
 
         layout = QVBoxLayout(self)
 
+        # --- Watchlist Tabs ---
+        list_layout = QHBoxLayout()
+        self.list_tabs = QTabBar()
+        self.list_tabs.setTabsClosable(True)
+        self.list_tabs.setExpanding(False)
+        self.new_list_button = QPushButton("New List")
+        self.open_list_button = QPushButton("Open List")
+        self.delete_list_button = QPushButton("Delete List")
+
+        list_layout.addWidget(self.list_tabs, 1)
+        list_layout.addWidget(self.new_list_button)
+        list_layout.addWidget(self.open_list_button)
+        list_layout.addWidget(self.delete_list_button)
+        layout.addLayout(list_layout)
+
         # --- Input and Buttons ---
         input_layout = QHBoxLayout()
         self.ticker_input = QLineEdit()
         self.ticker_input.setPlaceholderText("Enter Ticker Symbol (e.g., AAPL)")
+        # Suggestions come from the local symbol index, never from the network
+        self.completer_model = QStringListModel()
+        self.completer = SymbolCompleter(self.completer_model, self)
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.ticker_input.setCompleter(self.completer)
         self.add_button = QPushButton("Add Stock")
         self.remove_button = QPushButton("Remove Selected")
 
@@ -50,10 +90,24 @@ class WatchlistWidget(QWidget):
 
         self.setLayout(layout)
 
+        # --- Open the lists that were open last time ---
+        open_lists = self.settings_manager.get_setting("open_watchlists")
+        if open_lists is None:
+            open_lists = self.watchlist_manager.get_names()
+        for name in open_lists:
+            if self.watchlist_manager.get_watchlist(name) is not None:
+                self._add_tab(name)
+
         # --- Connect Signals ---
         self.add_button.clicked.connect(self.add_stock)
         self.remove_button.clicked.connect(self.remove_stock)
         self.ticker_input.returnPressed.connect(self.add_stock)
+        self.ticker_input.textEdited.connect(self.update_suggestions)
+        self.new_list_button.clicked.connect(self.new_watchlist)
+        self.open_list_button.clicked.connect(self.choose_watchlist)
+        self.delete_list_button.clicked.connect(self.delete_watchlist)
+        self.list_tabs.tabCloseRequested.connect(self.close_watchlist)
+        self.list_tabs.currentChanged.connect(self.render_watchlist)
 
         # --- Timer for Updates ---
         self.timer = QTimer()
@@ -63,15 +117,109 @@ class WatchlistWidget(QWidget):
         # Initial load
         self.update_watchlist()
 
+    @property
+    def tickers(self):
+        """Tickers of the current list."""
+        name = self.current_watchlist()
+        return self.watchlist_manager.get_watchlist(name) or [] if name else []
+
+    def current_watchlist(self):
+        index = self.list_tabs.currentIndex()
+        return self.list_tabs.tabData(index) if index >= 0 else None
+
+    def open_watchlists(self):
+        return [self.list_tabs.tabData(i) for i in range(self.list_tabs.count())]
+
+    # --- Lists ---
+
+    def new_watchlist(self):
+        name, ok = QInputDialog.getText(self, "New Watchlist", "Name:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        if self.watchlist_manager.get_watchlist(name) is not None:
+            QMessageBox.information(self, "Watchlist Exists", f"'{name}' already exists.")
+            return
+        self.watchlist_manager.create_watchlist(name)
+        self.open_watchlist(name)
+
+    def choose_watchlist(self):
+        closed = [name for name in self.watchlist_manager.get_names() if name not in self.open_watchlists()]
+        if not closed:
+            QMessageBox.information(self, "Open Watchlist", "Every watchlist is already open.")
+            return
+        name, ok = QInputDialog.getItem(self, "Open Watchlist", "Watchlist:", closed, 0, False)
+        if ok:
+            self.open_watchlist(name)
+
+    def open_watchlist(self, name):
+        """Shows a saved watchlist in a tab and subscribes to its tickers."""
+        if name in self.open_watchlists():
+            self.list_tabs.setCurrentIndex(self.open_watchlists().index(name))
+            return
+        added = self._add_tab(name)
+        self._save_open_watchlists()
+        self.list_tabs.setCurrentIndex(self.list_tabs.count() - 1)
+        if added:
+            self.refresh_new_tickers()
+
+    def close_watchlist(self, index):
+        """Closes a list's tab; its tickers stay saved but are no longer fetched unless another open list has them."""
+        name = self.list_tabs.tabData(index)
+        self.subscriptions.release(name)
+        self.list_tabs.removeTab(index)
+        self._save_open_watchlists()
+        self.render_watchlist()
+
+    def delete_watchlist(self):
+        name = self.current_watchlist()
+        if not name:
+            return
+        reply = QMessageBox.question(self, "Delete Watchlist", f"Delete '{name}'?")
+        if reply == QMessageBox.Yes:
+            self.close_watchlist(self.list_tabs.currentIndex())
+            self.watchlist_manager.delete_watchlist(name)
+
+    def _add_tab(self, name):
+        self.list_tabs.setTabData(self.list_tabs.addTab(name), name)
+        return self.subscriptions.subscribe(name, self.watchlist_manager.get_watchlist(name))
+
+    def _save_open_watchlists(self):
+        self.settings_manager.set_setting("open_watchlists", self.open_watchlists())
+
+    # --- Tickers ---
+
+    def update_suggestions(self, text):
+        if self.symbol_index is None:
+            return
+        self.completer_model.setStringList(
+            [f"{symbol}  {name}" for symbol, name in self.symbol_index.complete(text, limit=10)]
+        )
+
     def add_stock(self):
-        ticker = self.ticker_input.text().strip().upper()
-        if not ticker:
+        text = self.ticker_input.text().strip()
+        if not text:
+            return
+        ticker = text.split()[0].upper()
+
+        name = self.current_watchlist()
+        if not name:
+            QMessageBox.information(self, "No Watchlist", "Create or open a watchlist first.")
             return
 
-        if ticker not in self.tickers:
-            self.tickers.append(ticker)
+        if self.symbol_index is not None and self.symbol_index.validate(ticker) is False:
+            reply = QMessageBox.question(self, "Unknown Symbol",
+                                         f"'{ticker}' is not a listed symbol. Add it anyway?",
+                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+
+        if self.watchlist_manager.add_ticker(name, ticker):
             self.ticker_input.clear()
-            self.update_watchlist()  # Refresh immediately
+            if self.subscriptions.subscribe(name, [ticker]):
+                self.refresh_new_tickers()  # Fetch just the new ticker
+            else:
+                self.render_watchlist()  # Already fetched for another list
         else:
             QMessageBox.information(self, "Stock Exists", f"'{ticker}' is already in the watchlist.")
 
@@ -82,54 +230,94 @@ class WatchlistWidget(QWidget):
 
         row_index = selected_rows[0].row()
         ticker_item = self.watchlist_table.item(row_index, 0)
-        if ticker_item:
+        name = self.current_watchlist()
+        if ticker_item and name:
             ticker = ticker_item.text()
             if ticker in self.tickers:
-                self.tickers.remove(ticker)
-                self.update_watchlist()
+                self.watchlist_manager.remove_ticker(name, ticker)
+                self.subscriptions.unsubscribe(name, [ticker])
+                self.render_watchlist()
 
-    def update_watchlist(self):
-        if not self.tickers:
-            self.watchlist_table.setRowCount(0)
+    def set_tickers(self, tickers):
+        """Replaces the current list's contents, e.g. with screener results."""
+        name = self.current_watchlist()
+        if not name:
             return
+        tickers = self.watchlist_manager.set_tickers(name, tickers)
+        added, _ = self.subscriptions.set_subscriptions(name, tickers)
+        if added:
+            self.refresh_new_tickers()
+        else:
+            self.render_watchlist()
 
-        self.watchlist_table.setRowCount(len(self.tickers))
+    # --- Refresh ---
 
-        # Get the active preset rules
-        active_preset_name = self.settings_manager.get_active_preset()
-        active_preset = self.preset_manager.get_preset(active_preset_name)
-        rules = active_preset.get("rules", []) if active_preset else []
+    def update_watchlist(self):
+        """Fetches every subscribed ticker once, evaluates it once and redraws the current list."""
+        self._refresh(stale_only=False)
 
+    def refresh_new_tickers(self):
+        """Fetches only tickers that are not already cached, then redraws."""
+        self._refresh(stale_only=True)
 
-        for i, ticker in enumerate(self.tickers):
-            try:
-                historical_data = self.data_manager.get_historical_data(ticker)
-                if historical_data.empty:
-                    raise ValueError("No data returned")
+    def _refresh(self, stale_only):
+        active_preset_name = self.settings_manager.get_active_preset()
+        self.service.presets = [active_preset_name]
+        snapshot = self.service.refresh(stale_only=stale_only)
 
-                latest_row = historical_data.iloc[-1]
-                price = latest_row['Close']
-                volume = latest_row['Volume']
-                open_price = historical_data.iloc[-2]['Close'] if len(historical_data) > 1 else price
+        # Report signal transitions; dispatching happens off the GUI thread
+        if self.alert_engine:
+            self.alert_engine.process_signals({active_preset_name: snapshot.signals.get(active_preset_name, {})})
 
-                change = price - open_price
-                percent_change = (change / open_price) * 100 if open_price != 0 else 0
+        self.render_watchlist()
 
-                self.watchlist_table.setItem(i, 0, QTableWidgetItem(ticker))
-                self.watchlist_table.setItem(i, 1, QTableWidgetItem(f"{price:.2f}"))
-                self.watchlist_table.setItem(i, 2, QTableWidgetItem(f"{change:+.2f}"))
-                self.watchlist_table.setItem(i, 3, QTableWidgetItem(f"{percent_change:+.2f}%"))
-                self.watchlist_table.setItem(i, 4, QTableWidgetItem(f"{volume:,}"))
+        # Update the timestamp
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.refresh_label.setText(f"Last updated at: {timestamp}. Auto-refreshes every 60 seconds.")
+
+    def render_watchlist(self):
+        """Redraws the current list from the latest snapshot without fetching."""
+        tickers = self.tickers
+        if not tickers:
+            self.watchlist_table.setRowCount(0)
+            self.histories_updated.emit({})
+            return
 
-                # Generate signal using the active preset's rules
-                signal = self.recommendation_engine.generate_signals(historical_data, rules)
-                self.watchlist_table.setItem(i, 5, QTableWidgetItem(signal))
+        snapshot = self.service.snapshot
+        active_preset_name = self.settings_manager.get_active_preset()
+        signals = snapshot.signals.get(active_preset_name)
+        if signals is None:
+            # The active preset changed since the last refresh; evaluate it on the cached histories
+            active_preset = self.preset_manager.get_preset(active_preset_name)
+            rules = active_preset.get("rules", []) if active_preset else []
+            signals = {
+                ticker: self.recommendation_engine.generate_signals(snapshot.histories[ticker], rules)
+                for ticker in tickers if ticker in snapshot.histories
+            }
 
-            except Exception as e:
-                self.watchlist_table.setItem(i, 0, QTableWidgetItem(ticker))
+        self.watchlist_table.setSortingEnabled(False)
+        self.watchlist_table.setRowCount(len(tickers))
+        histories = {}
+        for i, ticker in enumerate(tickers):
+            quote = snapshot.quotes.get(ticker)
+            symbol_item = QTableWidgetItem(ticker)
+            metadata = self.metadata_cache.peek(ticker) if self.metadata_cache is not None else None
+            if metadata:
+                symbol_item.setToolTip(" · ".join(
+                    value for value in (metadata.get("name"), metadata.get("sector"), metadata.get("exchange")) if value
+                ))
+            self.watchlist_table.setItem(i, 0, symbol_item)
+            if quote is None or ticker not in signals:
                 for j in range(1, 6):
                     self.watchlist_table.setItem(i, j, QTableWidgetItem("N/A"))
+                continue
 
-        # Update the timestamp
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.refresh_label.setText(f"Last updated at: {timestamp}. Auto-refreshes every 60 seconds.")
+            histories[ticker] = snapshot.histories[ticker]
+            self.watchlist_table.setItem(i, 1, QTableWidgetItem(f"{quote['price']:.2f}"))
+            self.watchlist_table.setItem(i, 2, QTableWidgetItem(f"{quote['change']:+.2f}"))
+            self.watchlist_table.setItem(i, 3, QTableWidgetItem(f"{quote['percent_change']:+.2f}%"))
+            self.watchlist_table.setItem(i, 4, QTableWidgetItem(f"{quote['volume']:,}"))
+            self.watchlist_table.setItem(i, 5, QTableWidgetItem(signals[ticker]))
+        self.watchlist_table.setSortingEnabled(True)
+
+        self.histories_updated.emit(histories)
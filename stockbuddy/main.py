@@ -1,16 +1,23 @@
 import sys
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QWidget,
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QWidget, QStyle, QSystemTrayIcon,
                              QHBoxLayout, QListWidget, QStackedWidget, QListWidgetItem, QScrollArea)
-from PyQt5.QtCore import QTimer, Qt
-from stockbuddy.data.data_manager import DataManager
+from PyQt5.QtCore import QTimer, Qt, pyqtSignal
+from stockbuddy.data.data_manager import DataManager, INDEX_TICKERS
+from stockbuddy.data.metadata_cache import MetadataCache
+from stockbuddy.data.symbol_index import SymbolIndex
 from stockbuddy.gui.dashboard_widget import DashboardWidget
 from stockbuddy.gui.watchlist_widget import WatchlistWidget
 from stockbuddy.gui.presets_widget import PresetsWidget
 from stockbuddy.gui.settings_widget import SettingsWidget
 from stockbuddy.core.settings_manager import SettingsManager
 from stockbuddy.core.preset_manager import PresetManager
+from stockbuddy.core.alert_engine import AlertEngine
+from stockbuddy.core.alert_sinks import DesktopNotificationSink, LogFileSink
 
 class MainWindow(QMainWindow):
+    # Emitted from the alert dispatch thread; delivered on the GUI thread
+    alert_notification = pyqtSignal(str, str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("StockBuddy")
@@ -18,6 +25,21 @@ class MainWindow(QMainWindow):
 
         self.settings_manager = SettingsManager()
         self.preset_manager = PresetManager()
+
+        # Alerts for signal transitions go to a log file and the system tray
+        self.tray_icon = QSystemTrayIcon(self.style().standardIcon(QStyle.SP_ComputerIcon), self)
+        self.tray_icon.show()
+        self.alert_notification.connect(self.tray_icon.showMessage)
+        self.alert_engine = AlertEngine(sinks=[
+            LogFileSink(),
+            DesktopNotificationSink(notify=self.alert_notification.emit),
+        ])
+        self.alert_engine.start()
+
+        # Symbol directory and ticker metadata are cached on disk and refreshed in the background
+        self.symbol_index = SymbolIndex()
+        self.symbol_index.refresh_in_background()
+        self.metadata_cache = MetadataCache(symbol_index=self.symbol_index)
         self.font_sizes = {"Small": "10pt", "Medium": "12pt", "Large": "15pt"}
 
         # Central Widget and Layout
@@ -58,8 +80,9 @@ class MainWindow(QMainWindow):
         # Add items to sidebar and widgets to stacked_widget
         # Pass managers to widgets that need them
         self.views = {
-            "Dashboard": DashboardWidget(),
-            "Watchlist": WatchlistWidget(self.settings_manager, self.preset_manager),
+            "Dashboard": DashboardWidget(metadata_cache=self.metadata_cache),
+            "Watchlist": WatchlistWidget(self.settings_manager, self.preset_manager, self.alert_engine,
+                                         symbol_index=self.symbol_index, metadata_cache=self.metadata_cache),
             "Presets": PresetsWidget(self.settings_manager, self.preset_manager),
             "Settings": SettingsWidget(self.settings_manager)
         }
@@ -82,8 +105,16 @@ class MainWindow(QMainWindow):
             if isinstance(widget, SettingsWidget):
                 widget.font_size_changed.connect(self.apply_font_size)
 
-        # Connect preset changes to watchlist updates
-        self.views["Presets"].active_preset_changed.connect(self.views["Watchlist"].update_watchlist)
+        # Re-evaluate the watchlist on the cached histories when the active preset changes
+        self.views["Presets"].active_preset_changed.connect(self.views["Watchlist"].render_watchlist)
+
+        # Reuse the watchlist's fetched histories for the dashboard's quick charts
+        self.views["Watchlist"].histories_updated.connect(self.views["Dashboard"].update_charts)
+
+    def closeEvent(self, event):
+        self.alert_engine.stop()
+        self.metadata_cache.close()
+        super().closeEvent(event)
 
     def apply_font_size(self, size_str):
         """Applies the selected font size globally."""
@@ -93,12 +124,7 @@ class MainWindow(QMainWindow):
         QApplication.instance().setStyleSheet(stylesheet)
 
     def update_index_data(self):
-        tickers = {
-            "^GSPC": "S&P 500",
-            "^DJI": "Dow",
-            "^IXIC": "Nasdaq",
-            "^RUT": "Russell 2000"
-        }
+        tickers = INDEX_TICKERS
         try:
             data = self.data_manager.get_index_data(list(tickers.keys()))
 
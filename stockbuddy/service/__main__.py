@@ -0,0 +1,56 @@
+import argparse
+import logging
+import os
+
+from stockbuddy.core.alert_engine import AlertEngine
+from stockbuddy.core.alert_sinks import LogFileSink, WebhookSink
+from stockbuddy.data.price_store import PriceStore
+from stockbuddy.service.http_api import make_server
+from stockbuddy.service.signal_service import SignalService
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run StockBuddy as a headless signal service.")
+    parser.add_argument("tickers", nargs="*", help="Ticker symbols to track (e.g., AAPL MSFT)")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--interval", type=int, default=60, help="Refresh interval in seconds (default: 60)")
+    parser.add_argument("--period", default="1y", help="History period to fetch (default: 1y)")
+    parser.add_argument("--price-store", action="store_true",
+                        help="Keep raw bars and corporate actions in ~/.stockbuddy/prices.db and only fetch new bars")
+    parser.add_argument("--alert-log", metavar="FILE", help="Append signal transition alerts to FILE")
+    parser.add_argument("--webhook", metavar="URL", action="append", default=[],
+                        help="POST signal transition alerts to URL (repeatable)")
+    parser.add_argument("--debounce", type=int, default=1,
+                        help="Refreshes a new signal must persist before alerting (default: 1)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    price_store = PriceStore() if args.price_store else None
+    service = SignalService(tickers=args.tickers, interval=args.interval, period=args.period,
+                            price_store=price_store)
+    server = make_server(service, args.host, args.port)
+
+    sinks = [WebhookSink(url) for url in args.webhook]
+    if args.alert_log:
+        sinks.append(LogFileSink(os.path.abspath(args.alert_log)))
+    alert_engine = AlertEngine(sinks, debounce_cycles=args.debounce)
+    if sinks:
+        alert_engine.start()
+        service.add_listener(alert_engine.process)
+
+    service.start()
+    logging.info("Serving signals on http://%s:%d", *server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+        alert_engine.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import logging
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Snapshot bookkeeping that changes on every refresh; left out of the ETag
+SNAPSHOT_FIELDS = ("version", "updated_at")
+# Query parameters that affect a response; anything else is ignored
+QUERY_PARAMS = ("limit",)
+
+
+class SignalAPI:
+    """Builds JSON responses from a SignalService snapshot.
+
+    Successful responses are cached per route and parameters until the
+    snapshot version changes, so repeated requests are served straight from
+    memory. ETags are derived from the data in the body, leaving out the
+    snapshot version and timestamp, so clients keep their copy across
+    refreshes that did not change the data.
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self._cache = {}
+        self._cache_version = None
+        self._lock = threading.Lock()
+
+    def render(self, target):
+        """Returns (status, body, etag) for a request target such as '/quotes'."""
+        snapshot = self.service.snapshot
+        key = _parse_target(target, snapshot)
+        with self._lock:
+            if self._cache_version != snapshot.version:
+                self._cache = {}
+                self._cache_version = snapshot.version
+            cached = self._cache.get(key)
+        if cached:
+            return cached
+
+        status, payload = self._route(snapshot, *key)
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        data = {name: value for name, value in payload.items() if name not in SNAPSHOT_FIELDS}
+        etag = '"%s"' % hashlib.sha1(json.dumps(data, separators=(",", ":")).encode("utf-8")).hexdigest()
+        response = (status, body, etag)
+
+        if status == 200:
+            with self._lock:
+                if self._cache_version == snapshot.version:
+                    self._cache[key] = response
+        return response
+
+    def _route(self, snapshot, parts, params):
+        query = dict(params)
+
+        if parts == ("health",):
+            return 200, {"status": "ok", "version": snapshot.version, "updated_at": snapshot.updated_at}
+
+        if parts == ("tickers",):
+            return 200, {"version": snapshot.version, "tickers": list(snapshot.quotes)}
+
+        if parts == ("presets",):
+            return 200, {"version": snapshot.version, "presets": list(snapshot.signals)}
+
+        if parts == ("quotes",):
+            return 200, {
+                "version": snapshot.version,
+                "updated_at": snapshot.updated_at,
+                "quotes": snapshot.quotes,
+            }
+
+        if parts == ("signals",):
+            return 200, {
+                "version": snapshot.version,
+                "updated_at": snapshot.updated_at,
+                "signals": snapshot.signals,
+            }
+
+        if len(parts) == 2 and parts[0] == "signals":
+            if parts[1] not in snapshot.signals:
+                return 404, {"error": f"Unknown preset '{parts[1]}'"}
+            return 200, {
+                "version": snapshot.version,
+                "updated_at": snapshot.updated_at,
+                "preset": parts[1],
+                "signals": snapshot.signals[parts[1]],
+            }
+
+        if len(parts) == 2 and parts[0] == "history":
+            ticker = parts[1]
+            historical_data = snapshot.histories.get(ticker)
+            if historical_data is None:
+                return 404, {"error": f"No history for '{ticker}'"}
+            limit = query.get("limit", 0)
+            if not isinstance(limit, int) or limit < 0:
+                return 400, {"error": "limit must be a non-negative integer"}
+            if limit > 0:
+                historical_data = historical_data.iloc[-limit:]
+            return 200, {
+                "version": snapshot.version,
+                "ticker": ticker,
+                "history": _history_records(historical_data),
+            }
+
+        return 404, {"error": "Not found"}
+
+
+def _parse_target(target, snapshot):
+    """Normalizes a request target to a (path parts, params) cache key.
+
+    A history limit of 0 or one covering the whole history is the same
+    response as no limit and is dropped, so the cache holds at most one
+    entry per history length.
+    """
+    url = urlsplit(target)
+    parts = tuple(unquote(part) for part in url.path.strip("/").split("/") if part)
+    if len(parts) == 2 and parts[0] == "history":
+        parts = (parts[0], parts[1].upper())
+    query = parse_qs(url.query)
+    params = []
+    for name in QUERY_PARAMS:
+        if name in query:
+            value = query[name][0]
+            try:
+                value = int(value)
+            except ValueError:
+                pass
+            params.append((name, value))
+    if len(parts) == 2 and parts[0] == "history" and params:
+        historical_data = snapshot.histories.get(parts[1])
+        limit = params[0][1]
+        if historical_data is not None and isinstance(limit, int) and (limit == 0 or limit >= len(historical_data)):
+            params = []
+    return parts, tuple(params)
+
+
+def _history_records(historical_data):
+    columns = [column for column in ("Open", "High", "Low", "Close", "Volume") if column in historical_data]
+    records = []
+    for date, row in zip(historical_data.index, historical_data[columns].itertuples(index=False)):
+        record = {"date": date.isoformat() if hasattr(date, "isoformat") else str(date)}
+        for column, value in zip(columns, row):
+            value = float(value)
+            record[column.lower()] = None if math.isnan(value) else value
+        records.append(record)
+    return records
+
+
+class SignalRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle's algorithm
+    # and delayed ACKs stall every keep-alive response by ~40 ms.
+    disable_nagle_algorithm = True
+    api = None  # Set on the subclass created by make_server
+
+    def do_GET(self):
+        status, body, etag = self.api.render(self.path)
+
+        if status == 200 and etag in _parse_if_none_match(self.headers.get("If-None-Match")):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        if status == 200:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def _parse_if_none_match(header):
+    if not header:
+        return set()
+    return {tag.strip() for tag in header.split(",")}
+
+
+def make_server(service, host="127.0.0.1", port=8765):
+    """Creates a threaded HTTP server exposing the service's snapshot."""
+    handler = type("BoundSignalRequestHandler", (SignalRequestHandler,), {"api": SignalAPI(service)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,164 @@
+import logging
+import threading
+import time
+
+from stockbuddy.core.preset_manager import PresetManager
+from stockbuddy.core.recommendation_engine import RecommendationEngine
+from stockbuddy.data.data_manager import DataManager
+from stockbuddy.data.history_cache import HistoryCache
+from stockbuddy.data.quotes import summarize_quote
+
+logger = logging.getLogger(__name__)
+
+
+class SignalSnapshot:
+    """Immutable result of one refresh cycle."""
+
+    def __init__(self, version=0, updated_at=None, quotes=None, signals=None, histories=None):
+        self.version = version
+        self.updated_at = updated_at
+        self.quotes = quotes or {}        # ticker -> quote dict, or None if unavailable
+        self.signals = signals or {}      # preset name -> {ticker: signal}
+        self.histories = histories or {}  # ticker -> historical DataFrame
+
+
+class SignalService:
+    """Headless owner of the data cache, refresh scheduler and recommendation engine.
+
+    A refresh fetches each ticker once, then evaluates every preset against
+    the cached histories. The result is published as a new SignalSnapshot
+    that readers can use without taking any locks.
+
+    With a SubscriptionManager, the tracked tickers follow the shared
+    subscription set of every open watchlist instead of a fixed list.
+    `presets` limits evaluation to the named presets.
+    """
+
+    def __init__(self, data_manager=None, preset_manager=None, tickers=None, interval=60, period="1y",
+                 price_store=None, subscriptions=None, presets=None):
+        self.data_manager = data_manager or DataManager()
+        self.preset_manager = preset_manager or PresetManager()
+        self.recommendation_engine = RecommendationEngine()
+        self.cache = HistoryCache(self.data_manager, period=period, max_age=interval, price_store=price_store)
+        self.interval = interval
+        self.presets = presets
+        self.subscriptions = subscriptions
+
+        self._tickers = []
+        self._tickers_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._snapshot = SignalSnapshot()
+        self._listeners = []
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        self.set_tickers(tickers or [])
+        if subscriptions is not None:
+            subscriptions.add_listener(self._on_subscriptions_changed)
+            self.set_tickers(subscriptions.tickers())
+
+    @property
+    def snapshot(self):
+        """Returns the most recently published snapshot."""
+        return self._snapshot
+
+    def get_tickers(self):
+        """Returns the tickers the service is tracking."""
+        with self._tickers_lock:
+            return list(self._tickers)
+
+    def set_tickers(self, tickers):
+        """Replaces the tracked tickers, keeping their order and dropping duplicates."""
+        normalized = []
+        for ticker in tickers:
+            ticker = ticker.strip().upper()
+            if ticker and ticker not in normalized:
+                normalized.append(ticker)
+        with self._tickers_lock:
+            removed = set(self._tickers) - set(normalized)
+            self._tickers = normalized
+        for ticker in removed:
+            self.cache.discard(ticker)
+
+    def add_listener(self, callback):
+        """Registers a callable invoked with each new snapshot."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Unregisters a snapshot listener."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def refresh(self, stale_only=False):
+        """Fetches data, evaluates every preset and publishes a new snapshot.
+
+        With `stale_only`, tickers fetched within the refresh interval are
+        served from the cache, so only new or stale tickers hit the provider.
+        """
+        with self._refresh_lock:
+            tickers = self.get_tickers()
+            if stale_only:
+                fetched = {ticker: self.cache.get(ticker) for ticker in tickers}
+            else:
+                fetched = self.cache.refresh(tickers)
+            histories = {ticker: data for ticker, data in fetched.items() if data is not None}
+
+            quotes = {}
+            for ticker in tickers:
+                try:
+                    quotes[ticker] = summarize_quote(histories.get(ticker))
+                except Exception:
+                    quotes[ticker] = None
+
+            signals = {}
+            for name, preset in self.preset_manager.get_all_presets().items():
+                if self.presets is not None and name not in self.presets:
+                    continue
+                rules = preset.get("rules", [])
+                signals[name] = {
+                    ticker: self.recommendation_engine.generate_signals(histories[ticker], rules)
+                    if ticker in histories else "N/A"
+                    for ticker in tickers
+                }
+
+            snapshot = SignalSnapshot(
+                version=self._snapshot.version + 1,
+                updated_at=time.time(),
+                quotes=quotes,
+                signals=signals,
+                histories=histories,
+            )
+            self._snapshot = snapshot
+
+        for callback in list(self._listeners):
+            try:
+                callback(snapshot)
+            except Exception:
+                logger.exception("Snapshot listener failed")
+        return snapshot
+
+    def start(self):
+        """Starts the background refresh scheduler."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="signal-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stops the background refresh scheduler."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Signal refresh failed")
+            self._stop_event.wait(self.interval)
+
+    def _on_subscriptions_changed(self, added, removed):
+        self.set_tickers(self.subscriptions.tickers())
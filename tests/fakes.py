@@ -0,0 +1,25 @@
+"""Fake providers shared by the service and watchlist tests."""
+import numpy as np
+import pandas as pd
+
+
+class FakeDataManager:
+    def __init__(self, fail=()):
+        self.calls = 0
+        self.fail = set(fail)
+
+    def get_historical_data(self, ticker, period="1y"):
+        self.calls += 1
+        if ticker in self.fail:
+            raise ConnectionError("provider unavailable")
+        close = np.linspace(100, 110, 30)
+        return pd.DataFrame({'Close': close, 'High': close + 1, 'Low': close - 1, 'Volume': np.full(30, 1000)},
+                            index=pd.date_range("2025-01-01", periods=30))
+
+
+class FakePresetManager:
+    def get_all_presets(self):
+        return {
+            "Sell High": {"rules": [{"indicator": "RSI", "period": 14, "condition": ">", "value": 70, "action": "Sell"}]},
+            "Empty": {"rules": []},
+        }
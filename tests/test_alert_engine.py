@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+
+from stockbuddy.core.alert_engine import AlertEngine
+
+
+class RecordingSink:
+    def __init__(self):
+        self.alerts = []
+
+    def send(self, alert):
+        self.alerts.append((alert.ticker, alert.preset, alert.previous, alert.signal))
+
+
+class SlowSink:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def send(self, alert):
+        self.release.wait(5)
+
+
+class AsyncSink:
+    def __init__(self):
+        self.count = 0
+
+    async def send(self, alert):
+        await asyncio.sleep(0)
+        self.count += 1
+
+
+def test_first_observation_does_not_alert():
+    engine = AlertEngine()
+    assert engine.process_signals({"P": {"AAPL": "Hold"}}) == []
+
+
+def test_transition_is_detected_once():
+    """A Hold -> Buy flip produces exactly one alert, repeats are deduplicated."""
+    engine = AlertEngine()
+    engine.process_signals({"P": {"AAPL": "Hold", "MSFT": "Hold"}})
+
+    alerts = engine.process_signals({"P": {"AAPL": "Buy", "MSFT": "Hold"}})
+    assert [(a.ticker, a.previous, a.signal) for a in alerts] == [("AAPL", "Hold", "Buy")]
+    assert engine.process_signals({"P": {"AAPL": "Buy", "MSFT": "Hold"}}) == []
+
+
+def test_transitions_are_tracked_per_preset():
+    engine = AlertEngine()
+    engine.process_signals({"A": {"AAPL": "Hold"}, "B": {"AAPL": "Hold"}})
+    alerts = engine.process_signals({"A": {"AAPL": "Sell"}, "B": {"AAPL": "Hold"}})
+    assert [(a.preset, a.signal) for a in alerts] == [("A", "Sell")]
+
+
+def test_unavailable_signals_are_ignored():
+    """An N/A from a failed fetch neither alerts nor resets the state."""
+    engine = AlertEngine()
+    engine.process_signals({"P": {"AAPL": "Hold"}})
+    assert engine.process_signals({"P": {"AAPL": "N/A"}}) == []
+    assert engine.process_signals({"P": {"AAPL": "Hold"}}) == []
+
+
+def test_debounce_requires_consecutive_cycles():
+    engine = AlertEngine(debounce_cycles=2)
+    engine.process_signals({"P": {"AAPL": "Hold"}})
+    engine.process_signals({"P": {"AAPL": "Hold"}})
+
+    assert engine.process_signals({"P": {"AAPL": "Buy"}}) == []
+    assert engine.process_signals({"P": {"AAPL": "Hold"}}) == []  # flicker is swallowed
+    assert engine.process_signals({"P": {"AAPL": "Buy"}}) == []
+    alerts = engine.process_signals({"P": {"AAPL": "Buy"}})
+    assert [(a.previous, a.signal) for a in alerts] == [("Hold", "Buy")]
+
+
+def test_cooldown_holds_back_then_reports_latest_state():
+    engine = AlertEngine(cooldown=60)
+    engine.process_signals({"P": {"AAPL": "Hold"}})
+    assert len(engine.process_signals({"P": {"AAPL": "Buy"}})) == 1
+    assert engine.process_signals({"P": {"AAPL": "Sell"}}) == []
+
+    # Pretend the cooldown has passed
+    engine._alerted[("AAPL", "P")] = ("Buy", time.monotonic() - 61)
+    alerts = engine.process_signals({"P": {"AAPL": "Sell"}})
+    assert [(a.previous, a.signal) for a in alerts] == [("Buy", "Sell")]
+
+
+def test_alerts_are_delivered_to_sync_and_async_sinks():
+    recording, async_sink = RecordingSink(), AsyncSink()
+    engine = AlertEngine(sinks=[recording, async_sink])
+    engine.start()
+    try:
+        engine.process_signals({"P": {"AAPL": "Hold"}})
+        engine.process_signals({"P": {"AAPL": "Buy"}})
+        engine.flush(timeout=5)
+    finally:
+        engine.stop()
+
+    assert recording.alerts == [("AAPL", "P", "Hold", "Buy")]
+    assert async_sink.count == 1
+    assert engine.stats()[0]["delivered"] == 1
+
+
+def test_slow_sink_does_not_block_detection_and_drops_oldest():
+    """A stuck sink fills its bounded queue while other sinks keep receiving alerts."""
+    slow, recording = SlowSink(), RecordingSink()
+    engine = AlertEngine(sinks=[slow, recording], queue_size=2)
+    engine.start()
+
+    def wait_for(count):
+        deadline = time.time() + 5
+        while len(recording.alerts) < count and time.time() < deadline:
+            time.sleep(0.01)
+
+    try:
+        engine.process_signals({"P": {f"T{i}": "Hold" for i in range(10)}})
+        start = time.perf_counter()
+        engine.process_signals({"P": {f"T{i}": "Buy" for i in range(10)}})
+        assert time.perf_counter() - start < 0.5
+
+        # The batch is enqueued in one go: the newest two fit, the rest are dropped
+        wait_for(2)
+        assert [alert[0] for alert in recording.alerts] == ["T8", "T9"]
+        assert [stats["dropped"] for stats in engine.stats()] == [8, 8]
+
+        engine.process_signals({"P": {"T0": "Sell"}})
+        wait_for(3)
+        assert recording.alerts[-1] == ("T0", "P", "Buy", "Sell")
+    finally:
+        slow.release.set()
+        engine.stop()
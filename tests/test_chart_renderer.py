@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from stockbuddy.gui.chart_renderer import ChartRenderer
+
+
+def make_history(bars=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    return pd.DataFrame({'Close': close}, index=pd.date_range("2000-01-03", periods=bars, freq="B"))
+
+
+def line_data(renderer, ticker):
+    return {name: line.get_ydata() for name, line in renderer._charts[ticker].lines.items()}
+
+
+def test_long_history_is_decimated_to_chart_width():
+    renderer = ChartRenderer(width=200)
+    history = make_history(20000)
+    renderer.figure("AAPL", history)
+
+    close = line_data(renderer, "AAPL")["Close"]
+    assert len(close) <= 400
+    assert close.max() == history['Close'].max()
+    assert close.min() == history['Close'].min()
+
+
+def test_same_data_version_returns_cached_figure_untouched():
+    renderer = ChartRenderer()
+    history = make_history()
+    figure, changed = renderer.figure("AAPL", history, version=1)
+    assert changed
+    renderer._charts["AAPL"].lines["Close"].set_data([], [])
+
+    assert renderer.figure("AAPL", history, version=1) == (figure, False)
+    assert len(line_data(renderer, "AAPL")["Close"]) == 0
+
+
+def test_new_bars_update_the_same_figure_like_a_full_render():
+    history = make_history()
+    incremental = ChartRenderer()
+    figure, _ = incremental.figure("AAPL", history.iloc[:-5])
+    revised = history.copy()
+    revised.iloc[-6, 0] *= 1.05  # the previously last bar was still forming
+    assert incremental.figure("AAPL", revised) == (figure, True)
+
+    full = ChartRenderer()
+    full.figure("AAPL", revised)
+    for name, values in line_data(full, "AAPL").items():
+        updated = line_data(incremental, "AAPL")[name]
+        assert np.isclose(np.nanmax(updated), np.nanmax(values))
+        assert np.isclose(np.nanmin(updated), np.nanmin(values))
+        assert np.isclose(updated[-1], values[-1])
+
+
+def test_sliding_window_updates_the_same_figure_like_a_full_render():
+    """A rolling window that drops a bar off the front for each new one is not rebuilt."""
+    history = make_history(3000)
+    window = 252 * 5
+    incremental = ChartRenderer(width=100)
+    figure, _ = incremental.figure("AAPL", history.iloc[:window])
+    rebuilds = []
+    incremental._rebuild = lambda *args: rebuilds.append(args)
+    for end in range(window + 1, len(history), 7):
+        assert incremental.figure("AAPL", history.iloc[end - window:end]) == (figure, True)
+    assert not rebuilds
+
+    full = ChartRenderer(width=100)
+    full.figure("AAPL", history.iloc[end - window:end])
+    for name, values in line_data(full, "AAPL").items():
+        updated = line_data(incremental, "AAPL")[name]
+        assert np.isclose(np.nanmax(updated), np.nanmax(values))
+        assert np.isclose(np.nanmin(updated), np.nanmin(values))
+        assert np.isclose(updated[-1], values[-1])
+    for name, line in full._charts["AAPL"].lines.items():
+        assert incremental._charts["AAPL"].lines[name].get_xdata()[0] == line.get_xdata()[0]
+
+
+def test_cache_evicts_least_recently_used_charts():
+    renderer = ChartRenderer(cache_size=2)
+    history = make_history(300)
+    for ticker in ("A", "B", "A", "C"):
+        renderer.figure(ticker, history)
+    assert list(renderer._charts) == ["A", "C"]
@@ -0,0 +1,74 @@
+import numpy as np
+
+from stockbuddy.core.downsampling import DecimatedSeries, lttb, minmax_decimate
+
+
+def random_walk(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.arange(count, dtype=float), np.cumsum(rng.normal(size=count))
+
+
+def test_minmax_decimate_keeps_extremes_within_budget():
+    x, y = random_walk(10000)
+    dx, dy = minmax_decimate(x, y, 300)
+    assert len(dx) <= 600
+    assert dy.min() == y.min() and dy.max() == y.max()
+    assert np.all(np.diff(dx) > 0)
+
+
+def test_minmax_decimate_returns_short_series_unchanged():
+    x, y = random_walk(50)
+    dx, dy = minmax_decimate(x, y, 300)
+    np.testing.assert_array_equal(dy, y)
+
+
+def test_lttb_keeps_endpoints_and_point_count():
+    x, y = random_walk(5000)
+    dx, dy = lttb(x, y, 500)
+    assert len(dx) == 500
+    assert dx[0] == 0 and dx[-1] == 4999
+    assert np.all(np.diff(dx) > 0)
+
+
+def test_decimated_series_point_at_a_time_matches_bulk():
+    """Appending one point at a time gives the same extremes as one bulk extend."""
+    x, y = random_walk(20000)
+    bulk = DecimatedSeries(max_points=400)
+    bulk.extend(x, y)
+    incremental = DecimatedSeries(max_points=400)
+    for i in range(0, len(x), 37):
+        incremental.extend(x[i:i + 37], y[i:i + 37])
+
+    for series in (bulk, incremental):
+        px, py = series.points()
+        assert len(px) <= 400
+        assert py.min() == y.min() and py.max() == y.max()
+        assert px[-1] == x[-1]
+        assert np.all(np.diff(px) >= 0)
+    assert incremental.length == bulk.length == 20000
+
+
+def test_decimated_series_update_last_revises_the_newest_point():
+    x, y = random_walk(1000)
+    series = DecimatedSeries(max_points=100)
+    series.extend(x, y)
+    series.update_last(1e6)
+    assert series.points()[1].max() == 1e6
+
+
+
+def test_decimated_series_drop_before_keeps_exact_extremes_of_the_window():
+    """Sliding a window forward keeps exactly the extremes of the points left in it."""
+    x, y = random_walk(6000)
+    width = 3000
+    series = DecimatedSeries(max_points=200)
+    series.extend(x[:width], y[:width])
+    for start in range(37, len(x) - width, 37):
+        series.drop_before(x[start], x[start:], y[start:])
+        series.extend(x[start + width - 37:start + width], y[start + width - 37:start + width])
+
+        visible = slice(start, start + width)
+        px, py = series.points()
+        assert px[0] >= x[start] and px[-1] == x[visible][-1]
+        assert py.min() == y[visible].min() and py.max() == y[visible].max()
+        assert len(px) <= 200
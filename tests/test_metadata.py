@@ -0,0 +1,163 @@
+import threading
+import time
+
+import pytest
+
+from stockbuddy.data.data_manager import parse_symbol_directory
+from stockbuddy.data.metadata_cache import MetadataCache
+from stockbuddy.data.symbol_index import SymbolIndex
+
+NASDAQ_LISTED = """Symbol|Security Name|Market Category|Test Issue|Financial Status|Round Lot Size|ETF|NextShares
+AAPL|Apple Inc. - Common Stock|Q|N|N|100|N|N
+AMZN|Amazon.com, Inc. - Common Stock|Q|N|N|100|N|N
+ZXZZT|NASDAQ TEST STOCK|G|Y|N|100|N|N
+File Creation Time: 0916202517:01|||||||
+"""
+
+OTHER_LISTED = """ACT Symbol|Security Name|Exchange|CQS Symbol|ETF|Round Lot Size|Test Issue|NASDAQ Symbol
+BRK.B|Berkshire Hathaway Inc. Class B|N|BRK.B|N|100|N|BRK.B
+SPY|SPDR S&P 500 ETF Trust|P|SPY|Y|100|N|SPY
+ABR$D|Arbor Realty Trust Preferred D|N|ABRpD|N|100|N|ABR-D
+File Creation Time: 0916202517:01|||||||
+"""
+
+INFO = {
+    "AAPL": {"longName": "Apple Inc.", "sector": "Technology", "industry": "Consumer Electronics",
+             "fullExchangeName": "NasdaqGS", "quoteType": "EQUITY", "currency": "USD"},
+    "XOM": {"longName": "Exxon Mobil Corporation", "sector": "Energy", "quoteType": "EQUITY"},
+    "SPY": {"longName": "SPDR S&P 500 ETF Trust", "quoteType": "ETF"},
+}
+
+
+class FakeDataManager:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.info_calls = []
+        self.release = threading.Event()
+        self.release.set()
+        self.fail = set()
+
+    def get_ticker_info(self, ticker):
+        self.info_calls.append(ticker)
+        self.release.wait()
+        time.sleep(self.delay)
+        if ticker in self.fail:
+            raise ConnectionError("provider unavailable")
+        return INFO.get(ticker, {})
+
+    def get_symbol_directory(self):
+        return parse_symbol_directory(NASDAQ_LISTED) + parse_symbol_directory(OTHER_LISTED)
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def test_parse_symbol_directory():
+    assert parse_symbol_directory(NASDAQ_LISTED) == [
+        ("AAPL", "Apple Inc. - Common Stock", "Nasdaq"),
+        ("AMZN", "Amazon.com, Inc. - Common Stock", "Nasdaq"),
+    ]
+    assert parse_symbol_directory(OTHER_LISTED) == [
+        ("BRK-B", "Berkshire Hathaway Inc. Class B", "NYSE"),
+        ("SPY", "SPDR S&P 500 ETF Trust", "NYSE Arca"),
+    ]
+
+
+def test_symbol_index_validates_and_completes(home):
+    index = SymbolIndex(FakeDataManager())
+    assert index.validate("AAPL") is None  # nothing downloaded yet
+    index.refresh_in_background().join()
+
+    assert index.validate("aapl") is True
+    assert index.validate("^GSPC") is True
+    assert index.validate("AAPX") is False
+    assert index.validate("VOD.L") is None
+    assert [symbol for symbol, _ in index.complete("a")] == ["AAPL", "AMZN"]
+    assert [symbol for symbol, _ in index.complete("berk")] == ["BRK-B"]
+    assert index.complete("a", limit=1) == [("AAPL", "Apple Inc. - Common Stock")]
+    assert index.lookup("SPY")["exchange"] == "NYSE Arca"
+
+    # The saved directory loads without a download and is not refreshed again while fresh
+    reloaded = SymbolIndex(FakeDataManager())
+    assert len(reloaded) == 4
+    assert reloaded.refresh_in_background() is None
+
+
+def test_get_never_blocks_and_prefetch_dedupes(home):
+    provider = FakeDataManager()
+    provider.release.clear()
+    cache = MetadataCache(provider, max_workers=2)
+
+    start = time.perf_counter()
+    assert cache.get("AAPL") is None
+    assert cache.prefetch(["AAPL", "XOM", "XOM"]) == ["XOM"]
+    assert time.perf_counter() - start < 0.1
+
+    provider.release.set()
+    assert cache.wait(timeout=5)
+    assert cache.get("AAPL")["sector"] == "Technology"
+    assert sorted(provider.info_calls) == ["AAPL", "XOM"]
+    assert cache.prefetch(["AAPL", "XOM"]) == []  # fresh
+    cache.close()
+
+    reloaded = MetadataCache(FakeDataManager())
+    assert reloaded.peek("XOM")["name"] == "Exxon Mobil Corporation"
+    assert reloaded.is_fresh("XOM")
+    reloaded.close()
+
+
+def test_failures_are_remembered_and_stale_entries_kept(home):
+    provider = FakeDataManager()
+    cache = MetadataCache(provider, ttl=0, failure_ttl=3600)
+    cache.prefetch(["AAPL", "NOPE"])
+    assert cache.wait(timeout=5)
+    assert cache.peek("NOPE") is None
+
+    # With ttl=0 AAPL is immediately stale; a failed refetch keeps the old metadata
+    provider.fail.add("AAPL")
+    cache.prefetch(["AAPL", "NOPE"])
+    assert cache.wait(timeout=5)
+    assert cache.peek("AAPL")["sector"] == "Technology"
+    assert provider.info_calls.count("NOPE") == 1
+    assert cache.prefetch(["AAPL"]) == []  # retried only after failure_ttl
+    cache.close()
+
+
+def test_sector_allocation_uses_cache_and_symbol_index(home):
+    index = SymbolIndex(FakeDataManager(), filename=None)
+    index.refresh()
+    provider = FakeDataManager()
+    provider.release.clear()
+    cache = MetadataCache(provider, filename=None, symbol_index=index)
+
+    # Nothing fetched yet: everything is Unknown, but names come from the index right away
+    assert cache.sector_allocation(["AAPL", "XOM", "SPY"]) == {"Unknown": 1.0}
+    assert cache.peek("SPY")["name"] == "SPDR S&P 500 ETF Trust"
+
+    provider.release.set()
+    assert cache.wait(timeout=5)
+    assert cache.sector_allocation(["AAPL", "XOM", "SPY", "AAPL"]) == pytest.approx(
+        {"Technology": 1 / 3, "Energy": 1 / 3, "ETF": 1 / 3})
+    allocation = cache.sector_allocation(["AAPL", "XOM"], weights={"AAPL": 3000, "XOM": 1000})
+    assert list(allocation) == ["Technology", "Energy"]
+    assert allocation["Technology"] == pytest.approx(0.75)
+    cache.close()
+
+
+def test_close_drops_queued_fetches_without_blocking_wait(home):
+    provider = FakeDataManager()
+    provider.release.clear()
+    cache = MetadataCache(provider, filename=None, max_workers=1)
+    cache.prefetch(["AAPL", "XOM", "SPY"])
+    while not provider.info_calls:  # AAPL is running, the others are queued
+        time.sleep(0.001)
+
+    cache.close()
+    assert not cache.wait(timeout=0.05)  # AAPL is still running
+    provider.release.set()
+    assert cache.wait(timeout=5)
+    assert provider.info_calls == ["AAPL"]
+    assert cache.prefetch(["XOM"]) == []
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stockbuddy.core.preset_manager import PresetManager
+from stockbuddy.core.preset_optimizer import (IndicatorPrimitives, PresetOptimizer, backtest,
+                                              expand_grid, signal_matrix)
+from stockbuddy.core.recommendation_engine import RecommendationEngine
+
+
+def make_history(bars=300, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+    return pd.DataFrame({'Close': close, 'High': close * 1.01, 'Low': close * 0.99})
+
+
+def test_primitives_match_engine_indicators():
+    """Prefix-sum SMA/std and shared-diff RSI agree with the engine's pandas versions."""
+    engine = RecommendationEngine()
+    close = make_history()['Close']
+    primitives = IndicatorPrimitives(close)
+
+    for window in (5, 20, 200):
+        np.testing.assert_allclose(primitives.sma(window), engine._calculate_sma(close, window), rtol=1e-9)
+    for window in (7, 14, 21):
+        np.testing.assert_allclose(primitives.rsi(window), engine._calculate_rsi(close, window), rtol=1e-9)
+    upper, lower = engine._calculate_bollinger_bands(close, 20, 2)
+    np.testing.assert_allclose(primitives.bollinger_bands(20, 2)[1], lower, rtol=1e-9)
+
+
+def test_expand_grid_builds_cartesian_product():
+    rules = PresetManager.get_default_presets()["Conservative Growth"]["rules"]
+    combinations = expand_grid(rules, {"0.period": [50, 200], "1.value": [25, 30, 35]})
+
+    assert len(combinations) == 6
+    params, combination_rules = combinations[0]
+    assert params == {"0.period": 50, "1.value": 25}
+    assert combination_rules[0]["period"] == 50 and combination_rules[1]["value"] == 25
+    assert rules[0]["period"] == 200  # The template is left untouched
+
+
+def test_expand_grid_rejects_bad_keys():
+    with pytest.raises(ValueError):
+        expand_grid([{"indicator": "SMA"}], {"period": [1]})
+
+
+def test_signal_matrix_matches_generate_signals():
+    """The last column of the vectorized signals equals the engine's verdict for every preset."""
+    engine = RecommendationEngine()
+    labels = {1: "Buy", -1: "Sell", 0: "Hold"}
+    presets = PresetManager.get_default_presets()
+
+    for seed in range(5):
+        history = make_history(seed=seed)
+        for end in (150, 220, 300):
+            window = history.iloc[:end]
+            primitives = IndicatorPrimitives(window['Close'], window['High'], window['Low'])
+            rule_sets = [preset["rules"] for preset in presets.values()]
+            matrix = signal_matrix(primitives, rule_sets)
+            for rules, row in zip(rule_sets, matrix):
+                assert labels[row[-1]] == engine.generate_signals(window, rules)
+
+
+def test_backtest_follows_buy_and_sell_signals():
+    close = np.array([100.0, 110.0, 121.0, 121.0, 60.5])
+    signals = np.array([[1, 0, 0, -1, 0], [0, 0, 0, 0, 0]], dtype=np.int8)
+    scores = backtest(signals, close)
+
+    # Long from bar 0 to bar 3: +10%, +10%, 0%; flat for the crash
+    assert scores["total_return"][0] == pytest.approx(0.21)
+    assert scores["total_return"][1] == 0
+    assert scores["trades"].tolist() == [1.0, 0.0]
+    assert scores["exposure"][0] == pytest.approx(0.6)
+
+
+def test_sweep_ranks_combinations_in_serial_and_parallel():
+    rules = [{"indicator": "RSI", "period": 14, "condition": "<", "value": 30, "action": "Buy"},
+             {"indicator": "RSI", "period": 14, "condition": ">", "value": 70, "action": "Sell"}]
+    grid = {"0.value": [30, 40, 50], "1.value": [60, 70]}
+    histories = {f"T{i}": make_history(seed=i) for i in range(4)}
+
+    serial = PresetOptimizer(max_workers=1).sweep(rules, grid, histories)
+    parallel = PresetOptimizer(max_workers=2).sweep(rules, grid, histories)
+
+    assert len(serial) == 6
+    returns = [result["total_return"] for result in serial]
+    assert returns == sorted(returns, reverse=True)
+    assert [r["params"] for r in serial] == [r["params"] for r in parallel]
+    np.testing.assert_allclose(returns, [r["total_return"] for r in parallel])
@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+
+from stockbuddy.data.price_store import PriceStore
+
+
+def raw_bars(days=10, start="2025-01-01"):
+    index = pd.date_range(start, periods=days, freq="B", tz="America/New_York")
+    close = np.linspace(100, 109, days)
+    return pd.DataFrame({
+        "Open": close - 1, "High": close + 1, "Low": close - 2, "Close": close,
+        "Volume": np.full(days, 1000.0), "Dividends": np.zeros(days), "Stock Splits": np.zeros(days),
+    }, index=index)
+
+
+def as_downloaded(raw):
+    """Scales raw bars the way yfinance does for splits later in the download."""
+    data = raw.copy()
+    splits = data["Stock Splits"].replace(0, 1).to_numpy()
+    later = np.append(np.cumprod(splits[::-1])[::-1][1:], 1.0)
+    for column in ["Open", "High", "Low", "Close", "Dividends"]:
+        data[column] = data[column] / later
+    data["Volume"] = data["Volume"] * later
+    return data
+
+
+class FakeDataManager:
+    def __init__(self, raw):
+        self.raw = raw
+        self.requests = []
+
+    def get_raw_history(self, ticker, period="1y", start=None):
+        self.requests.append((period, start))
+        data = self.raw if start is None else self.raw[self.raw.index.strftime("%Y-%m-%d") >= start]
+        return as_downloaded(data)
+
+
+def test_store_undoes_split_scaling_of_the_download():
+    raw = raw_bars()
+    raw.loc[raw.index[5:], ["Open", "High", "Low", "Close"]] /= 2  # 2:1 split on day 5
+    raw.iloc[5, raw.columns.get_loc("Stock Splits")] = 2.0
+    store = PriceStore(":memory:")
+    store.store_history("AAPL", as_downloaded(raw))
+
+    np.testing.assert_allclose(store.raw_history("AAPL")["Close"], raw["Close"])
+    np.testing.assert_allclose(store.raw_history("AAPL")["Volume"], raw["Volume"])
+    assert store.actions("AAPL")["Stock Splits"].tolist() == [2.0]
+
+
+def test_adjusted_history_applies_cumulative_factors():
+    raw = raw_bars()
+    raw.loc[raw.index[5:], ["Open", "High", "Low", "Close"]] /= 2
+    raw.iloc[5, raw.columns.get_loc("Stock Splits")] = 2.0
+    raw.iloc[8, raw.columns.get_loc("Dividends")] = 1.0
+    store = PriceStore(":memory:")
+    store.store_history("AAPL", as_downloaded(raw))
+    adjusted = store.adjusted_history("AAPL")
+
+    dividend_factor = 1 - 1.0 / raw["Close"].iloc[7]
+    expected = raw["Close"].to_numpy().copy()
+    expected[:8] *= dividend_factor
+    expected[:5] /= 2
+    np.testing.assert_allclose(adjusted["Close"], expected)
+    np.testing.assert_allclose(adjusted["Volume"].iloc[:5], 2000.0)
+    np.testing.assert_allclose(adjusted["Volume"].iloc[5:], 1000.0)
+
+
+def test_sync_fetches_only_new_bars():
+    raw = raw_bars(days=30)
+    provider = FakeDataManager(raw.iloc[:20])
+    store = PriceStore(":memory:")
+
+    store.sync("AAPL", provider, period="1y")
+    provider.raw = raw
+    adjusted = store.sync("AAPL", provider, period="1y")
+
+    assert provider.requests == [("1y", None), ("1y", raw.index[19].strftime("%Y-%m-%d"))]
+    assert len(adjusted) == 30
+    np.testing.assert_allclose(adjusted["Close"], raw["Close"])
+
+
+def test_sync_returns_only_the_requested_period():
+    """Older bars stay in the store, but the history handed out does not keep growing."""
+    raw = raw_bars(days=60)
+    provider = FakeDataManager(raw.iloc[:40])
+    store = PriceStore(":memory:")
+    store.sync("AAPL", provider, period="1mo")
+    provider.raw = raw
+    recent = store.sync("AAPL", provider, period="1mo")
+
+    last = recent.index[-1]
+    assert last == raw.index[-1].tz_localize(None)
+    assert recent.index[0] > last - pd.DateOffset(months=1) >= recent.index[0] - pd.Timedelta(days=3)
+    assert len(store.adjusted_history("AAPL")) == 60
+    assert len(store.sync("AAPL", provider, period="max")) == 60
+
+
+def test_new_corporate_action_recomputes_factors_without_refetching():
+    raw = raw_bars(days=30)
+    provider = FakeDataManager(raw.iloc[:20])
+    store = PriceStore(":memory:")
+    before = store.sync("AAPL", provider).copy()
+
+    raw.iloc[25, raw.columns.get_loc("Dividends")] = 2.0
+    provider.raw = raw
+    after = store.sync("AAPL", provider)
+
+    assert len(provider.requests) == 2  # one incremental fetch, no full re-download
+    factor = 1 - 2.0 / raw["Close"].iloc[24]
+    np.testing.assert_allclose(after["Close"].iloc[:20], before["Close"] * factor)
+    np.testing.assert_allclose(after["Close"].iloc[25:], raw["Close"].iloc[25:])
+
+
+def test_appended_bars_extend_the_cached_adjusted_history():
+    raw = raw_bars(days=30)
+    raw.iloc[3, raw.columns.get_loc("Dividends")] = 1.0
+    store = PriceStore(":memory:")
+    store.store_history("AAPL", raw.iloc[:20])
+    store.adjusted_history("AAPL")
+    store.store_history("AAPL", raw.iloc[19:])
+
+    incremental = store.adjusted_history("AAPL")
+    store._cache.clear()
+    full = store.adjusted_history("AAPL")
+    pd.testing.assert_frame_equal(incremental, full)
+
+
+def test_duplicate_actions_do_not_invalidate_the_cache():
+    raw = raw_bars()
+    raw.iloc[3, raw.columns.get_loc("Dividends")] = 1.0
+    store = PriceStore(":memory:")
+    store.store_history("AAPL", raw)
+    adjusted = store.adjusted_history("AAPL")
+    store.add_action("AAPL", raw.index[3], dividend=1.0)
+    assert store.adjusted_history("AAPL") is adjusted
@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stockbuddy.core.risk_engine import RiskEngine, RollingCovariance, TRADING_DAYS
+
+
+def make_closes(columns, bars=120, seed=0):
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, bars)
+    returns = {column: (0.5 + i * 0.5) * market + rng.normal(0, 0.01, bars) for i, column in enumerate(columns)}
+    index = pd.bdate_range("2025-01-02", periods=bars)
+    return pd.DataFrame({column: 100 * np.cumprod(1 + r) for column, r in returns.items()}, index=index)
+
+
+def histories_from(closes):
+    return {column: pd.DataFrame({"Close": closes[column]}) for column in closes}
+
+
+def test_rolling_covariance_matches_window_recompute():
+    rng = np.random.default_rng(1)
+    bars = rng.normal(0, 1, (200, 6))
+    rolling = RollingCovariance(6, window=30, resync_interval=1000)
+    for i, bar in enumerate(bars):
+        rolling.update(bar)
+        if i >= 1:
+            window = bars[max(0, i - 29):i + 1]
+            np.testing.assert_allclose(rolling.covariance(), np.cov(window, rowvar=False), atol=1e-10)
+    np.testing.assert_allclose(rolling.correlation(), np.corrcoef(bars[-30:], rowvar=False), atol=1e-10)
+
+
+def test_resync_keeps_sums_exact():
+    rng = np.random.default_rng(2)
+    rolling = RollingCovariance(3, window=5, resync_interval=7)
+    bars = rng.normal(0, 1, (50, 3))
+    for bar in bars:
+        rolling.update(bar)
+    np.testing.assert_allclose(rolling.covariance(), np.cov(bars[-5:], rowvar=False), atol=1e-12)
+
+
+def test_covariance_needs_two_bars():
+    rolling = RollingCovariance(2, window=5)
+    rolling.update([0.01, 0.02])
+    assert np.isnan(rolling.covariance()).all()
+
+
+def test_engine_matches_pandas_on_loaded_window():
+    closes = make_closes(["^GSPC", "AAA", "BBB"])
+    engine = RiskEngine(["AAA", "BBB"], index_tickers=["^GSPC"], window=40)
+    engine.load(histories_from(closes))
+
+    returns = closes.pct_change().tail(40)
+    expected = returns.cov()
+    pd.testing.assert_frame_equal(engine.covariance_matrix().loc[expected.index, expected.columns], expected,
+                                  check_exact=False, atol=1e-12)
+    betas = engine.betas("^GSPC")
+    assert list(betas.index) == ["AAA", "BBB"]
+    assert betas["AAA"] == pytest.approx(expected.loc["AAA", "^GSPC"] / expected.loc["^GSPC", "^GSPC"])
+    assert engine.last_date == closes.index[-1]
+
+
+def test_incremental_updates_match_reload():
+    closes = make_closes(["^GSPC", "AAA", "BBB", "CCC"], bars=100)
+    engine = RiskEngine(["AAA", "BBB", "CCC"], index_tickers=["^GSPC"], window=30)
+    engine.load(histories_from(closes.iloc[:80]))
+    engine.update_from_histories(histories_from(closes.iloc[:90]))
+    for date, row in closes.iloc[90:].iterrows():
+        engine.update_bar(row.to_dict(), date=date)
+
+    reloaded = RiskEngine(["AAA", "BBB", "CCC"], index_tickers=["^GSPC"], window=30)
+    reloaded.load(histories_from(closes))
+    np.testing.assert_allclose(engine.covariance_matrix().to_numpy(), reloaded.covariance_matrix().to_numpy(), atol=1e-12)
+    assert engine.last_date == closes.index[-1]
+
+    # Histories with no new bars leave the window untouched
+    before = engine.covariance_matrix()
+    engine.update_from_histories(histories_from(closes))
+    pd.testing.assert_frame_equal(engine.covariance_matrix(), before)
+
+
+def test_portfolio_volatility():
+    closes = make_closes(["^GSPC", "AAA", "BBB"])
+    engine = RiskEngine(["AAA", "BBB"], index_tickers=["^GSPC"], window=60)
+    engine.load(histories_from(closes))
+
+    returns = closes.pct_change().tail(60)
+    portfolio = 0.25 * returns["AAA"] + 0.75 * returns["BBB"]
+    expected = portfolio.std() * np.sqrt(TRADING_DAYS)
+    assert engine.portfolio_volatility({"AAA": 1000, "BBB": 3000}) == pytest.approx(expected)
+    assert engine.portfolio_volatility({"AAA": 1.0}) == pytest.approx(engine.volatilities()["AAA"])
+    assert engine.portfolio_volatility({}) == 0.0
+    with pytest.raises(KeyError):
+        engine.portfolio_volatility({"ZZZ": 1.0})
+
+
+def test_revise_last_matches_window_recompute():
+    rng = np.random.default_rng(3)
+    bars = rng.normal(0, 1, (40, 4))
+    rolling = RollingCovariance(4, window=10, resync_interval=1000)
+    for bar in bars:
+        rolling.update(bar)
+    revised = rng.normal(0, 1, 4)
+    rolling.revise_last(revised)
+    expected = np.vstack([bars[-10:-1], revised])
+    np.testing.assert_allclose(rolling.covariance(), np.cov(expected, rowvar=False), atol=1e-12)
+
+
+def test_revised_last_bar_replaces_partial_value():
+    closes = make_closes(["^GSPC", "AAA", "BBB"], bars=100)
+    engine = RiskEngine(["AAA", "BBB"], index_tickers=["^GSPC"], window=30)
+    engine.load(histories_from(closes.iloc[:79]))
+
+    # An intraday snapshot of the 80th bar, then its final close
+    partial = closes.iloc[:80].copy()
+    partial.iloc[-1] = closes.iloc[78] * [1.02, 0.97, 1.01]
+    engine.update_from_histories(histories_from(partial))
+    engine.update_from_histories(histories_from(closes.iloc[:80]))
+    assert engine.last_date == closes.index[79]
+
+    reloaded = RiskEngine(["AAA", "BBB"], index_tickers=["^GSPC"], window=30)
+    reloaded.load(histories_from(closes.iloc[:80]))
+    np.testing.assert_allclose(engine.covariance_matrix().to_numpy(), reloaded.covariance_matrix().to_numpy(), atol=1e-12)
+
+    # The next bar's return is taken from the final close, not the partial one
+    engine.update_bar(closes.iloc[80].to_dict(), date=closes.index[80])
+    engine.update_bar(closes.iloc[80].to_dict(), date=closes.index[80])  # unchanged revision
+    reloaded.load(histories_from(closes.iloc[:81]))
+    np.testing.assert_allclose(engine.covariance_matrix().to_numpy(), reloaded.covariance_matrix().to_numpy(), atol=1e-12)
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stockbuddy.core.screener import Screener
+
+
+def brute_force(records, filters, sort_by, descending, limit):
+    ops = {"<": np.less, "<=": np.less_equal, ">": np.greater, ">=": np.greater_equal, "==": np.equal}
+    matching = [r for r in records.values()
+                if r[sort_by] is not None
+                and all(r[f] is not None and ops[op](r[f], v) for f, op, v in filters)]
+    matching.sort(key=lambda r: r[sort_by], reverse=descending)
+    return [r["ticker"] for r in matching[:limit]]
+
+
+def make_screener(count=500, seed=0):
+    rng = np.random.default_rng(seed)
+    screener = Screener(capacity=4)
+    records = {}
+    for i in range(count):
+        record = {
+            "price": float(rng.uniform(1, 500)),
+            "percent_change": float(np.round(rng.normal(0, 3), 1)),
+            "volume": float(rng.integers(1000, 10_000_000)),
+            "rsi": float(rng.uniform(0, 100)) if i % 10 else None,
+        }
+        screener.update(f"T{i}", record)
+        records[f"T{i}"] = dict(record, ticker=f"T{i}")
+    return screener, records
+
+
+@pytest.mark.parametrize("filters, sort_by, descending, limit", [
+    ([], "percent_change", True, 50),
+    ([("rsi", "<", 30)], "percent_change", True, 50),
+    ([("rsi", "<", 30), ("price", ">=", 100)], "volume", False, 10),
+    ([("percent_change", "==", 0.0)], "price", True, 5),
+    ([("volume", ">", 100)], "rsi", True, 1000),
+])
+def test_query_matches_brute_force(filters, sort_by, descending, limit):
+    screener, records = make_screener()
+    result = [r["ticker"] for r in screener.query(filters, sort_by, descending, limit)]
+    expected = brute_force(records, filters, sort_by, descending, limit)
+    # Ties may come back in any order, so compare the sort values
+    assert [records[t][sort_by] for t in result] == [records[t][sort_by] for t in expected]
+    assert len(set(result)) == len(result)
+
+
+def test_incremental_updates_and_removals_keep_indexes_consistent():
+    screener, records = make_screener(count=200)
+    rng = np.random.default_rng(1)
+    for i in range(300):
+        ticker = f"T{rng.integers(0, 200)}"
+        if ticker not in records:
+            continue
+        if i % 7 == 0:
+            screener.remove(ticker)
+            del records[ticker]
+        else:
+            value = float(rng.uniform(0, 100))
+            screener.update(ticker, {"rsi": value})
+            records[ticker]["rsi"] = value
+
+    assert len(screener) == len(records)
+    result = screener.query([("rsi", ">", 50)], "rsi", True, 1000)
+    expected = brute_force(records, [("rsi", ">", 50)], "rsi", True, 1000)
+    assert [r["ticker"] for r in result] == expected
+    for ticker, record in records.items():
+        assert screener.get(ticker) == pytest.approx(dict(record, change=None, sma_50=None, sma_200=None))
+
+
+def test_update_from_history_computes_metrics():
+    close = pd.Series(np.linspace(100, 120, 250))
+    history = pd.DataFrame({'Close': close, 'Volume': np.full(250, 500)})
+    screener = Screener()
+    screener.update_from_history("AAPL", history)
+
+    record = screener.get("AAPL")
+    assert record["price"] == pytest.approx(120)
+    assert record["sma_200"] == pytest.approx(close.iloc[-200:].mean())
+    assert record["rsi"] == pytest.approx(100)
+
+
+def test_query_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        Screener().query([("pe_ratio", "<", 10)])
@@ -0,0 +1,149 @@
+import http.client
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from stockbuddy.data.quotes import summarize_quote
+from stockbuddy.service.http_api import SignalAPI, make_server
+from stockbuddy.service.signal_service import SignalService
+from tests.fakes import FakeDataManager, FakePresetManager
+
+
+def make_service(tickers=("AAPL", "MSFT"), **kwargs):
+    return SignalService(FakeDataManager(**kwargs), FakePresetManager(), list(tickers))
+
+
+def test_refresh_fetches_each_ticker_once_and_evaluates_every_preset():
+    """A refresh calls the provider once per ticker and fills quotes and signals."""
+    service = make_service()
+    snapshot = service.refresh()
+
+    assert service.data_manager.calls == 2
+    assert snapshot.version == 1
+    assert snapshot.quotes["AAPL"]["price"] == 110.0
+    assert snapshot.signals["Sell High"] == {"AAPL": "Sell", "MSFT": "Sell"}
+    assert snapshot.signals["Empty"] == {"AAPL": "Hold", "MSFT": "Hold"}
+
+
+def test_refresh_marks_unavailable_tickers():
+    """Tickers the provider cannot serve get no quote and an N/A signal."""
+    service = make_service(tickers=("AAPL", "BAD"), fail={"BAD"})
+    snapshot = service.refresh()
+
+    assert snapshot.quotes["BAD"] is None
+    assert snapshot.signals["Empty"]["BAD"] == "N/A"
+
+
+def test_summarize_quote_rejects_missing_last_close():
+    """A NaN close is never published; a gap before the last bar is skipped."""
+    history = FakeDataManager().get_historical_data("AAPL")
+    history.iloc[-1, history.columns.get_loc("Close")] = np.nan
+    with pytest.raises(ValueError):
+        summarize_quote(history)
+
+    history = FakeDataManager().get_historical_data("AAPL")
+    history.iloc[-2, history.columns.get_loc("Close")] = np.nan
+    quote = summarize_quote(history)
+    assert quote["change"] == pytest.approx(110 - history["Close"].iloc[-3])
+
+
+def test_set_tickers_normalizes_and_deduplicates():
+    service = make_service(tickers=(" aapl", "AAPL", "msft "))
+    assert service.get_tickers() == ["AAPL", "MSFT"]
+
+
+def test_api_caches_responses_per_snapshot_version():
+    """The same encoded body is reused until a new snapshot is published."""
+    service = make_service()
+    service.refresh()
+    api = SignalAPI(service)
+
+    first = api.render("/quotes")
+    assert api.render("/quotes")[1] is first[1]
+
+    service.refresh()
+    second = api.render("/quotes")
+    assert second[1] is not first[1]
+    assert json.loads(second[1])["version"] == 2
+
+
+def test_api_returns_404_for_unknown_preset():
+    service = make_service()
+    service.refresh()
+    status, body, _ = SignalAPI(service).render("/signals/Nope")
+    assert status == 404
+
+
+def test_http_server_supports_conditional_requests():
+    """A matching If-None-Match header yields 304 Not Modified."""
+    service = make_service()
+    service.refresh()
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection(*server.server_address[:2])
+        connection.request("GET", "/history/aapl?limit=5")
+        response = connection.getresponse()
+        payload = json.loads(response.read())
+        etag = response.getheader("ETag")
+        assert response.status == 200
+        assert len(payload["history"]) == 5
+
+        connection.request("GET", "/history/aapl?limit=5", headers={"If-None-Match": etag})
+        response = connection.getresponse()
+        response.read()
+        assert response.status == 304
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_server_returns_304_across_refresh_with_unchanged_data():
+    """A refresh that leaves the data unchanged keeps the ETag, even though the version moves on."""
+    service = make_service()
+    service.refresh()
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection(*server.server_address[:2])
+        connection.request("GET", "/signals")
+        response = connection.getresponse()
+        response.read()
+        etag = response.getheader("ETag")
+
+        service.refresh()
+        connection.request("GET", "/signals", headers={"If-None-Match": etag})
+        response = connection.getresponse()
+        response.read()
+        assert response.status == 304
+        assert response.getheader("ETag") == etag
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_api_cache_is_keyed_on_route_and_skips_errors():
+    service = make_service()
+    service.refresh()
+    api = SignalAPI(service)
+
+    first = api.render("/history/aapl?limit=5")
+    assert api.render("/history/AAPL/?limit=05&_=123") is first
+    assert api.render("/history/AAPL?limit=6") is not first
+
+    assert api.render("/nope")[0] == 404
+    assert api.render("/history/AAPL?limit=x")[0] == 400
+    assert api.render("/history/AAPL?limit=-3")[0] == 400
+    assert len(api._cache) == 2
+
+    # Limits covering the whole 30-bar history share the unlimited response
+    full = api.render("/history/AAPL")
+    for limit in (30, 31, 2029):
+        assert api.render(f"/history/AAPL?limit={limit}") is full
+    assert len(api._cache) == 3
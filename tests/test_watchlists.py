@@ -0,0 +1,81 @@
+from stockbuddy.core.watchlist_manager import WatchlistManager
+from stockbuddy.data.subscriptions import SubscriptionManager
+from stockbuddy.service.signal_service import SignalService
+from tests.fakes import FakeDataManager, FakePresetManager
+
+
+def test_refcounts_shared_tickers():
+    subscriptions = SubscriptionManager()
+    assert subscriptions.subscribe("Tech", ["AAPL", "MSFT"]) == ["AAPL", "MSFT"]
+    assert subscriptions.subscribe("Holdings", ["AAPL", "XOM", "AAPL"]) == ["XOM"]
+    assert subscriptions.refcount("AAPL") == 2
+    assert subscriptions.tickers() == ["AAPL", "MSFT", "XOM"]
+
+    assert subscriptions.unsubscribe("Tech", ["AAPL"]) == []
+    assert subscriptions.unsubscribe("Tech", ["AAPL"]) == []  # not held any more; no double release
+    assert subscriptions.refcount("AAPL") == 1
+    assert subscriptions.release("Holdings") == ["AAPL", "XOM"]
+    assert subscriptions.tickers() == ["MSFT"]
+    assert subscriptions.owners() == ["Tech"]
+
+
+def test_set_subscriptions_reports_changes_to_listeners():
+    subscriptions = SubscriptionManager()
+    changes = []
+    subscriptions.add_listener(lambda added, removed: changes.append((added, removed)))
+    subscriptions.subscribe("A", ["AAPL", "MSFT"])
+    subscriptions.subscribe("B", ["MSFT"])
+
+    assert subscriptions.set_subscriptions("A", ["TSLA", "MSFT"]) == (["TSLA"], ["AAPL"])
+    assert subscriptions.set_subscriptions("A", ["TSLA", "MSFT"]) == ([], [])
+    assert changes == [(["AAPL", "MSFT"], []), (["TSLA"], ["AAPL"])]
+
+
+def test_service_fetches_overlapping_lists_once_per_cycle():
+    subscriptions = SubscriptionManager()
+    provider = FakeDataManager()
+    service = SignalService(provider, FakePresetManager(), subscriptions=subscriptions, presets=["Sell High"])
+    lists = {f"List {i}": ["AAPL", "MSFT", "NVDA", f"T{i}"] for i in range(10)}
+    for name, tickers in lists.items():
+        subscriptions.subscribe(name, tickers)
+
+    snapshot = service.refresh()
+    assert provider.calls == 13
+    assert list(snapshot.signals) == ["Sell High"]
+    assert set(snapshot.signals["Sell High"]) == set(subscriptions.tickers())
+
+    # Closing lists drops only the tickers no open list needs, and their cached history
+    for i in range(5):
+        subscriptions.release(f"List {i}")
+    assert service.get_tickers() == ["AAPL", "MSFT", "NVDA", "T5", "T6", "T7", "T8", "T9"]
+    assert "T0" not in service.cache.tickers()
+    service.refresh()
+    assert provider.calls == 21
+
+
+def test_stale_only_refresh_fetches_new_tickers():
+    subscriptions = SubscriptionManager()
+    provider = FakeDataManager()
+    service = SignalService(provider, FakePresetManager(), subscriptions=subscriptions)
+    subscriptions.subscribe("A", ["AAPL", "MSFT"])
+    service.refresh()
+    subscriptions.subscribe("B", ["MSFT", "TSLA"])
+    snapshot = service.refresh(stale_only=True)
+    assert provider.calls == 3
+    assert set(snapshot.quotes) == {"AAPL", "MSFT", "TSLA"}
+
+
+def test_watchlist_manager_persists(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    manager = WatchlistManager()
+    assert manager.get_names() == ["My Watchlist"]
+    manager.create_watchlist("Tech", ["aapl", " msft", "AAPL"])
+    assert manager.add_ticker("Tech", "nvda")
+    assert not manager.add_ticker("Tech", "NVDA")
+    manager.remove_ticker("Tech", "MSFT")
+    manager.set_tickers("My Watchlist", ["xom"])
+
+    reloaded = WatchlistManager()
+    assert reloaded.get_all_watchlists() == {"My Watchlist": ["XOM"], "Tech": ["AAPL", "NVDA"]}
+    reloaded.delete_watchlist("Tech")
+    assert WatchlistManager().get_watchlist("Tech") is None